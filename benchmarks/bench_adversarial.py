@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Adversarial Input Stress Benchmark
+역추적이 폭발하는 입력 ('[['만 수만 개, 닫히지 않은 '[...](' 등)에서
+이전 정규식과 현재 스캐너의 결과/시간 비교 + 노트별 시간 예산 / 분석 크기 상한 동작 확인
+현재 구현이 MAX_SCAN_MS 안에 끝나지 않거나 결과가 다르면 종료 코드 1
+
+사용법:
+    python benchmarks/bench_adversarial.py
+    python benchmarks/bench_adversarial.py --sizes 2000 8000 32000 128000 --old-max 8000
+"""
+
+import re
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from note_parser import find_wikilinks, _link_contexts, _count_md_links, parse_note
+from rsi_log import (extract_block, extract_plain_status,
+                     EXEC_STATUS_RE, EXEC_SECTION_RE)
+
+DEFAULT_SIZES = [2000, 8000, 32000, 128000]
+DEFAULT_OLD_MAX = 8000   # 이전 정규식은 이 크기까지만 (32000자에서 이미 수 초)
+MAX_SCAN_MS = 100.0      # 현재 구현 허용 시간 (가장 큰 입력 기준)
+
+# 이전 구현 (note_parser / generate_weekly_summary에서 교체된 패턴, 현재는 rsi_log)
+OLD_WIKILINK_RE = re.compile(r'\[\[(.*?)\]\]')
+OLD_LINK_CONTEXT_RE = re.compile(r'(.{20})\[\[.*?\]\](.{20})')
+OLD_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+OLD_EXEC_STATUS_RE = re.compile(r'\*\*실행\s*여부:\*\*\s*\n?(.*?)(?:\n\*\*|\Z)',
+                                re.DOTALL | re.MULTILINE)
+OLD_EXEC_PLAIN_RE = re.compile(r'실행\s*여부:\s*(.+?)(?:\n[^\n]*:|메모:|\Z)',
+                               re.DOTALL | re.MULTILINE)
+OLD_EXEC_SECTION_RE = re.compile(r'\*\*실행:\*\*\s*\n(.*?)(?:\n\*\*|\Z)',
+                                 re.DOTALL | re.MULTILINE)
+
+
+def _group(m):
+    return m.group(1) if m else None
+
+
+# name -> (입력 생성, 이전 구현, 현재 구현)
+CASES: Dict[str, Tuple[Callable[[int], str], Callable, Callable]] = {
+    'wikilink_open_flood': (
+        lambda n: '[[' * (n // 2),
+        OLD_WIKILINK_RE.findall, find_wikilinks),
+    'wikilink_unclosed_tail': (
+        lambda n: '[[a]] ' + '[[x' * (n // 3),
+        OLD_WIKILINK_RE.findall, find_wikilinks),
+    'link_context_flood': (
+        lambda n: 'a' * 20 + '[[' * (n // 2),
+        lambda s: [m.groups() for m in OLD_LINK_CONTEXT_RE.finditer(s)], _link_contexts),
+    'md_link_bracket_flood': (
+        lambda n: '[' * n + '](x',
+        lambda s: len(OLD_MD_LINK_RE.findall(s)), _count_md_links),
+    'md_link_unclosed_paren': (
+        lambda n: '[a](' * (n // 4),
+        lambda s: len(OLD_MD_LINK_RE.findall(s)), _count_md_links),
+    'exec_status_no_terminator': (
+        lambda n: '**실행 여부:**\n' + '- ✅ 완료 #1\n' * (n // 10),
+        lambda s: _group(OLD_EXEC_STATUS_RE.search(s)),
+        lambda s: extract_block(s, EXEC_STATUS_RE)),
+    'exec_plain_long_lines': (
+        lambda n: '실행 여부: ' + ('가' * 200 + '\n') * (n // 200),
+        lambda s: _group(OLD_EXEC_PLAIN_RE.search(s)), extract_plain_status),
+    'exec_section_whitespace': (
+        lambda n: '**실행:**' + ' \n' * (n // 2),
+        lambda s: _group(OLD_EXEC_SECTION_RE.search(s)),
+        lambda s: extract_block(s, EXEC_SECTION_RE)),
+}
+
+
+def timed(fn: Callable, arg) -> Tuple[float, object]:
+    started = time.perf_counter()
+    result = fn(arg)
+    return (time.perf_counter() - started) * 1000, result
+
+
+def run_cases(sizes: List[int], old_max: int) -> List[str]:
+    problems = []
+    print(f"{'case':<28} {'chars':>8} {'old (ms)':>10} {'new (ms)':>10}")
+    for name, (make, old, new) in CASES.items():
+        for n in sizes:
+            text = make(n)
+            new_ms, new_result = timed(new, text)
+            old_col = '-'
+            if n <= old_max:
+                old_ms, old_result = timed(old, text)
+                old_col = f"{old_ms:.1f}"
+                if old_result != new_result:
+                    problems.append(f"{name} ({n}): 결과가 이전 정규식과 다름")
+            print(f"{name:<28} {len(text):>8} {old_col:>10} {new_ms:>10.2f}")
+            if new_ms > MAX_SCAN_MS:
+                problems.append(f"{name} ({n}): {new_ms:.1f} ms > {MAX_SCAN_MS:.0f} ms")
+    return problems
+
+
+def run_parse(size: int) -> List[str]:
+    """악성 줄이 섞인 노트 전체 파싱"""
+    lines = ['# 노트', '', '## 핵심 내용', '', '[[' * (size // 2), '[' * size + '](x',
+             '[a](' * (size // 4), 'a' * 20 + '[[' * (size // 2)]
+    text = '\n'.join(lines)
+    ms, _ = timed(parse_note, text)
+    print(f"\nparse_note ({len(text)} chars): {ms:.1f} ms")
+    if ms > MAX_SCAN_MS * 4:
+        return [f"parse_note ({len(text)} chars): {ms:.1f} ms"]
+    return []
+
+
+def run_budget() -> List[str]:
+    """시간 예산을 넘긴 노트 → P3 '분석 시간 초과' 한 건만 남고 나머지 규칙은 생략"""
+    from enhanced_quality_checker import QualityChecker
+    from quality_rules import TIMEOUT_CATEGORY
+
+    with tempfile.TemporaryDirectory() as tmp:
+        note = Path(tmp) / "runaway.md"
+        note.write_text('## 핵심 내용\n\n' + '여러 문장. ' * 50000, encoding='utf-8')
+
+        checker = QualityChecker(tmp, time_budget=1e-6)
+        started = time.perf_counter()
+        score, issues = checker.check_note(note)
+        ms = (time.perf_counter() - started) * 1000
+
+        unlimited = QualityChecker(tmp, time_budget=None)
+        _, full_issues = unlimited.check_note(note)
+
+    print(f"\ntime budget: {len(issues)} issue(s), score {score}, {ms:.1f} ms "
+          f"(제한 없음: 이슈 {len(full_issues)}개)")
+    for issue in issues:
+        print(f"  [{issue['priority']}] {issue['issue']}")
+
+    if [(i['priority'], i['category']) for i in issues] != [('P3', TIMEOUT_CATEGORY)]:
+        return ["time budget: P3 '분석 시간 초과' 이슈가 생성되지 않음"]
+    if any(i['category'] == TIMEOUT_CATEGORY for i in full_issues):
+        return ["time budget: 제한 없음인데 시간 초과 이슈 생성"]
+    return []
+
+
+def run_size_cap(megabytes: int = 24) -> List[str]:
+    """분석 상한을 넘는 거대 노트 → 앞부분만 읽고 P2 '파일 크기' 이슈"""
+    from enhanced_quality_checker import QualityChecker
+    from note_reader import MAX_ANALYSIS_BYTES
+
+    line = '2026-01-08 12:00:00 INFO pasted log line [[링크]] 여러 값\n'.encode('utf-8')
+    with tempfile.TemporaryDirectory() as tmp:
+        note = Path(tmp) / "pasted_log.md"
+        with open(note, 'wb') as f:
+            f.write('## 핵심 내용\n\n'.encode('utf-8'))
+            f.write(line * (megabytes * (1 << 20) // len(line)))
+
+        checker = QualityChecker(tmp, time_budget=None)
+        started = time.perf_counter()
+        _, issues = checker.check_note(note)
+        ms = (time.perf_counter() - started) * 1000
+
+    capped = [i for i in issues if i['category'] == '파일 크기']
+    print(f"\nsize cap ({megabytes}MB note, 상한 {MAX_ANALYSIS_BYTES >> 20}MB): {ms:.1f} ms")
+    for issue in capped:
+        print(f"  [{issue['priority']}] {issue['issue']}")
+    if not capped:
+        return ["size cap: '파일 크기' 이슈가 생성되지 않음"]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adversarial input stress benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--old-max', type=int, default=DEFAULT_OLD_MAX,
+                        help="이전 정규식을 돌릴 최대 입력 크기 (기본 8000)")
+    args = parser.parse_args()
+
+    print("="*60)
+    print("🧨 Adversarial Input Stress Benchmark")
+    print("="*60)
+
+    problems = run_cases(args.sizes, args.old_max)
+    problems += run_parse(max(args.sizes))
+    problems += run_budget()
+    problems += run_size_cap()
+
+    print("\n" + "="*60)
+    if problems:
+        print("❌ Stress check failed")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("✅ All scanners linear, results match the old patterns")
+
+
+if __name__ == "__main__":
+    main()
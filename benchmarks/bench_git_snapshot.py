@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Git Change Detection Benchmark
+합성 vault (노트 N개 + 플러그인 node_modules)를 git 저장소로 만든 뒤 노트 몇 개를 고치고
+git status + git add . (이전 방식) / 스냅샷 scan + update-index (현재 방식)의 시간 비교
+두 방식이 스테이징한 결과가 다르면 종료 코드 1
+
+사용법:
+    python benchmarks/bench_git_snapshot.py
+    python benchmarks/bench_git_snapshot.py --notes 20000 --modules 50000 --edits 10
+    python benchmarks/bench_git_snapshot.py --backend pygit2    # 스테이징/커밋 백엔드
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import List
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from git_backend import BACKENDS, open_backend
+from github_auto_commit import run_git_command, check_git_status, git_add_all, \
+    git_stage_paths, git_commit, detect_changes, set_git_backend
+from git_snapshot import GitSnapshot
+
+VAULT_DIR = Path(tempfile.gettempdir()) / "rsi_benchmark_git_vault"
+PARA_DIRS = ['1_Projects', '2_Areas', '3_Resources', '4_Archive']
+
+
+def git(vault: Path, *args: str) -> str:
+    return subprocess.run(['git', *args], cwd=vault, capture_output=True, text=True,
+                          encoding='utf-8', check=True).stdout
+
+
+def build_vault(vault: Path, notes: int, modules: int):
+    """노트 + node_modules (git add .와 비교할 수 있게 .gitignore에도 등록) → 첫 커밋"""
+    shutil.rmtree(vault, ignore_errors=True)
+    for d in PARA_DIRS:
+        (vault / d).mkdir(parents=True)
+    for i in range(notes):
+        (vault / PARA_DIRS[i % 4] / f"노트 {i:05d}.md").write_text(
+            f"# 노트 {i}\n\n[[노트 {i + 1:05d}]]\n", encoding='utf-8')
+    plugin = vault / '.obsidian' / 'plugins' / 'dataview'
+    (plugin / 'node_modules').mkdir(parents=True)
+    (plugin / 'main.js').write_text('// plugin\n', encoding='utf-8')
+    for i in range(modules):
+        pkg = plugin / 'node_modules' / f"pkg{i // 100}"
+        pkg.mkdir(exist_ok=True)
+        (pkg / f"f{i}.js").write_text('module.exports = 1;\n', encoding='utf-8')
+    (vault / '.gitignore').write_text('.rsi_cache/\n.obsidian/plugins/*/node_modules/\n',
+                                      encoding='utf-8')
+    # 실제 vault처럼 오래된 파일 (인덱스와 같은 초에 만든 파일은 git/libgit2가 내용을 다시 읽음)
+    old = time.time() - 86400
+    for path in vault.rglob('*'):
+        os.utime(path, (old, old))
+    git(vault, 'init', '-q')
+    git(vault, 'config', 'user.email', 'bench@example.com')
+    git(vault, 'config', 'user.name', 'bench')
+    git(vault, 'add', '.')
+    git(vault, 'commit', '-qm', 'init')
+
+
+def edit(vault: Path, edits: int, round_no: int):
+    """노트 수정 + 새 노트 + 삭제 하나씩"""
+    for i in range(edits):
+        note = vault / PARA_DIRS[i % 4] / f"노트 {i:05d}.md"
+        note.write_text(note.read_text(encoding='utf-8') + f"- 수정 {round_no}\n", encoding='utf-8')
+    (vault / '1_Projects' / f"새 노트 {round_no}.md").write_text('새\n', encoding='utf-8')
+    (vault / PARA_DIRS[round_no % 4] / f"노트 {edits + round_no:05d}.md").unlink(missing_ok=True)
+
+
+def staged(vault: Path) -> List[str]:
+    return sorted(git(vault, 'diff', '--cached', '--name-status', '-z').split('\0'))
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Git change detection benchmark")
+    parser.add_argument('--notes', type=int, default=5000)
+    parser.add_argument('--modules', type=int, default=20000,
+                        help="node_modules 파일 수 (기본 20000)")
+    parser.add_argument('--edits', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--backend', default='cli', choices=['auto', *BACKENDS],
+                        help="스냅샷 방식의 스테이징/커밋 백엔드 (기본 cli)")
+    args = parser.parse_args()
+
+    print("="*60)
+    print("⏱️  Git Change Detection Benchmark")
+    print("="*60)
+    build_vault(VAULT_DIR, args.notes, args.modules)
+
+    snapshot = GitSnapshot(VAULT_DIR)
+    rebuild_ms, _ = timed(lambda: snapshot.rebuild(run_git_command))
+    snapshot.save()
+    print(f"\n📦 {args.notes} notes + {args.modules} node_modules files")
+    print(f"  snapshot rebuild (첫 실행): {rebuild_ms:.1f} ms")
+
+    backend = open_backend(VAULT_DIR, args.backend)
+    print(f"  backend: {backend.name}")
+
+    problems = []
+    print(f"\n{'round':<6} {'status+add . (ms)':>18} {'snapshot (ms)':>14} "
+          f"{'commit (ms)':>12} {'paths':>6}")
+    for round_no in range(1, args.rounds + 1):
+        edit(VAULT_DIR, args.edits, round_no)
+
+        old_ms, _ = timed(lambda: (check_git_status(VAULT_DIR), git_add_all(VAULT_DIR)))
+        expected = staged(VAULT_DIR)
+        git(VAULT_DIR, 'reset', '-q')
+
+        def snapshot_cycle():
+            current = GitSnapshot(VAULT_DIR)
+            changes, _ = detect_changes(VAULT_DIR, current)
+            git_stage_paths(VAULT_DIR, changes.paths())
+            return current, changes
+
+        set_git_backend(backend)
+        new_ms, (current, changes) = timed(snapshot_cycle)
+        if staged(VAULT_DIR) != expected:
+            problems.append(f"round {round_no}: 스테이징 결과가 git add .와 다름")
+        commit_ms, _ = timed(lambda: git_commit(VAULT_DIR, f"round {round_no}"))
+        set_git_backend(None)
+        current.commit()
+        current.save()
+        print(f"{round_no:<6} {old_ms:>18.1f} {new_ms:>14.1f} {commit_ms:>12.1f} {len(changes):>6}")
+
+    print("\n" + "="*60)
+    if problems:
+        print("❌ Snapshot check failed")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("✅ Snapshot stages the same paths as git add .")
+
+
+if __name__ == "__main__":
+    main()
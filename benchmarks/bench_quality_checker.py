@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Quality Checker Benchmark
+합성 vault (1k/10k/100k 노트)에서 check_vault / generate_report 측정 → baseline.json과 비교
+files/sec가 떨어지거나 peak RSS / 규칙별 시간이 허용치 이상 늘면 종료 코드 1
+
+사용법:
+    python benchmarks/bench_quality_checker.py                      # 1k, 10k
+    python benchmarks/bench_quality_checker.py --sizes 1000 10000 100000
+    python benchmarks/bench_quality_checker.py --update-baseline    # 현재 결과를 기준으로 저장
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+# 합성 vault는 실제 vault 밖에 생성 (vault 안에 두면 체커의 glob에 섞임)
+VAULTS_DIR = Path(tempfile.gettempdir()) / "rsi_benchmark_vaults"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+
+sys.path.insert(0, str(REPO_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_TOLERANCE = 0.25     # 25% 이상 나빠지면 회귀
+RULE_NOISE_FLOOR_MS = 20.0   # 이보다 작은 규칙별 차이는 무시 (측정 잡음)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB) - 측정 불가하면 None"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 bytes
+        return peak / 1024 / (1024 if sys.platform == 'darwin' else 1)
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / 1024 / 1024
+    except ImportError:
+        return None
+
+
+def _time_rules(checker, md_files: List[Path]) -> Dict[str, float]:
+    """규칙별 누적 시간 (초) - 파싱 1회 후 규칙을 하나씩 실행"""
+    from note_parser import parse_note
+
+    rule_sec: Dict[str, float] = {'parse': 0.0}
+    for r in checker.engine.rules:
+        rule_sec[r.name] = 0.0
+    for file_path in md_files:
+        content = file_path.read_text(encoding='utf-8')
+        t = time.perf_counter()
+        note = parse_note(content)
+        rule_sec['parse'] += time.perf_counter() - t
+        for r in checker.engine.rules:
+            if r.applies(file_path.name):
+                t = time.perf_counter()
+                r.check(note, file_path, r.params)
+                rule_sec[r.name] += time.perf_counter() - t
+    return rule_sec
+
+
+def run_single(size: int, seed: int, repeat: int) -> Dict:
+    """
+    vault 크기 하나 측정 (자식 프로세스에서 실행 → peak RSS가 섞이지 않음)
+    시간은 repeat번 중 최솟값 (측정 잡음 제거)
+    """
+    from synthetic_vault import VaultSpec, generate_vault
+    from enhanced_quality_checker import QualityChecker
+
+    vault = VAULTS_DIR / f"n{size}_s{seed}"
+    md_files = generate_vault(vault, VaultSpec(notes=size, seed=seed))
+
+    checker = QualityChecker(vault)
+
+    check_sec = report_sec = float('inf')
+    rule_sec: Dict[str, float] = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        store = checker.check_vault(md_files)
+        check_sec = min(check_sec, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        report = checker.generate_report(store, md_files)
+        report_sec = min(report_sec, time.perf_counter() - started)
+
+        for name, sec in _time_rules(checker, md_files).items():
+            rule_sec[name] = min(rule_sec.get(name, sec), sec)
+
+    return {
+        'files': len(md_files),
+        'issues': len(store),
+        'files_per_sec': round(len(md_files) / check_sec, 1),
+        'check_sec': round(check_sec, 3),
+        'report_sec': round(report_sec, 3),
+        'report_bytes': len(report.encode('utf-8')),
+        'peak_rss_mb': round(peak_rss_mb() or 0.0, 1) or None,
+        'rule_ms': {name: round(sec * 1000, 1) for name, sec in rule_sec.items()},
+    }
+
+
+def measure(size: int, seed: int, repeat: int) -> Dict:
+    """자식 프로세스로 run_single 실행 → 마지막 줄의 JSON 결과"""
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), '--run', str(size),
+         '--seed', str(seed), '--repeat', str(repeat)],
+        capture_output=True, text=True, encoding='utf-8', cwd=str(REPO_DIR))
+    if proc.returncode != 0:
+        print(proc.stdout)
+        print(proc.stderr, file=sys.stderr)
+        raise RuntimeError(f"benchmark for {size} notes failed")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(size: str, result: Dict, base: Dict, tolerance: float) -> List[str]:
+    """baseline 대비 회귀 목록"""
+    problems = []
+
+    if result['files_per_sec'] < base['files_per_sec'] * (1 - tolerance):
+        problems.append(f"files/sec {base['files_per_sec']} → {result['files_per_sec']}")
+
+    if result.get('peak_rss_mb') and base.get('peak_rss_mb'):
+        if result['peak_rss_mb'] > base['peak_rss_mb'] * (1 + tolerance):
+            problems.append(f"peak RSS {base['peak_rss_mb']} MB → {result['peak_rss_mb']} MB")
+
+    for name, ms in result['rule_ms'].items():
+        base_ms = base.get('rule_ms', {}).get(name)
+        if base_ms is None:
+            continue
+        if ms > base_ms * (1 + tolerance) and ms - base_ms > RULE_NOISE_FLOOR_MS:
+            problems.append(f"rule '{name}' {base_ms} ms → {ms} ms")
+
+    return [f"[{size}] {p}" for p in problems]
+
+
+def print_result(size: int, result: Dict):
+    rss = f"{result['peak_rss_mb']} MB" if result.get('peak_rss_mb') else "n/a"
+    print(f"\n📦 {size} notes")
+    print(f"  files/sec: {result['files_per_sec']}  "
+          f"(check {result['check_sec']}s, report {result['report_sec']}s, peak RSS {rss})")
+    slowest = sorted(result['rule_ms'].items(), key=lambda kv: -kv[1])
+    for name, ms in slowest:
+        print(f"    {name:<18} {ms:>10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quality checker benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="허용 악화 비율 (기본 0.25)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="반복 측정 횟수 (최솟값 사용, 기본 3)")
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--run', type=int, help=argparse.SUPPRESS)  # 자식 프로세스용
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_single(args.run, args.seed, args.repeat)))
+        return
+
+    baseline = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding='utf-8'))
+
+    print("="*60)
+    print("⏱️  Quality Checker Benchmark")
+    print("="*60)
+
+    results = {}
+    problems = []
+    for size in args.sizes:
+        result = measure(size, args.seed, args.repeat)
+        results[str(size)] = result
+        print_result(size, result)
+        if str(size) in baseline and not args.update_baseline:
+            problems.extend(compare(str(size), result, baseline[str(size)], args.tolerance))
+
+    if args.update_baseline:
+        baseline.update(results)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + '\n',
+                                 encoding='utf-8')
+        print(f"\n💾 Baseline updated: {BASELINE_PATH.name}")
+        return
+
+    print("\n" + "="*60)
+    if problems:
+        print("❌ Performance regression")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("✅ No regression" if baseline else "ℹ️  No baseline yet (--update-baseline)")
+
+
+if __name__ == "__main__":
+    main()
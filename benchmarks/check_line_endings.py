@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Line Ending Check
+같은 노트를 LF / CRLF / CR 줄바꿈 (utf-8, utf-8 BOM, cp949)으로 저장 → check_note 결과가 같은지 확인
+Windows에서 저장한 노트의 '\r'이 헤더/예제/코드 블록 인식을 깨뜨리지 않는지 (read_note의 줄바꿈 통일)
+다르면 차이를 출력하고 종료 코드 1
+
+사용법:
+    python benchmarks/check_line_endings.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+
+sys.path.insert(0, str(REPO_DIR))
+
+from enhanced_quality_checker import QualityChecker
+from note_reader import read_note
+
+NEWLINES = {'LF': '\n', 'CRLF': '\r\n', 'CR': '\r'}
+ENCODINGS = {'utf-8': 'utf-8', 'utf-8-sig': 'utf-8-sig', 'cp949': 'cp949'}
+
+SAMPLES = {
+    "개념_노트.md": """# 재귀적 자기개선
+
+## 핵심 내용
+
+매 세션 끝에 [[RSI 로그]]를 남기고 다음 세션에서 [[회고]]로 이어감.
+규칙은 [[품질 기준]]과 [[불변 조건]]을 따름.
+
+## 예제
+
+### 사례 1: 로그 요약
+주간 요약을 만들 때 Day 섹션만 읽음.
+
+### Example 2 잘못된 링크
+```python
+links = find_wikilinks(text)
+```
+
+## 관련 개념
+
+- [[링크 그래프]]
+- [[노트 파서]]
+""",
+    "짧은_노트.md": "# 메모\n\n짧음\n",
+    "표_노트.md": """# 측정
+
+| 단계 | 시간 |
+|------|------|
+| parse | 7 ms |
+
+## 참고
+[[측정 방법]] 참고.
+""",
+}
+
+
+def check_all(tmp: Path) -> Tuple[int, List[str]]:
+    """샘플 × 인코딩 × 줄바꿈 → LF 결과와 비교"""
+    checker = QualityChecker(tmp, time_budget=None)
+    problems = []
+    compared = 0
+    for name, text in SAMPLES.items():
+        for enc_name, encoding in ENCODINGS.items():
+            results: Dict[str, Tuple[int, List[Dict]]] = {}
+            for nl_name, newline in NEWLINES.items():
+                note = tmp / enc_name / nl_name / name
+                note.parent.mkdir(parents=True, exist_ok=True)
+                note.write_bytes(text.replace('\n', newline).encode(encoding))
+
+                score, issues = checker.check_note(note)
+                # 파일 경로만 다름 → 비교에서 제외
+                results[nl_name] = (score, [{k: v for k, v in issue.items() if k != 'file'}
+                                            for issue in issues])
+                if read_note(note, mmap_threshold=0).text != text:
+                    problems.append(f"{name} ({enc_name}, {nl_name}): mmap 읽기 결과가 LF 원문과 다름")
+
+            for nl_name, result in results.items():
+                compared += 1
+                if result != results['LF']:
+                    problems.append(f"{name} ({enc_name}, {nl_name}): "
+                                    f"점수 {results['LF'][0]} → {result[0]}, "
+                                    f"이슈 {len(results['LF'][1])} → {len(result[1])}")
+    return compared, problems
+
+
+def main():
+    print("="*60)
+    print("🧪 Line Ending Check")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        compared, problems = check_all(Path(tmp))
+
+    print("\n" + "="*60)
+    if problems:
+        print("❌ check_note output depends on line endings")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"✅ {compared} notes (LF / CRLF / CR) give identical check_note output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+RSI Log Golden Check
+Day 1-10 형식 (별표/콜론 변형, 같은 줄/다음 줄 값, ✅/⏸️ 체크리스트, 제안 목록)을
+고정해 둔 로그 사본 → rsi_log.parse_log_text 결과가 저장된 레코드와 같은지 확인
+다르면 Day별 차이를 출력하고 종료 코드 1
+
+사용법:
+    python benchmarks/check_rsi_log_golden.py
+    python benchmarks/check_rsi_log_golden.py --update    # 현재 파서 결과를 golden으로 저장
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+GOLDEN_DIR = BENCH_DIR / "golden"
+GOLDEN_LOG = GOLDEN_DIR / "rsi_log_day01-10.md"
+GOLDEN_RECORDS = GOLDEN_DIR / "rsi_log_day01-10.json"
+
+sys.path.insert(0, str(REPO_DIR))
+
+from rsi_log import parse_log_text
+
+
+def diff_records(expected: List[Dict], actual: List[Dict]) -> List[str]:
+    """Day별 필드 차이 목록"""
+    problems = []
+    if len(expected) != len(actual):
+        problems.append(f"레코드 수 {len(expected)} → {len(actual)}")
+
+    actual_by_day = {r['day']: r for r in actual}
+    for record in expected:
+        got = actual_by_day.get(record['day'])
+        if got is None:
+            problems.append(f"Day {record['day']}: 레코드 없음")
+            continue
+        for key in sorted(set(record) | set(got)):
+            if record.get(key) != got.get(key):
+                problems.append(f"Day {record['day']} {key}: "
+                                f"{record.get(key)!r} → {got.get(key)!r}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSI log parser golden check")
+    parser.add_argument('--update', action='store_true',
+                        help="현재 파서 결과로 golden 레코드 갱신")
+    args = parser.parse_args()
+
+    records = parse_log_text(GOLDEN_LOG.read_text(encoding='utf-8'))
+
+    if args.update:
+        GOLDEN_RECORDS.write_text(json.dumps(records, ensure_ascii=False, indent=2) + '\n',
+                                  encoding='utf-8')
+        print(f"💾 Golden updated: {GOLDEN_RECORDS.name} ({len(records)} days)")
+        return
+
+    expected = json.loads(GOLDEN_RECORDS.read_text(encoding='utf-8'))
+    problems = diff_records(expected, records)
+
+    print("="*60)
+    print("🧪 RSI Log Golden Check")
+    print("="*60)
+    for record in records:
+        print(f"  Day {record['day']:>2} ({record['date']}): 제안 {record['ai_suggestions']}, "
+              f"완료 {record['completed']}, 보류 {record['pending']}, "
+              f"새 제안 {len(record['new_suggestions'])}, "
+              f"반복 제안 {len(record['repeated_suggestions'])}")
+
+    print("\n" + "="*60)
+    if problems:
+        print("❌ Parser output differs from golden records")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"✅ {len(records)} days match golden records")
+
+
+if __name__ == "__main__":
+    main()
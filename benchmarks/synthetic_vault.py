@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Synthetic Vault Generator
+Resources/Part* 노트를 본뜬 합성 vault 생성 (같은 seed → 같은 내용)
+
+사용법:
+    python benchmarks/synthetic_vault.py <출력 경로> --notes 1000 [--seed 42]
+"""
+
+import json
+import random
+import shutil
+import argparse
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Tuple
+
+PARTS = [
+    'Part1_조직_인력', 'Part2_프로세스_운영', 'Part3_전략_경쟁',
+    'Part4_의사결정_데이터', 'Part5_혁신_창의성', 'Part6_미래_경영수학',
+]
+
+CONCEPTS = [
+    '그래프 이론', '중심성', '엔트로피', '최적화 이론', '베이즈 정리', '내쉬 균형',
+    'Rank와 Nullity', 'Phase Transition', '마르코프 체인', '포트폴리오 이론',
+    '행동경제학', '극값 이론', '군론과 대칭성', 'SVD와 PCA', 'Null Space',
+    'Chaos와 Fractal', 'TRIZ', 'Quantum Computing', '동적 계획법', 'ESG 지표',
+]
+SUFFIXES = ['응용', '사례 분석', '심화', '입문', '실무', '모델', '전략', '정리']
+
+WORDS_KO = [
+    '조직', '구조', '전략', '의사결정', '데이터', '모델', '균형', '변화', '시스템', '네트워크',
+    '병목', '효율', '위험', '수익', '분산', '신호', '패턴', '가설', '검증', '지표',
+    '팀', '프로세스', '자원', '비용', '시장', '경쟁', '협력', '안정성', '확률', '분포',
+]
+VERBS_KO = ['분석한다', '측정한다', '개선한다', '설명한다', '예측한다', '최소화한다',
+            '정량화한다', '식별한다', '연결한다', '비교한다']
+WORDS_EN = ['matrix', 'vector', 'graph', 'node', 'edge', 'entropy', 'utility', 'strategy',
+            'signal', 'variance', 'gradient', 'eigenvalue', 'state', 'transition', 'policy']
+VAGUE = ['여러', '다양한', '등등', '어떤', '특정', '일부']
+
+SECTIONS = ['개념', '수학적 정의', '메타 전략', '사례', '적용', '한계', '확장', '관련 개념']
+
+INLINE_MATH = ['$x_i$', '$\\lambda$', '$A\\mathbf{x} = \\mathbf{b}$', '$p(x)$', '$\\sigma^2$',
+               '$H(X)$', '$u_i(s_i, s_{-i})$']
+BLOCK_MATH = [
+    '$$H(X) = -\\sum_{i} p(x_i) \\log p(x_i)$$',
+    '$$\\text{rank}(A) + \\text{nullity}(A) = n$$',
+    '$$u_i(s_i^*, s_{-i}^*) \\geq u_i(s_i, s_{-i}^*)$$',
+    '$$P(A|B) = \\frac{P(B|A)P(A)}{P(B)}$$',
+]
+
+
+@dataclass
+class VaultSpec:
+    notes: int = 1000
+    seed: int = 42
+    links_per_note: float = 3.0          # 평균 [[링크]] 수
+    sections: Tuple[int, int] = (3, 8)   # '##' 섹션 수 범위
+    paragraphs: Tuple[int, int] = (1, 4) # 섹션당 문단 수 범위
+    math_ratio: float = 0.6              # 수학식이 있는 노트 비율
+    example_ratio: float = 0.5           # '### 사례 N:' 블록이 있는 노트 비율
+    untitled_ratio: float = 0.02         # Untitled 이름 비율
+    english_ratio: float = 0.2           # 영어 단어 섞는 비율
+    vague_ratio: float = 0.05            # 모호한 표현이 들어간 문장 비율
+
+
+class _Writer:
+    def __init__(self, spec: VaultSpec, rng: random.Random, names: List[str]):
+        self.spec = spec
+        self.rng = rng
+        self.names = names
+
+    def sentence(self) -> str:
+        rng = self.rng
+        words = [rng.choice(WORDS_EN) if rng.random() < self.spec.english_ratio
+                 else rng.choice(WORDS_KO) for _ in range(rng.randint(4, 14))]
+        if rng.random() < self.spec.vague_ratio:
+            words.insert(0, rng.choice(VAGUE))
+        if rng.random() < 0.3:
+            words.append(f"{rng.randint(2, 95)}%")
+        return ' '.join(words) + ' ' + rng.choice(VERBS_KO) + '.'
+
+    def paragraph(self) -> str:
+        return ' '.join(self.sentence() for _ in range(self.rng.randint(2, 6)))
+
+    def link(self) -> str:
+        target = self.rng.choice(self.names)
+        if self.rng.random() < 0.2:
+            return f"[[{target}|{self.rng.choice(WORDS_KO)}]]"
+        return f"[[{target}]]"
+
+    def note(self, name: str) -> str:
+        rng = self.rng
+        spec = self.spec
+        n_links = rng.randint(0, max(0, round(spec.links_per_note * 2)))
+        has_math = rng.random() < spec.math_ratio
+
+        out = [f"# {name}", "", "## 정의", "", self.paragraph(), ""]
+        out += ["## 핵심 내용", "", self.paragraph(), ""]
+
+        n_sections = rng.randint(*spec.sections)
+        for title in rng.sample(SECTIONS, min(n_sections, len(SECTIONS))):
+            out += [f"## {title}", ""]
+            for _ in range(rng.randint(*spec.paragraphs)):
+                text = self.paragraph()
+                if has_math and rng.random() < 0.3:
+                    text += ' ' + rng.choice(INLINE_MATH)
+                if n_links and rng.random() < 0.3:
+                    text += f" {self.link()}와 함께 본다."
+                    n_links -= 1
+                out += [text, ""]
+            if has_math and title == '수학적 정의':
+                out += [rng.choice(BLOCK_MATH), ""]
+
+        if rng.random() < spec.example_ratio:
+            for k in range(1, rng.randint(1, 4) + 1):
+                out += [f"### 사례 {k}: {rng.choice(WORDS_KO)} {rng.choice(SUFFIXES)}", ""]
+                out += [f"- **상황**: {self.sentence()}",
+                        f"- **결과**: {rng.randint(5, 60)}% 개선, {rng.randint(1, 12)}개월 소요",
+                        ""]
+
+        if n_links:
+            out += ["## 관련 개념", ""]
+            out += [f"- {self.link()} - {self.sentence()}" for _ in range(n_links)]
+            out.append("")
+
+        return '\n'.join(out)
+
+
+def note_names(spec: VaultSpec, rng: random.Random) -> List[str]:
+    names = []
+    for i in range(spec.notes):
+        if rng.random() < spec.untitled_ratio:
+            names.append(f"Untitled {i}")
+        else:
+            names.append(f"{rng.choice(CONCEPTS)} {rng.choice(SUFFIXES)} {i}")
+    return names
+
+
+def generate_vault(root: Path, spec: VaultSpec) -> List[Path]:
+    """
+    root 아래에 합성 vault 생성 → .md 파일 목록
+    같은 spec으로 이미 만든 vault가 있으면 그대로 재사용
+    """
+    root = Path(root)
+    marker = root / ".synthetic_spec.json"
+    spec_json = json.dumps(asdict(spec), sort_keys=True)
+
+    if marker.exists() and marker.read_text(encoding='utf-8') == spec_json:
+        return sorted(root.glob("Resources/**/*.md"))
+
+    # spec이 바뀌었으면 이전 노트 삭제
+    if (root / "Resources").exists():
+        shutil.rmtree(root / "Resources")
+
+    rng = random.Random(spec.seed)
+    names = note_names(spec, rng)
+    writer = _Writer(spec, rng, names)
+
+    paths = []
+    for i, name in enumerate(names):
+        folder = root / "Resources" / PARTS[i % len(PARTS)]
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{name}.md"
+        path.write_text(writer.note(name), encoding='utf-8')
+        paths.append(path)
+
+    marker.write_text(spec_json, encoding='utf-8')
+    return sorted(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 vault 생성")
+    parser.add_argument('output')
+    parser.add_argument('--notes', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--links', type=float, default=3.0, help="노트당 평균 링크 수")
+    args = parser.parse_args()
+
+    spec = VaultSpec(notes=args.notes, seed=args.seed, links_per_note=args.links)
+    paths = generate_vault(Path(args.output), spec)
+    print(f"✅ {len(paths)} notes → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
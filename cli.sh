@@ -201,6 +201,52 @@ cmd_sync() {
   fi
 }
 
+# Python interpreter for link_graph.py (empty if unavailable)
+find_python() {
+  if command -v python3 &> /dev/null; then
+    echo "python3"
+  elif command -v python &> /dev/null; then
+    echo "python"
+  fi
+}
+
+# Backlinks from the link graph index, falling back to a full-vault grep
+find_backlinks() {
+  local file="$1"
+  local basename="$2"
+  local python=$(find_python)
+  local output
+
+  if [ -n "$python" ] && [ -f "$SCRIPT_DIR/link_graph.py" ]; then
+    # Keep link_graph.py errors visible; on failure fall back to grep
+    if output=$("$python" "$SCRIPT_DIR/link_graph.py" backlinks "${file#./}" --vault "$SCRIPT_DIR"); then
+      echo "$output" | grep -v "^(no backlinks)$" || true
+      return
+    fi
+    echo "Warning: link_graph.py failed, falling back to grep" >&2
+  fi
+
+  grep -rn "\[\[$basename" --include="*.md" . 2>/dev/null | grep -v "^$file:" || true
+}
+
+cmd_backlinks() {
+  cd "$SCRIPT_DIR"
+  local query="$1"
+
+  if [ -z "$query" ]; then
+    echo "Usage: ./cli.sh backlinks <note-name or path>" >&2
+    exit 1
+  fi
+
+  local python=$(find_python)
+  if [ -z "$python" ]; then
+    echo "Error: python required" >&2
+    exit 1
+  fi
+
+  "$python" "$SCRIPT_DIR/link_graph.py" backlinks "$query" --vault "$SCRIPT_DIR"
+}
+
 cmd_read() {
   cd "$SCRIPT_DIR"
   local query="$1"
@@ -241,7 +287,7 @@ cmd_read() {
   echo ""
   echo "=== Backlinks ==="
 
-  local backlinks=$(grep -rn "\[\[$basename" --include="*.md" . 2>/dev/null | grep -v "^$file:" || true)
+  local backlinks=$(find_backlinks "$file" "$basename")
 
   if [ -n "$backlinks" ]; then
     echo "$backlinks"
@@ -411,6 +457,9 @@ case "${1:-}" in
   read)
     cmd_read "$2"
     ;;
+  backlinks)
+    cmd_backlinks "$2"
+    ;;
   tasks)
     shift
     cmd_tasks "$@"
@@ -422,6 +471,7 @@ case "${1:-}" in
     echo "  sync              Commit all changes and push to main"
     echo "  status            Show git status summary"
     echo "  read <note>       Read note with backlinks"
+    echo "  backlinks <note>  List notes linking to <note> (link graph index)"
     echo "  tasks [path]      List open tasks"
     echo "        --p1/p2/p3  Filter by priority"
     echo "        --next      Filter by #next tag"
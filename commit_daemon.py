@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Auto-commit Daemon
+vault 변경 감시 → quiet 시간 동안 조용해지면 모아서 한 번에 커밋 (연속 저장 = 커밋 하나)
+푸시는 백그라운드 큐에서 (편집/커밋이 네트워크를 기다리지 않음)
+푸시 실패는 지수 백오프로 재시도, non-fast-forward 거부는 재시도하지 않고 알림 (cli.sh sync로 rebase)
+"""
+
+import random
+import argparse
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import github_auto_commit as gac
+from git_backend import BACKENDS, open_backend, run_cli
+from git_changes import ChangeSet
+from git_snapshot import GitSnapshot
+from vault_watcher import VaultWatcher
+
+DEFAULT_QUIET = 30.0       # 마지막 저장 후 이만큼 조용하면 커밋 (초)
+DEFAULT_MAX_WAIT = 300.0   # 계속 저장 중이어도 첫 변경 후 이 시간이 지나면 커밋 (초)
+PUSH_BASE_DELAY = 2.0      # 첫 재시도 대기 (초), 실패할 때마다 2배
+PUSH_MAX_DELAY = 300.0
+
+# 기다려도 해결되지 않는 거부 (원격에 새 커밋 → pull --rebase 필요)
+PERMANENT_PUSH_ERRORS = ('non-fast-forward', 'fetch first', '[rejected]')
+
+
+def _stamp() -> str:
+    return datetime.now().strftime('%H:%M:%S')
+
+
+class PushWorker:
+    """
+    푸시 요청 큐 (백그라운드 스레드 1개)
+    같은 브랜치 요청은 하나로 합침 → 푸시 한 번이 그때까지의 커밋을 모두 보냄
+    """
+
+    def __init__(self, vault_path, remote: str = 'origin',
+                 base_delay: float = PUSH_BASE_DELAY, max_delay: float = PUSH_MAX_DELAY,
+                 log: Callable[[str], None] = print):
+        self.vault_path = Path(vault_path)
+        self.remote = remote
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.log = log
+        self.pushed = 0
+        self.rejected: Dict[str, str] = {}   # 재시도하지 않는 브랜치 → 마지막 오류
+        self._pending: Dict[str, int] = {}   # 브랜치 → 연속 실패 횟수
+        self._cond = threading.Condition()
+        self._stop = False
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='push-worker', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """대기 중인 재시도는 버림 (커밋은 로컬에 남아 다음 푸시에 포함)"""
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def request(self, branch: str):
+        with self._cond:
+            self._pending.setdefault(branch, 0)
+            self.rejected.pop(branch, None)
+            self._cond.notify_all()
+
+    def pending(self) -> List[str]:
+        with self._cond:
+            return list(self._pending)
+
+    def idle(self) -> bool:
+        with self._cond:
+            return not self._pending and not self._busy
+
+    def _delay(self, failures: int) -> float:
+        delay = min(self.base_delay * 2 ** (failures - 1), self.max_delay)
+        return delay * random.uniform(0.9, 1.1)  # 여러 vault가 같은 원격을 쓸 때 동시 재시도 방지
+
+    def _wait(self, seconds: float):
+        """백오프 대기 - stop이면 바로 끝 (새 요청이 와도 대기는 그대로)"""
+        deadline = time.monotonic() + seconds
+        with self._cond:
+            while not self._stop:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._cond.wait(remaining)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                branch = next(iter(self._pending))
+                failures = self._pending.pop(branch)  # 푸시 중 새 요청이 오면 다시 들어옴
+                self._busy = True
+
+            ok, output = run_cli(['git', 'push', self.remote, branch], self.vault_path)
+
+            with self._cond:
+                self._busy = False
+                if ok:
+                    self.pushed += 1
+                elif any(marker in output for marker in PERMANENT_PUSH_ERRORS):
+                    self.rejected[branch] = output
+                else:
+                    failures += 1
+                    self._pending[branch] = max(failures, self._pending.get(branch, 0))
+
+            lines = output.splitlines()
+            # 거부는 'To <remote>' 다음 줄에 이유가 있음
+            first_line = next((line.strip() for line in lines if '[rejected]' in line),
+                              lines[0] if lines else '')
+            if ok:
+                self.log(f"📤 [{_stamp()}] Pushed {branch} → {self.remote}")
+            elif branch in self.rejected:
+                self.log(f"⚠️ [{_stamp()}] Push rejected ({first_line}) - "
+                         f"pull --rebase 후 다음 커밋에서 다시 푸시")
+            else:
+                delay = self._delay(failures)
+                self.log(f"⚠️ [{_stamp()}] Push failed ({failures}), retry in {delay:.0f}s: "
+                         f"{first_line}")
+                self._wait(delay)
+
+
+class AutoCommitDaemon:
+    """
+    VaultWatcher 묶음마다 commit_changes (스냅샷 / Git 백엔드는 계속 재사용)
+    """
+
+    def __init__(self, vault_path, quiet: float = DEFAULT_QUIET,
+                 max_wait: float = DEFAULT_MAX_WAIT, push: bool = False,
+                 remote: str = 'origin', use_polling: bool = False,
+                 poll_interval: float = 1.0, push_base_delay: float = PUSH_BASE_DELAY):
+        self.vault_path = Path(vault_path)
+        self.max_wait = max_wait
+        self.snapshot = GitSnapshot(self.vault_path)
+        # suffix '' → 첨부 파일 포함 (IGNORE_DIRS 안의 변경은 다음 커밋에 같이 들어감)
+        self.watcher = VaultWatcher(self.vault_path, suffix='', debounce=quiet,
+                                    poll_interval=poll_interval, use_polling=use_polling)
+        self.pusher = PushWorker(self.vault_path, remote, base_delay=push_base_delay) \
+            if push else None
+        self.commits = 0
+
+    def commit_once(self) -> Optional[ChangeSet]:
+        """밀린 변경을 커밋하고 푸시 요청"""
+        change_set = gac.commit_changes(self.vault_path, self.snapshot,
+                                        confirm=False, verbose=False)
+        if change_set is None:
+            return None
+        self.commits += 1
+        print(f"💾 [{_stamp()}] {change_set.message.splitlines()[0]}")
+
+        if self.pusher:
+            branch = change_set.branch or gac.get_git_backend(self.vault_path).branch()
+            if branch:
+                self.pusher.request(branch)
+            else:
+                print("⚠️ Could not determine current branch (detached HEAD?) - not pushing")
+        return change_set
+
+    def run(self, timeout: Optional[float] = None):
+        """
+        감시 시작 → 시작 전에 밀린 변경부터 커밋 → 묶음마다 커밋
+        timeout 동안 변경이 없으면 종료 (None이면 Ctrl+C까지)
+        """
+        if self.pusher:
+            self.pusher.start()
+        try:
+            with self.watcher:
+                self.commit_once()
+                for _ in self.watcher.batches(timeout=timeout, max_wait=self.max_wait):
+                    self.commit_once()
+        finally:
+            if self.pusher:
+                self.pusher.stop()
+                left = self.pusher.pending()
+                if left:
+                    print(f"ℹ️ Not pushed yet: {', '.join(left)} (다음 실행/푸시에서 전송)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Debounced auto-commit daemon")
+    parser.add_argument('--quiet', type=float, default=DEFAULT_QUIET,
+                        help=f"마지막 저장 후 커밋까지 대기 (초, 기본 {DEFAULT_QUIET:.0f})")
+    parser.add_argument('--max-wait', type=float, default=DEFAULT_MAX_WAIT,
+                        help=f"계속 저장 중일 때 최대 대기 (초, 기본 {DEFAULT_MAX_WAIT:.0f})")
+    parser.add_argument('--push', action='store_true', help="커밋 후 백그라운드 푸시")
+    parser.add_argument('--remote', default='origin')
+    parser.add_argument('--backend', default='auto', choices=['auto', *BACKENDS],
+                        help="Git 백엔드 (기본 auto = pygit2 → dulwich → session)")
+    parser.add_argument('--polling', action='store_true',
+                        help="watchdog 대신 mtime 폴링")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+
+    print("="*60)
+    print("Auto-commit Daemon for Obsidian RSI")
+    print("="*60)
+
+    # Vault 경로 설정 (수정 필요)
+    vault_path = Path(r"C:\Users\win10_original\claude-vault")
+
+    if not (vault_path / ".git").exists():
+        print(f"❌ Error: Not a git repository: {vault_path}")
+        return
+
+    backend = open_backend(vault_path, args.backend)
+    gac.set_git_backend(backend)
+
+    daemon = AutoCommitDaemon(vault_path, quiet=args.quiet, max_wait=args.max_wait,
+                              push=args.push, remote=args.remote, use_polling=args.polling)
+    print(f"\n📂 Vault: {vault_path}")
+    print(f"👀 Watching ({daemon.watcher.backend}, quiet {args.quiet:g}s, "
+          f"max {args.max_wait:g}s, git {backend.name}"
+          f"{', push ' + args.remote if args.push else ''}) - Ctrl+C로 종료")
+
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        gac.set_git_backend(None)
+    print(f"✨ {daemon.commits} commit(s)"
+          + (f", {daemon.pusher.pushed} push(es)" if daemon.pusher else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ Day 5 디버그 스크립트
 import re
 from pathlib import Path
 
+from note_reader import read_text
+
 vault_path = Path(r"C:\Users\win10_original\claude-vault")
 log_file = vault_path / "0_Long_Term_RSI_Log.md"
 
@@ -13,16 +15,10 @@ print("="*60)
 print("Day 5 Debug")
 print("="*60)
 
-# 파일 읽기
-encodings = ['utf-8', 'cp949', 'euc-kr']
-for encoding in encodings:
-    try:
-        with open(log_file, 'r', encoding=encoding) as f:
-            content = f.read()
-            print(f"✓ 파일 인코딩: {encoding}")
-            break
-    except:
-        continue
+# 파일 읽기 (인코딩 판별은 note_reader 공용 - generate_weekly_summary와 같은 결과)
+source = read_text(log_file)
+content = source.text
+print(f"✓ 파일 인코딩: {source.encoding}" + (" (캐시)" if source.from_cache else ""))
 
 # Day 5 섹션만 추출
 day5_match = re.search(r'## Day 5\s*\n(.*?)(?=## Day 6|\Z)', content, re.DOTALL)
@@ -4,11 +4,56 @@ Enhanced Quality Checker for Obsidian RSI v2.0
 0_Invariants.md 기준 완전 통합 + 보고서 생성
 """
 
-import re
+import os
+import time
+import heapq
+import hashlib
+import argparse
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Iterator
+from operator import itemgetter
 from datetime import datetime
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from quality_cache import QualityCache, CACHE_DIR, QUALITY_CACHE_FILE, Stamp
+from note_parser import parse_note
+from note_reader import read_note, NoteText
+from issue_store import IssueStore
+from vault_watcher import VaultWatcher
+from quality_rules import (RuleEngine, load_invariant_rules, score_issues, META_PREFIXES_V2,
+                           AnalysisTimeout, timeout_issue, size_cap_issue, TIMEOUT_CATEGORY)
+from link_graph import LinkGraph
+from graph_metrics import GraphAnalyzer, GraphMetrics
+from rule_profiler import RuleProfiler
+
+# 검증 규칙이 바뀌면 올릴 것 (캐시 무효화 기준)
+CHECKER_VERSION = "2.2"
+
+# 병렬 검증: 이보다 적은 파일은 직렬 처리 (프로세스 풀 기동 비용 회피)
+PARALLEL_MIN_FILES = 200
+PARALLEL_CHUNK_SIZE = 64
+
+# 노트 하나의 분석 시간 예산 (초) - 넘기면 나머지 규칙을 건너뛰고 P3 '분석 시간 초과'
+# 단계(parse/규칙) 사이에서 확인 (SIGALRM이 없는 Windows에서도 동작)
+FILE_TIME_BUDGET = 5.0
+
+# 워커 프로세스별 체커 (initializer에서 1회 설정)
+_worker_checker = None
+
+
+def _init_worker(checker):
+    global _worker_checker
+    _worker_checker = checker
+
+
+def timed_out(issues: List[Dict]) -> bool:
+    """시간 예산 초과 결과 (부하에 따라 달라지므로 캐시에 저장하지 않음 → 다음 실행에서 재시도)"""
+    return any(issue['category'] == TIMEOUT_CATEGORY for issue in issues)
+
+
+def _check_chunk(paths: List[Path]) -> List[Tuple[int, List[Dict], Optional[Stamp]]]:
+    return [_worker_checker.check_note_stamped(path) for path in paths]
+
 
 class QualityChecker:
     """
@@ -16,392 +61,277 @@ class QualityChecker:
     0_Invariants.md 기준 사용
     """
 
-    def __init__(self, vault_path, invariants_path="0_Invariants.md"):
+    def __init__(self, vault_path, invariants_path="0_Invariants.md", profile="v2",
+                 time_budget: Optional[float] = FILE_TIME_BUDGET, verbose: bool = True):
         self.vault_path = Path(vault_path)
         self.invariants_path = self.vault_path / invariants_path
         self.issues = []
-        self.meta_files_prefixes = ['0_', '1_', '2_', '3_', '_']
+        self.profile = profile
+        self.time_budget = time_budget  # None/0 = 제한 없음
         
-        # Invariants 로드 (선택적)
-        if self.invariants_path.exists():
+        # Invariants 로드 (선택적) - quality-rules 블록의 파라미터 적용
+        # verbose=False면 안내 출력 생략 (daemon 커밋마다 점수 계산)
+        if verbose and self.invariants_path.exists():
             print(f"📜 Loading invariants from: {invariants_path}")
-        else:
+        elif verbose:
             print(f"⚠️  Invariants file not found, using built-in criteria")
 
-    # ===== Part 1: 구조적 품질 (기존) =====
-
-    def check_file_naming(self, file_path: Path) -> List[Dict]:
-        """파일 명칭 규칙 검증"""
-        issues = []
-        name = file_path.stem
-
-        # Untitled 체크
-        if 'Untitled' in name:
-            issues.append({
-                'priority': 'P2',
-                'category': '파일명',
-                'file': file_path.name,
-                'issue': f"Untitled 파일: {name}",
-                'suggestion': "의미있는 이름으로 변경 필요"
-            })
-
-        return issues
-
-    def check_links(self, content: str, file_path: Path) -> List[Dict]:
-        """링크 구조 검증"""
-        issues = []
-
-        # 메타 파일 제외
-        if any(file_path.name.startswith(prefix) for prefix in self.meta_files_prefixes):
-            return issues
-
-        # 링크 추출 [[링크]]
-        links = re.findall(r'\[\[(.*?)\]\]', content)
-
-        if len(links) == 0:
-            issues.append({
-                'priority': 'P1',
-                'category': '링크',
-                'file': file_path.name,
-                'issue': "고아 노트 (링크 없음)",
-                'suggestion': "최소 1개 이상의 관련 개념 링크 추가"
-            })
-        elif len(links) < 2:
-            issues.append({
-                'priority': 'P3',
-                'category': '연결성',
-                'file': file_path.name,
-                'issue': "링크가 1개뿐 (격리 위험)",
-                'suggestion': "2개 이상의 관련 개념 연결 권장"
-            })
-
-        return issues
-
-    def check_sections(self, content: str, file_path: Path) -> List[Dict]:
-        """섹션 구조 검증"""
-        issues = []
-
-        # 섹션 추출
-        sections = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
-
-        # 핵심 내용 섹션 체크
-        core_content_section = None
-        for match in re.finditer(r'^##\s+핵심\s*내용\s*$(.*?)(?=^##|\Z)', content, re.MULTILINE | re.DOTALL):
-            core_content_section = match.group(1).strip()
-            break
-
-        if core_content_section is not None:
-            if len(core_content_section) < 10:
-                issues.append({
-                    'priority': 'P1',
-                    'category': '빈 섹션',
-                    'file': file_path.name,
-                    'issue': "'핵심 내용' 섹션이 비어있음",
-                    'suggestion': "핵심 내용 작성 필요"
-                })
-
-        return issues
-
-    # ===== Part 2: 내용적 품질 (고급) =====
-
-    def check_content_quality(self, content: str, file_path: Path) -> List[Dict]:
-        """내용 충실도 검증"""
-        issues = []
-
-        # 핵심 내용 길이 체크
-        core_content_section = None
-        for match in re.finditer(r'^##\s+핵심\s*내용\s*$(.*?)(?=^##|\Z)', content, re.MULTILINE | re.DOTALL):
-            core_content_section = match.group(1).strip()
-            break
-
-        if core_content_section:
-            if len(core_content_section) < 150:
-                issues.append({
-                    'priority': 'P2',
-                    'category': '내용 품질',
-                    'file': file_path.name,
-                    'issue': f"핵심 내용이 짧음 ({len(core_content_section)}자)",
-                    'suggestion': "최소 150자 이상 작성 권장"
-                })
-
-            # 모호한 표현 체크
-            vague_terms = ['여러', '여러 가지', '다양한', '등등']
-            found_vague = [term for term in vague_terms if term in core_content_section]
-            if found_vague:
-                issues.append({
-                    'priority': 'P3',
-                    'category': '명확성',
-                    'file': file_path.name,
-                    'issue': f"모호한 표현 발견: {', '.join(found_vague)}",
-                    'suggestion': "구체적인 표현으로 변경 권장"
-                })
-
-        return issues
-
-    def check_clarity(self, content: str, file_path: Path) -> List[Dict]:
-        """명령 명확성 검증"""
-        issues = []
-
-        # 문장 길이 체크
-        sentences = re.split(r'[.!?]\s+', content)
-        long_sentences = [s for s in sentences if len(s) > 100]
-
-        if len(long_sentences) > 5:
-            issues.append({
-                'priority': 'P3',
-                'category': '명확성',
-                'file': file_path.name,
-                'issue': f"{len(long_sentences)}개 문장이 너무 김 (100자 이상)",
-                'suggestion': "긴 문장을 짧게 분리 권장"
-            })
-
-        return issues
-
-    def check_connectivity(self, content: str, file_path: Path) -> List[Dict]:
-        """개념 연결성 검증"""
-        issues = []
-
-        # 메타 파일 제외
-        if any(file_path.name.startswith(prefix) for prefix in self.meta_files_prefixes):
-            return issues
-
-        # 링크와 맥락 체크
-        links = re.findall(r'\[\[(.*?)\]\]', content)
-
-        # 맥락 있는 링크 (링크 주변에 설명이 있는지)
-        contextual_links = 0
-        for match in re.finditer(r'(.{20})\[\[.*?\]\](.{20})', content):
-            before = match.group(1).strip()
-            after = match.group(2).strip()
-            # 앞뒤에 글자가 있으면 맥락 있는 링크로 판단
-            if (any('\uac00' <= c <= '\ud7a3' for c in before) or
-                any('\uac00' <= c <= '\ud7a3' for c in after)):
-                contextual_links += 1
-
-        if links and contextual_links / len(links) < 0.3:
-            issues.append({
-                'priority': 'P3',
-                'category': '연결성',
-                'file': file_path.name,
-                'issue': f"링크 중 맥락 없는 것이 많음 ({contextual_links}/{len(links)})",
-                'suggestion': "링크에 설명 추가 권장"
-            })
-
-        return issues
-
-    def check_rag_optimization(self, content: str, file_path: Path) -> List[Dict]:
-        """RAG 최적화 검증 (Phase 5 기준)"""
-        issues = []
-
-        # 메타 파일 제외
-        if any(file_path.name.startswith(prefix) for prefix in self.meta_files_prefixes):
-            return issues
-
-        char_count = len(content)
-        sections = re.findall(r'^##\s+', content, re.MULTILINE)
-        section_count = len(sections)
-
-        # 길이 체크 (1,500-2,000자 권장)
-        if char_count < 1000:
-            issues.append({
-                'priority': 'P2',
-                'category': 'RAG 최적화',
-                'file': file_path.name,
-                'issue': f"노트가 짧음 ({char_count}자)",
-                'suggestion': "1,500-2,000자 권장 (Phase 5 기준)"
-            })
-        elif char_count > 3500:
-            issues.append({
-                'priority': 'P2',
-                'category': 'RAG 최적화',
-                'file': file_path.name,
-                'issue': f"노트가 너무 김 ({char_count}자)",
-                'suggestion': "2,000자 이하 권장 - 분할 고려"
-            })
-
-        # 섹션 수 체크 (5-8개 권장)
-        if section_count > 0:
-            if section_count < 4:
-                issues.append({
-                    'priority': 'P3',
-                    'category': 'RAG 최적화',
-                    'file': file_path.name,
-                    'issue': f"섹션 부족 ({section_count}개)",
-                    'suggestion': "5-8개 섹션 권장"
-                })
-            elif section_count > 10:
-                issues.append({
-                    'priority': 'P3',
-                    'category': 'RAG 최적화',
-                    'file': file_path.name,
-                    'issue': f"섹션 과다 ({section_count}개)",
-                    'suggestion': "5-8개 섹션 권장"
-                })
-
-            # 정보 밀도 체크 (200-250자/섹션)
-            density = char_count / section_count
-            if density < 150:
-                issues.append({
-                    'priority': 'P3',
-                    'category': 'RAG 최적화',
-                    'file': file_path.name,
-                    'issue': f"정보 밀도 낮음 ({density:.0f}자/섹션)",
-                    'suggestion': "200-250자/섹션 권장"
-                })
-            elif density > 450:
-                issues.append({
-                    'priority': 'P3',
-                    'category': 'RAG 최적화',
-                    'file': file_path.name,
-                    'issue': f"정보 밀도 높음 ({density:.0f}자/섹션)",
-                    'suggestion': "200-250자/섹션 권장"
-                })
-
-        return issues
-
-    def check_example_quality(self, content: str, file_path: Path) -> List[Dict]:
-        """예제 품질 검증"""
-        issues = []
-
-        # 예제/사례 섹션 찾기
-        example_sections = re.findall(
-            r'^###\s+(?:사례|예제|Example)\s+\d+:?\s*(.+?)$\n(.*?)(?=^###|^##|\Z)',
-            content,
-            re.MULTILINE | re.DOTALL
-        )
-
-        if len(example_sections) > 4:
-            issues.append({
-                'priority': 'P3',
-                'category': '예제 품질',
-                'file': file_path.name,
-                'issue': f"예제가 너무 많음 ({len(example_sections)}개)",
-                'suggestion': "2-3개 권장 (Phase 5: 중복 문제)"
-            })
-
-        # 각 예제 품질 체크
-        vague_terms = ['어떤', '일정', '일반']
-        for i, (title, content_part) in enumerate(example_sections, 1):
-            # 추상적 표현 체크
-            if any(term in title or term in content_part for term in vague_terms):
-                issues.append({
-                    'priority': 'P3',
-                    'category': '예제 품질',
-                    'file': file_path.name,
-                    'issue': f"예제 {i}가 추상적",
-                    'suggestion': "구체적인 이름/숫자 포함 권장"
-                })
-
-            # 길이 체크
-            if len(content_part.strip()) < 100:
-                issues.append({
-                    'priority': 'P3',
-                    'category': '예제 품질',
-                    'file': file_path.name,
-                    'issue': f"예제 {i} 설명이 짧음 ({len(content_part)}자)",
-                    'suggestion': "최소 100자 이상 권장"
-                })
-
-        return issues
-
-    def check_math_requirement(self, content: str, file_path: Path) -> List[Dict]:
-        """수학식 요구사항 검증 (BrainTwin 특화)"""
-        issues = []
-        
-        # 메타 파일 제외
-        name_lower = file_path.name.lower()
-        meta_patterns = ['0_', '1_', '2_', '3_', '_',
-                        'index', 'log', 'readme', 'guide', 'agenda']
-        
-        if any(pattern in name_lower for pattern in meta_patterns):
-            return []  # 메타 파일은 체크하지 않음
-        
-        # 개념 노트 판별
-        concept_keywords = ['rank', 'nullity', '군론', '대칭성',
-                           '그래프', '중심성', '정리', 'theorem',
-                           '이론', 'theory', '개념']
-        
-        # 파일명 또는 내용에 개념 키워드
-        has_concept_keyword = any(kw in name_lower for kw in concept_keywords)
-        
-        # "## 개념" or "## 정의" 섹션
-        has_concept_section = bool(re.search(r'^##\s+(개념|정의)', 
-                                            content, re.MULTILINE))
-        
-        is_concept_note = has_concept_keyword or has_concept_section
-        
-        if not is_concept_note:
-            return []  # 개념 노트 아니면 체크 안함
-        
-        # 수학식 체크
-        # $...$ inline math (최소 2개 $ 필요)
-        has_inline = content.count('$') >= 2
-        # $$...$$ block math
-        has_block = '$$' in content
-        
-        has_math = has_inline or has_block
-        
-        if not has_math:
-            issues.append({
-                'priority': 'P1',
-                'category': '수학식',
-                'file': file_path.name,
-                'issue': '개념 노트에 수학식 없음',
-                'suggestion': 'LaTeX 수학식 추가: $E=mc^2$ 또는 $$\\int f(x)dx$$'
-            })
-        
-        return issues
+        self.engine = RuleEngine(load_invariant_rules(
+            self.invariants_path, profile,
+            cache_dir=self.vault_path / CACHE_DIR, version=CHECKER_VERSION))
 
-    def calculate_quality_score(self, all_issues: List[Dict]) -> int:
-        """품질 점수 계산 (0-100)"""
-        score = 100
+        # 링크 그래프 이슈 (vault 기준 경로 → 이슈), use_graph()로 설정
+        self.graph_issues: Dict[str, List[Dict]] = {}
 
-        for issue in all_issues:
-            if issue['priority'] == 'P1':
-                score -= 15
-            elif issue['priority'] == 'P2':
-                score -= 5
-            elif issue['priority'] == 'P3':
-                score -= 2
+        # 규칙별 시간 측정 (enable_profiling() 호출 시에만)
+        self.profiler: Optional[RuleProfiler] = None
 
-        return max(0, score)
+    def enable_profiling(self, top_n: int = 5) -> RuleProfiler:
+        """read/parse 단계와 규칙별 시간 측정 시작"""
+        self.profiler = RuleProfiler(top_n)
+        self.engine.profiler = self.profiler
+        return self.profiler
 
-    def check_note(self, file_path: Path) -> Tuple[int, List[Dict]]:
-        """단일 노트 검증"""
-        if not file_path.exists():
-            return 0, []
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def fingerprint(self) -> str:
+        """캐시 무효화 기준 (체커 버전 + 0_Invariants.md 내용)"""
+        h = hashlib.sha1(f"{CHECKER_VERSION}:{self.profile}".encode('utf-8'))
+        if self.invariants_path.exists():
+            h.update(self.invariants_path.read_bytes())
+        return h.hexdigest()
 
-        all_issues = []
+    def calculate_quality_score(self, all_issues: List[Dict]) -> int:
+        """품질 점수 계산 (0-100)"""
+        return score_issues(all_issues)
 
-        # Part 1: 구조적 품질
-        all_issues.extend(self.check_file_naming(file_path))
-        all_issues.extend(self.check_links(content, file_path))
-        all_issues.extend(self.check_sections(content, file_path))
+    def check_note(self, file_path: Path) -> Tuple[int, List[Dict]]:
+        """단일 노트 검증"""
+        score, issues, _ = self.check_note_stamped(file_path)
+        return score, issues
 
-        # Part 2: 내용적 품질
-        all_issues.extend(self.check_content_quality(content, file_path))
-        all_issues.extend(self.check_clarity(content, file_path))
-        all_issues.extend(self.check_connectivity(content, file_path))
-        all_issues.extend(self.check_rag_optimization(content, file_path))
-        all_issues.extend(self.check_example_quality(content, file_path))
-        all_issues.extend(self.check_math_requirement(content, file_path))  # ⭐ 추가!
+    def check_note_stamped(self, file_path: Path) -> Tuple[int, List[Dict], Optional[Stamp]]:
+        """check_note() + 검증한 내용의 (mtime_ns, size, sha1) - QualityCache.store용"""
+        if not file_path.exists():
+            return 0, [], None
+
+        if self.profiler is not None:
+            return self._check_note_profiled(file_path)
+
+        started = time.perf_counter()
+        # 큰 파일은 mmap, 분석 상한(note_reader.MAX_ANALYSIS_BYTES)을 넘으면 앞부분만
+        source = read_note(file_path)
+        return (*self.check_source(source, file_path, started), source.stamp)
+
+    def check_source(self, source: NoteText, file_path: Path,
+                     started: Optional[float] = None) -> Tuple[int, List[Dict]]:
+        """이미 읽은 노트 내용 검증 (예: git의 이전 버전), file_path는 이슈/규칙용"""
+        if started is None:
+            started = time.perf_counter()
+
+        # 1회 파싱 → 프로필의 규칙이 공유 (quality_rules.py)
+        deadline = self._deadline(started)
+        try:
+            note = parse_note(source.text)
+            self._check_deadline(deadline, 'parse')
+            all_issues = self.engine.run(note, file_path, deadline)
+        except AnalysisTimeout as e:
+            all_issues = e.issues + [timeout_issue(file_path, e.stage, self.time_budget)]
+        self._add_size_cap(file_path, source, all_issues)
 
         # 점수 계산
         score = self.calculate_quality_score(all_issues)
 
         return score, all_issues
 
-    def generate_report(self, all_issues: List[Dict], scores: Dict[str, int], 
-                       md_files: List[Path]) -> str:
-        """마크다운 보고서 생성"""
-        
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d %H:%M")
-        
-        report = f"""# 📊 Quality Check Report
+    @staticmethod
+    def _add_size_cap(file_path: Path, source: NoteText, issues: List[Dict]):
+        if source.truncated:
+            issues.append(size_cap_issue(file_path, source.size, source.analyzed))
+
+    def _deadline(self, started: float) -> Optional[float]:
+        return started + self.time_budget if self.time_budget else None
+
+    @staticmethod
+    def _check_deadline(deadline: Optional[float], stage: str):
+        if deadline is not None and time.perf_counter() > deadline:
+            raise AnalysisTimeout(stage)
+
+    def _check_note_profiled(self, file_path: Path) -> Tuple[int, List[Dict], Stamp]:
+        """check_note_stamped()와 동일 + read/parse 단계 시간 기록 (규칙은 RuleEngine이 기록)"""
+        record = self.profiler.record
+        name = file_path.name
+
+        started = time.perf_counter()
+        deadline = self._deadline(started)
+        source = read_note(file_path)
+        elapsed = time.perf_counter() - started
+        nbytes = source.analyzed
+        record('read', elapsed, nbytes, name)
+
+        try:
+            started = time.perf_counter()
+            note = parse_note(source.text)
+            record('parse', time.perf_counter() - started, nbytes, name)
+            self._check_deadline(deadline, 'parse')
+
+            all_issues = self.engine.run(note, file_path, deadline)
+        except AnalysisTimeout as e:
+            all_issues = e.issues + [timeout_issue(file_path, e.stage, self.time_budget)]
+        self._add_size_cap(file_path, source, all_issues)
+        return self.calculate_quality_score(all_issues), all_issues, source.stamp
+
+    def use_graph(self, graph: GraphMetrics):
+        """그래프 분석 결과를 점수에 반영 (백링크 없음, 고립 클러스터, 끊어진 링크)"""
+        self.graph_issues = graph.issues(exclude=META_PREFIXES_V2)
+
+    def with_graph(self, file_path: Path, score: int,
+                   issues: List[Dict]) -> Tuple[int, List[Dict]]:
+        """노트별 결과에 그래프 이슈를 더해 점수 재계산 (캐시에는 노트별 결과만 저장)"""
+        if not self.graph_issues:
+            return score, issues
+        try:
+            key = file_path.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return score, issues
+        extra = self.graph_issues.get(key)
+        if not extra:
+            return score, issues
+        issues = issues + extra
+        return self.calculate_quality_score(issues), issues
+
+    def iter_results(self, md_files: List[Path], workers: int = 1,
+                     cache: Optional[QualityCache] = None) -> Iterator[Tuple[Path, int, List[Dict]]]:
+        """
+        전체 노트 검증 (캐시 확인 → 변경 파일만 검증 → md_files 순서대로 (파일, 점수, 이슈) 생성)
+        workers > 1이고 파일이 충분히 많으면 프로세스 풀에 청크 단위로 분배
+        """
+        pending = [idx for idx, file_path in enumerate(md_files)
+                   if not (cache and cache.is_fresh(file_path))]
+        checked = {}
+
+        if workers > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            chunks = [pending[i:i + PARALLEL_CHUNK_SIZE]
+                      for i in range(0, len(pending), PARALLEL_CHUNK_SIZE)]
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker,
+                                     initargs=(self,)) as pool:
+                chunk_results = pool.map(
+                    _check_chunk, [[md_files[i] for i in chunk] for chunk in chunks])
+                for chunk, results in zip(chunks, chunk_results):
+                    checked.update(zip(chunk, results))
+        else:
+            for idx in pending:
+                checked[idx] = self.check_note_stamped(md_files[idx])
+
+        if cache:
+            for idx, (score, issues, stamp) in checked.items():
+                if stamp is not None and not timed_out(issues):
+                    cache.store(md_files[idx], score, issues, stamp)
+
+        # 캐시 결과는 이 시점에 한 파일씩 디코딩
+        for idx, file_path in enumerate(md_files):
+            result = checked.pop(idx, None)
+            if result is None:
+                result = cache.get(file_path)
+            yield file_path, result[0], result[1]
+
+    def check_vault(self, md_files: List[Path], workers: int = 1,
+                    cache: Optional[QualityCache] = None,
+                    keep: Optional[Dict[Path, Tuple[int, List[Dict]]]] = None) -> IssueStore:
+        """
+        전체 노트 검증 → IssueStore (순서는 md_files 순서와 동일)
+        keep을 넘기면 파일별 (점수, 이슈)도 보관 (watch 모드용)
+        """
+        store = IssueStore()
+        for file_path, score, issues in self.iter_results(md_files, workers, cache):
+            if keep is not None:
+                keep[file_path] = (score, issues)
+            store.add(file_path.name, *self.with_graph(file_path, score, issues))
+        return store
+
+    def summarize(self, store: IssueStore) -> Dict:
+        """
+        보고서용 집계
+        우선순위/카테고리 개수는 IssueStore의 증분 집계 사용, scores는 1회 순회
+        """
+        grades = {'excellent': 0, 'good': 0, 'fair': 0, 'poor': 0}
+        critical = []
+        needs_improvement = []
+        low_scores = []
+        total_score = 0
+        scores = store.scores
+
+        for name, score in scores.items():
+            total_score += score
+            if score >= 90:
+                grades['excellent'] += 1
+            elif score >= 75:
+                grades['good'] += 1
+            elif score >= 60:
+                grades['fair'] += 1
+                needs_improvement.append((name, score))
+            else:
+                grades['poor'] += 1
+                critical.append((name, score))
+            if score < 70:
+                low_scores.append((name, score))
+
+        by_score = itemgetter(1)
+        return {
+            'avg_score': total_score / len(scores) if scores else 0,
+            'grades': grades,
+            'priorities': store.priority_counts(),
+            'categories': store.category_counts(),
+            'p1_count': store.priority_counts()['P1'],
+            'critical': heapq.nsmallest(10, critical, key=by_score),
+            'needs_improvement': heapq.nsmallest(15, needs_improvement, key=by_score),
+            'low_scores': heapq.nsmallest(10, low_scores, key=by_score),
+        }
+
+    def iter_graph_report(self, graph: GraphMetrics) -> Iterator[str]:
+        """링크 그래프 섹션"""
+        def name(path: str) -> str:
+            return path.rsplit('/', 1)[-1][:-3]
+
+        largest = len(graph.components[0]) if graph.components else 0
+        yield "\n---\n\n## 🕸️ Link Graph\n\n"
+        yield f"- **Notes:** {len(graph.nodes)}\n"
+        yield f"- **Resolved Links:** {graph.edge_count}\n"
+        yield f"- **Connected Components:** {len(graph.components)} (largest: {largest}개 노트)\n"
+        yield f"- **Dangling Links:** {len(graph.dangling)}\n\n"
+
+        yield "### 🏆 Central Notes (PageRank Top 10)\n\n"
+        for path, rank in graph.top_pagerank(10):
+            yield (f"- **{name(path)}** - PageRank {rank:.4f} "
+                   f"(in {graph.in_degree[path]} / out {graph.out_degree[path]})\n")
+
+        yield "\n### 🏝️ Isolated Clusters\n\n"
+        clusters = graph.isolated_clusters()
+        if clusters:
+            for cluster in clusters:
+                yield f"- {', '.join(name(p) for p in cluster)} ({len(cluster)}개)\n"
+        else:
+            yield "*없음 - 모든 노트 묶음이 메인 네트워크에 연결되어 있습니다!* ✅\n"
+
+        yield "\n### 🌉 Bridges (끊기면 네트워크가 분리되는 링크)\n\n"
+        if graph.bridges:
+            for a, b in graph.bridges[:10]:
+                yield f"- **{name(a)}** ↔ **{name(b)}**\n"
+            if len(graph.bridges) > 10:
+                yield f"- ... 외 {len(graph.bridges) - 10}개\n"
+        else:
+            yield "*없음*\n"
+
+    def iter_report(self, store: IssueStore, md_files: List[Path],
+                    summary: Optional[Dict] = None,
+                    graph: Optional[GraphMetrics] = None) -> Iterator[str]:
+        """마크다운 보고서를 조각 단위로 생성 (이슈 메시지는 P1만 렌더링)"""
+        if summary is None:
+            summary = self.summarize(store)
+        scores = store.scores
+
+        date_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+        yield f"""# 📊 Quality Check Report
 
 **Generated:** {date_str}  
 **Vault:** `{self.vault_path}`  
@@ -412,98 +342,204 @@ class QualityChecker:
 ## 📈 Overall Statistics
 
 """
-        
+
         if scores:
-            avg_score = sum(scores.values()) / len(scores)
-            report += f"- **Average Quality Score:** {avg_score:.1f}/100\n"
-            report += f"- **Total Files Checked:** {len(md_files)}\n"
-            report += f"- **Files with Issues:** {len(scores)}\n"
-            report += f"- **Total Issues Found:** {len(all_issues)}\n\n"
+            total = len(scores)
+            grades = summary['grades']
+            yield f"- **Average Quality Score:** {summary['avg_score']:.1f}/100\n"
+            yield f"- **Total Files Checked:** {len(md_files)}\n"
+            yield f"- **Files with Issues:** {total}\n"
+            yield f"- **Total Issues Found:** {len(store)}\n\n"
 
             # 등급 분포
-            excellent = sum(1 for s in scores.values() if s >= 90)
-            good = sum(1 for s in scores.values() if 75 <= s < 90)
-            fair = sum(1 for s in scores.values() if 60 <= s < 75)
-            poor = sum(1 for s in scores.values() if s < 60)
-
-            report += "### 🎯 Grade Distribution\n\n"
-            report += f"- **Excellent (90-100):** {excellent}개 ({excellent/len(scores)*100:.1f}%)\n"
-            report += f"- **Good (75-89):** {good}개 ({good/len(scores)*100:.1f}%)\n"
-            report += f"- **Fair (60-74):** {fair}개 ({fair/len(scores)*100:.1f}%)\n"
-            report += f"- **Poor (0-59):** {poor}개 ({poor/len(scores)*100:.1f}%)\n\n"
+            yield "### 🎯 Grade Distribution\n\n"
+            yield f"- **Excellent (90-100):** {grades['excellent']}개 ({grades['excellent']/total*100:.1f}%)\n"
+            yield f"- **Good (75-89):** {grades['good']}개 ({grades['good']/total*100:.1f}%)\n"
+            yield f"- **Fair (60-74):** {grades['fair']}개 ({grades['fair']/total*100:.1f}%)\n"
+            yield f"- **Poor (0-59):** {grades['poor']}개 ({grades['poor']/total*100:.1f}%)\n\n"
 
         # 우선순위별 이슈
-        if all_issues:
-            p1_count = sum(1 for i in all_issues if i['priority'] == 'P1')
-            p2_count = sum(1 for i in all_issues if i['priority'] == 'P2')
-            p3_count = sum(1 for i in all_issues if i['priority'] == 'P3')
-
-            report += "### 🚨 Issues by Priority\n\n"
-            report += f"- **P1 (Critical):** {p1_count}개 - 즉시 해결 필요\n"
-            report += f"- **P2 (Important):** {p2_count}개 - 조속히 개선 권장\n"
-            report += f"- **P3 (Nice-to-have):** {p3_count}개 - 점진적 개선\n\n"
+        if len(store):
+            priorities = summary['priorities']
+            yield "### 🚨 Issues by Priority\n\n"
+            yield f"- **P1 (Critical):** {priorities['P1']}개 - 즉시 해결 필요\n"
+            yield f"- **P2 (Important):** {priorities['P2']}개 - 조속히 개선 권장\n"
+            yield f"- **P3 (Nice-to-have):** {priorities['P3']}개 - 점진적 개선\n\n"
 
             # 카테고리별 이슈
-            categories = Counter(i['category'] for i in all_issues)
-            
-            report += "### 📋 Issues by Category (Top 5)\n\n"
-            for category, count in categories.most_common(5):
-                report += f"- **{category}:** {count}개\n"
-            report += "\n"
+            yield "### 📋 Issues by Category (Top 5)\n\n"
+            for category, count in summary['categories'].most_common(5):
+                yield f"- **{category}:** {count}개\n"
+            yield "\n"
 
         # 낮은 점수 파일
         if scores:
-            report += "---\n\n## 🔴 Files Requiring Attention\n\n"
-            report += "### Critical (Score < 60)\n\n"
-            
-            critical = [(name, score) for name, score in scores.items() if score < 60]
-            critical.sort(key=lambda x: x[1])
-            
-            if critical:
-                for name, score in critical[:10]:
-                    report += f"- **{name}** - {score:.0f}점\n"
+            yield "---\n\n## 🔴 Files Requiring Attention\n\n"
+            yield "### Critical (Score < 60)\n\n"
+
+            if summary['critical']:
+                for name, score in summary['critical']:
+                    yield f"- **{name}** - {score:.0f}점\n"
             else:
-                report += "*없음 - 모든 파일이 60점 이상입니다!* ✅\n"
-            
-            report += "\n### Needs Improvement (Score 60-74)\n\n"
-            
-            needs_improvement = [(name, score) for name, score in scores.items() if 60 <= score < 75]
-            needs_improvement.sort(key=lambda x: x[1])
-            
-            if needs_improvement:
-                for name, score in needs_improvement[:15]:
-                    report += f"- **{name}** - {score:.0f}점\n"
+                yield "*없음 - 모든 파일이 60점 이상입니다!* ✅\n"
+
+            yield "\n### Needs Improvement (Score 60-74)\n\n"
+
+            if summary['needs_improvement']:
+                for name, score in summary['needs_improvement']:
+                    yield f"- **{name}** - {score:.0f}점\n"
             else:
-                report += "*없음 - 모든 파일이 75점 이상입니다!* ✅\n"
+                yield "*없음 - 모든 파일이 75점 이상입니다!* ✅\n"
+
+        # 링크 그래프
+        if graph is not None:
+            yield from self.iter_graph_report(graph)
 
         # 상세 이슈 (P1만)
-        if all_issues:
-            p1_issues = [i for i in all_issues if i['priority'] == 'P1']
-            
-            if p1_issues:
-                report += "\n---\n\n## ⚠️ Critical Issues (P1) - Immediate Action Required\n\n"
-                
-                for issue in p1_issues:
-                    report += f"### [{issue['file']}]\n\n"
-                    report += f"- **Category:** {issue['category']}\n"
-                    report += f"- **Issue:** {issue['issue']}\n"
-                    report += f"- **Suggestion:** {issue['suggestion']}\n\n"
+        if summary['p1_count']:
+            yield "\n---\n\n## ⚠️ Critical Issues (P1) - Immediate Action Required\n\n"
+
+            for issue in store.iter_issues('P1'):
+                yield (f"### [{issue['file']}]\n\n"
+                       f"- **Category:** {issue['category']}\n"
+                       f"- **Issue:** {issue['issue']}\n"
+                       f"- **Suggestion:** {issue['suggestion']}\n\n")
+
+        # 성능 (--profile)
+        if self.profiler is not None and self.profiler.stats:
+            yield from self.profiler.iter_report()
+            yield "\n"
 
         # 푸터
-        report += "---\n\n"
-        report += "## 📝 Notes\n\n"
-        report += "- 이 보고서는 `0_Invariants.md` (Phase 5 기준)을 기반으로 생성되었습니다.\n"
-        report += "- P1 이슈는 노트의 핵심 기능을 저해하므로 즉시 해결이 필요합니다.\n"
-        report += "- P2 이슈는 품질 향상을 위해 조속히 개선을 권장합니다.\n"
-        report += "- P3 이슈는 점진적으로 개선하면 됩니다.\n\n"
-        report += f"**Generated by:** Enhanced Quality Checker v2.0  \n"
-        report += f"**Report Date:** {date_str}\n"
-        
-        return report
+        yield "---\n\n"
+        yield "## 📝 Notes\n\n"
+        yield "- 이 보고서는 `0_Invariants.md` (Phase 5 기준)을 기반으로 생성되었습니다.\n"
+        yield "- P1 이슈는 노트의 핵심 기능을 저해하므로 즉시 해결이 필요합니다.\n"
+        yield "- P2 이슈는 품질 향상을 위해 조속히 개선을 권장합니다.\n"
+        yield "- P3 이슈는 점진적으로 개선하면 됩니다.\n\n"
+        yield f"**Generated by:** Enhanced Quality Checker v2.0  \n"
+        yield f"**Report Date:** {date_str}\n"
+
+    def write_report(self, report_path: Path, store: IssueStore, md_files: List[Path],
+                     summary: Optional[Dict] = None, graph: Optional[GraphMetrics] = None):
+        """보고서를 파일로 바로 스트리밍"""
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.writelines(self.iter_report(store, md_files, summary, graph))
+
+    def generate_report(self, store: IssueStore, md_files: List[Path],
+                        graph: Optional[GraphMetrics] = None) -> str:
+        """마크다운 보고서 생성"""
+        return ''.join(self.iter_report(store, md_files, graph=graph))
+
+def report_path_for(vault_path: Path) -> Path:
+    return vault_path / f"Quality_Report_{datetime.now().strftime('%Y-%m-%d')}.md"
+
+
+def analyze_graph(checker: QualityChecker, link_graph: LinkGraph,
+                  analyzer: GraphAnalyzer) -> GraphMetrics:
+    """링크 그래프 분석 (바뀐 연결 요소만 재계산) → 체커 점수에 반영"""
+    graph = analyzer.analyze(link_graph)
+    analyzer.save()
+    checker.use_graph(graph)
+    return graph
+
+
+def watch_vault(checker: QualityChecker, vault_path: Path,
+                results: Dict[Path, Tuple[int, List[Dict]]],
+                cache: Optional[QualityCache] = None, debounce: float = 0.3,
+                link_graph: Optional[LinkGraph] = None,
+                analyzer: Optional[GraphAnalyzer] = None):
+    """
+    파일 변경 감시 → 바뀐 노트만 재검증 → 보고서 다시 쓰기 (Ctrl+C로 종료)
+    results: 노트별 (점수, 이슈) - 메모리에 유지하며 갱신
+    link_graph가 있으면 바뀐 노트만 그래프에 반영 후 그래프 분석도 갱신
+    """
+    watcher = VaultWatcher(vault_path, debounce=debounce)
+    written = {report_path_for(vault_path)}  # 직접 쓴 보고서는 무시
+
+    print(f"\n👀 Watching for changes ({watcher.backend}) - Ctrl+C로 종료")
+
+    with watcher:
+        try:
+            for changed, deleted in watcher.batches():
+                changed -= written
+                deleted -= written
+                if not (changed or deleted):
+                    continue
+
+                started = time.perf_counter()
+
+                for file_path in deleted:
+                    if results.pop(file_path, None) is not None:
+                        print(f"  🗑️  {file_path.name}")
+
+                for file_path in sorted(changed):
+                    try:
+                        score, issues, stamp = checker.check_note_stamped(file_path)
+                    except (OSError, UnicodeDecodeError) as e:
+                        print(f"  ⚠️  {file_path.name}: {e}")
+                        continue
+                    results[file_path] = (score, issues)
+                    if cache and stamp is not None and not timed_out(issues):
+                        cache.store(file_path, score, issues, stamp)
+                    print(f"  ✏️  {file_path.name}: {score}점 (이슈 {len(issues)}개)")
+
+                if cache:
+                    cache.save(prune=False)
+
+                graph = None
+                if link_graph is not None:
+                    for file_path in deleted:
+                        link_graph.remove_file(file_path)
+                    for file_path in changed:
+                        try:
+                            link_graph.update_file(file_path)
+                        except OSError:
+                            continue
+                    link_graph.save()
+                    graph = analyze_graph(checker, link_graph, analyzer)
+
+                # 집계는 메모리의 결과로 다시 계산 (파일 재검증 없음)
+                store = IssueStore()
+                for file_path, (score, issues) in results.items():
+                    store.add(file_path.name, *checker.with_graph(file_path, score, issues))
+
+                report_path = report_path_for(vault_path)
+                written.add(report_path)
+                checker.write_report(report_path, store, list(results), graph=graph)
+
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"🔄 Report updated: {report_path.name} ({elapsed:.0f} ms)")
+        except KeyboardInterrupt:
+            print("\n👋 Watch stopped")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Enhanced Quality Checker for Obsidian RSI")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="병렬 워커 수 (0 = CPU 코어 수, 기본 1)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="결과 캐시 사용 안 함 (전체 재검증)")
+    parser.add_argument('--watch', action='store_true',
+                        help="검증 후 종료하지 않고 변경된 노트만 재검증 (watchdog 또는 폴링)")
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help="watch 모드에서 연속 저장을 묶는 대기 시간 (초, 기본 0.3)")
+    parser.add_argument('--profile', nargs='?', const='quality_profile.json', metavar='FILE',
+                        help="규칙별 시간 측정 → .rsi_cache/FILE (JSON) + 보고서 Performance 섹션 "
+                             "(캐시 없이 직렬 실행)")
+    parser.add_argument('--time-budget', type=float, default=FILE_TIME_BUDGET, metavar='SEC',
+                        help=f"노트 하나의 분석 시간 예산 (초과 시 P3 '분석 시간 초과', "
+                             f"0 = 제한 없음, 기본 {FILE_TIME_BUDGET:g})")
+    parser.add_argument('--no-graph', action='store_true',
+                        help="링크 그래프 분석 생략 (백링크/고립 클러스터/끊어진 링크)")
+    return parser.parse_args()
 
 
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
+
     print("="*60)
     print("Enhanced Quality Checker for Obsidian RSI v2.0")
     print("="*60)
@@ -522,88 +558,99 @@ def main():
     print(f"🔍 Found {len(md_files)} markdown files")
 
     # 품질 체커 초기화
-    checker = QualityChecker(vault_path)
+    checker = QualityChecker(vault_path, time_budget=args.time_budget)
+
+    # 규칙별 시간 측정: 모든 노트를 이 프로세스에서 실제로 검증해야 하므로 캐시/병렬 끔
+    if args.profile:
+        checker.enable_profiling()
+        jobs = 1
+
+    # 결과 캐시 (--no-cache로 비활성화)
+    cache = None
+    if not args.no_cache and not args.profile:
+        cache = QualityCache(vault_path / CACHE_DIR / QUALITY_CACHE_FILE,
+                             checker.fingerprint(), root=vault_path)
+
+    # 링크 그래프 분석 (연결 요소, PageRank, 브리지)
+    link_graph = analyzer = graph = None
+    if not args.no_graph:
+        link_graph = LinkGraph(vault_path)
+        analyzer = GraphAnalyzer(vault_path / CACHE_DIR / "graph_metrics.pickle")
+        link_graph.refresh()
+        graph = analyze_graph(checker, link_graph, analyzer)
+        print(f"🕸️  Link graph: {len(graph.nodes)} notes, {graph.edge_count} links, "
+              f"{len(graph.components)} components ({graph.recomputed} recomputed)")
 
     # 전체 검증
-    all_issues = []
-    scores = {}
+    print(f"\n🔎 Checking notes... (jobs: {jobs})")
 
-    print("\n🔎 Checking notes...")
+    results = {} if args.watch else None
+    store = checker.check_vault(md_files, workers=jobs, cache=cache, keep=results)
 
-    for file_path in md_files:
-        score, issues = checker.check_note(file_path)
-
-        if issues:
-            all_issues.extend(issues)
-            scores[file_path.name] = score
+    if cache:
+        cache.save()
+        print(f"💾 Cache: {cache.hits} hit(s), {cache.misses} re-checked")
 
     print(f"✓ Checked {len(md_files)} files")
-    print(f"⚠️  Found {len(all_issues)} issues")
+    print(f"⚠️  Found {len(store)} issues")
+
+    if checker.profiler:
+        profile_path = vault_path / CACHE_DIR / args.profile
+        profile_path.parent.mkdir(parents=True, exist_ok=True)
+        checker.profiler.dump(profile_path)
+        print(f"⏱️  Profile saved: {profile_path}")
+        for name, stats in checker.profiler.ranked()[:5]:
+            print(f"  {name}: {stats.seconds * 1000:.1f} ms ({stats.calls} calls)")
+
+    # 터미널 출력 (집계는 보고서와 공유)
+    summary = checker.summarize(store)
+    scores = store.scores
 
-    # 터미널 출력
     print("\n" + "="*60)
     print("📊 Quality Statistics")
     print("="*60)
 
     if scores:
-        avg_score = sum(scores.values()) / len(scores)
-        print(f"\n평균 품질 점수: {avg_score:.1f}/100")
-
-        # 등급별 분포
-        excellent = sum(1 for s in scores.values() if s >= 90)
-        good = sum(1 for s in scores.values() if 75 <= s < 90)
-        fair = sum(1 for s in scores.values() if 60 <= s < 75)
-        poor = sum(1 for s in scores.values() if s < 60)
+        grades = summary['grades']
+        print(f"\n평균 품질 점수: {summary['avg_score']:.1f}/100")
 
         print(f"\n등급 분포:")
-        print(f"  Excellent (90-100): {excellent}개")
-        print(f"  Good (75-89): {good}개")
-        print(f"  Fair (60-74): {fair}개")
-        print(f"  Poor (0-59): {poor}개")
+        print(f"  Excellent (90-100): {grades['excellent']}개")
+        print(f"  Good (75-89): {grades['good']}개")
+        print(f"  Fair (60-74): {grades['fair']}개")
+        print(f"  Poor (0-59): {grades['poor']}개")
 
     # 우선순위별 이슈
-    if all_issues:
+    if len(store):
+        priorities = summary['priorities']
         print(f"\n우선순위별 이슈:")
-        p1_count = sum(1 for i in all_issues if i['priority'] == 'P1')
-        p2_count = sum(1 for i in all_issues if i['priority'] == 'P2')
-        p3_count = sum(1 for i in all_issues if i['priority'] == 'P3')
-
-        print(f"  P1 (Critical): {p1_count}개")
-        print(f"  P2 (Important): {p2_count}개")
-        print(f"  P3 (Nice-to-have): {p3_count}개")
-
-        # 카테고리별 이슈
-        categories = Counter(i['category'] for i in all_issues)
+        print(f"  P1 (Critical): {priorities['P1']}개")
+        print(f"  P2 (Important): {priorities['P2']}개")
+        print(f"  P3 (Nice-to-have): {priorities['P3']}개")
 
         print(f"\n카테고리별 이슈 (Top 5):")
-        for category, count in categories.most_common(5):
+        for category, count in summary['categories'].most_common(5):
             print(f"  {category}: {count}개")
 
     # 낮은 점수 파일
     if scores:
         print(f"\n🔴 개선 필요 파일 (점수 < 70):")
-        low_scores = [(name, score) for name, score in scores.items() if score < 70]
-        low_scores.sort(key=lambda x: x[1])
 
-        if low_scores:
-            for name, score in low_scores[:10]:
+        if summary['low_scores']:
+            for name, score in summary['low_scores']:
                 print(f"  {name}: {score:.0f}점")
         else:
             print("  없음 - 모든 파일이 70점 이상입니다! ✅")
 
-    # 보고서 생성
+    # 보고서 생성 (파일로 스트리밍)
     print("\n" + "="*60)
     print("📄 Generating Report...")
     print("="*60)
 
-    report_content = checker.generate_report(all_issues, scores, md_files)
-    
-    # 파일 저장
-    report_filename = f"Quality_Report_{datetime.now().strftime('%Y-%m-%d')}.md"
-    report_path = vault_path / report_filename
-    
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+    report_path = report_path_for(vault_path)
+    report_filename = report_path.name
+
+    checker.write_report(report_path, store, md_files, summary, graph)
     
     print(f"\n✅ Report saved: {report_filename}")
     print(f"📍 Location: {report_path}")
@@ -612,6 +659,15 @@ def main():
     print("✨ Quality check completed!")
     print("="*60)
 
+    if args.watch:
+        watch_vault(checker, vault_path, results, cache, debounce=args.debounce,
+                    link_graph=link_graph, analyzer=analyzer)
+
+    if cache:
+        cache.close()
+    if link_graph:
+        link_graph.close()
+
 
 if __name__ == "__main__":
     main()
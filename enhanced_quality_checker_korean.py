@@ -6,10 +6,14 @@ BrainTwin Vault 품질 검사 도구 (한글 보고서)
 """
 
 import os
-import re
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict
+
+from note_parser import parse_note
+from quality_cache import CACHE_DIR
+from quality_rules import RuleEngine, PRIORITY_PENALTY, load_invariant_rules
+from enhanced_quality_checker import CHECKER_VERSION
 
 class QualityChecker:
     """노트 품질을 검사하는 메인 클래스"""
@@ -19,6 +23,9 @@ class QualityChecker:
         self.invariants_path = Path(invariants_path)
         self.issues = []
         self.file_scores = {}
+        self.engine = RuleEngine(load_invariant_rules(
+            self.invariants_path, "korean",
+            cache_dir=self.vault_path / CACHE_DIR, version=CHECKER_VERSION))
         
     def check_all_notes(self) -> Dict:
         """모든 노트 파일 검사"""
@@ -88,201 +95,8 @@ class QualityChecker:
         return results
     
     def check_file(self, file_path: Path, content: str) -> List[Dict]:
-        """개별 파일 검사"""
-        issues = []
-        
-        # 1. 파일명 검사
-        issues.extend(self.check_filename(file_path))
-        
-        # 2. 링크 검사
-        issues.extend(self.check_links(file_path, content))
-        
-        # 3. 섹션 검사
-        issues.extend(self.check_sections(file_path, content))
-        
-        # 4. 수학식 검사
-        issues.extend(self.check_math_requirement(file_path, content))
-        
-        # 5. RAG 최적화 검사
-        issues.extend(self.check_rag_optimization(file_path, content))
-        
-        # 6. 명확성 검사
-        issues.extend(self.check_clarity(file_path, content))
-        
-        return issues
-    
-    def check_filename(self, file_path: Path) -> List[Dict]:
-        """파일명 규칙 검사"""
-        issues = []
-        filename = file_path.name
-        
-        # Untitled 파일 체크
-        if 'untitled' in filename.lower():
-            issues.append({
-                'priority': 'P2',
-                'category': '파일명',
-                'issue': 'Untitled 파일',
-                'suggestion': '48시간 내 의미있는 이름으로 변경 필요'
-            })
-        
-        return issues
-    
-    def check_links(self, file_path: Path, content: str) -> List[Dict]:
-        """링크 구조 검사"""
-        issues = []
-        
-        # 메타 문서 제외 (숫자로 시작하는 파일, README 등)
-        filename = file_path.name.lower()
-        meta_patterns = ['0_', '1_', '2_', '3_', 'readme', 'changelog', 
-                        'license', 'gitignore', 'index', 'log', 'guide', 'agenda']
-        is_meta = any(pattern in filename for pattern in meta_patterns)
-        
-        if is_meta:
-            return issues
-        
-        # 링크 패턴: [[...]] 또는 [...](...) 
-        wiki_links = re.findall(r'\[\[([^\]]+)\]\]', content)
-        md_links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
-        
-        total_links = len(wiki_links) + len(md_links)
-        
-        if total_links == 0:
-            issues.append({
-                'priority': 'P1',
-                'category': '링크',
-                'issue': '고아 노트 (링크 없음)',
-                'suggestion': '최소 1개 이상의 관련 개념 링크 추가'
-            })
-        
-        return issues
-    
-    def check_sections(self, file_path: Path, content: str) -> List[Dict]:
-        """섹션 구조 검사"""
-        issues = []
-        
-        # "## 핵심 내용" 섹션 체크
-        core_section_match = re.search(r'^##\s+핵심\s*내용\s*$(.*?)(?=^##|\Z)', 
-                                      content, re.MULTILINE | re.DOTALL)
-        
-        if core_section_match:
-            section_content = core_section_match.group(1).strip()
-            if len(section_content) < 10:  # 거의 비어있음
-                issues.append({
-                    'priority': 'P1',
-                    'category': '빈 섹션',
-                    'issue': '\'핵심 내용\' 섹션이 비어있음',
-                    'suggestion': '핵심 내용 작성 필요'
-                })
-        
-        return issues
-    
-    def check_math_requirement(self, file_path: Path, content: str) -> List[Dict]:
-        """수학식 요구사항 검사 (BrainTwin 특화)"""
-        issues = []
-        
-        filename = file_path.name.lower()
-        
-        # 메타 파일 제외
-        meta_patterns = ['0_', '1_', '2_', '3_', '_',
-                        'index', 'log', 'readme', 'guide', 'agenda']
-        if any(pattern in filename for pattern in meta_patterns):
-            return issues
-        
-        # 개념 노트 판별
-        concept_keywords = ['rank', 'nullity', '군론', '대칭성',
-                           '그래프', '중심성', '정리', 'theorem',
-                           '개념', '이론', 'theory', '베이즈', 'bayes',
-                           'phase', 'transition', '내쉬', 'nash',
-                           '포트폴리오', 'portfolio', '행동경제',
-                           '극값', '엔트로피', 'entropy', '최적화']
-        
-        is_concept_note = (
-            any(kw in filename for kw in concept_keywords) or
-            re.search(r'^##\s+(개념|정의)', content, re.MULTILINE)
-        )
-        
-        if not is_concept_note:
-            return issues
-        
-        # 수학식 체크
-        has_inline = content.count('$') >= 2  # $...$
-        has_block = '$$' in content            # $$...$$
-        has_math = has_inline or has_block
-        
-        if not has_math:
-            issues.append({
-                'priority': 'P1',
-                'category': '수학식',
-                'issue': '개념 노트에 수학식 없음',
-                'suggestion': 'LaTeX 수학식 추가: $E=mc^2$ 또는 $$\\int f(x)dx$$'
-            })
-        
-        return issues
-    
-    def check_rag_optimization(self, file_path: Path, content: str) -> List[Dict]:
-        """RAG 최적화 검사"""
-        issues = []
-        
-        char_count = len(content)
-        section_count = len(re.findall(r'^##\s+', content, re.MULTILINE))
-        
-        # 메타 파일 제외
-        filename = file_path.name.lower()
-        if any(p in filename for p in ['0_', '1_', '2_', '3_', 'readme', 'changelog']):
-            return issues
-        
-        # 길이 체크
-        if char_count < 1000:
-            issues.append({
-                'priority': 'P3',
-                'category': 'RAG 최적화',
-                'issue': f'노트가 짧음 ({char_count}자)',
-                'suggestion': '1,500-2,000자 권장'
-            })
-        elif char_count > 3000:
-            issues.append({
-                'priority': 'P3',
-                'category': 'RAG 최적화',
-                'issue': f'노트가 김 ({char_count}자)',
-                'suggestion': '2,000자 이하 권장 (V3의 역설 참고)'
-            })
-        
-        # 섹션 수 체크
-        if section_count > 0:
-            if section_count < 5:
-                issues.append({
-                    'priority': 'P3',
-                    'category': 'RAG 최적화',
-                    'issue': f'섹션 부족 ({section_count}개)',
-                    'suggestion': '5-8개 섹션 권장'
-                })
-            elif section_count > 10:
-                issues.append({
-                    'priority': 'P3',
-                    'category': 'RAG 최적화',
-                    'issue': f'섹션 과다 ({section_count}개)',
-                    'suggestion': '5-8개 섹션 권장'
-                })
-        
-        return issues
-    
-    def check_clarity(self, file_path: Path, content: str) -> List[Dict]:
-        """명확성 검사"""
-        issues = []
-        
-        # 모호한 표현 체크
-        vague_terms = ['등등', '등과 같은', '여러', '다양한']
-        found_vague = [term for term in vague_terms if term in content]
-        
-        if found_vague:
-            issues.append({
-                'priority': 'P2',
-                'category': '명확성',
-                'issue': f'모호한 표현 발견: {", ".join(found_vague)}',
-                'suggestion': '구체적으로 명시 필요'
-            })
-        
-        return issues
+        """개별 파일 검사 (korean 규칙 프로필 - quality_rules.py)"""
+        return self.engine.run(parse_note(content), file_path)
     
     def calculate_score(self, content: str, issues: List[Dict], file_path: Path) -> float:
         """품질 점수 계산 (0-100)"""
@@ -293,13 +107,7 @@ class QualityChecker:
             score -= 10
         
         # 이슈별 감점
-        for issue in issues:
-            if issue['priority'] == 'P1':
-                score -= 15
-            elif issue['priority'] == 'P2':
-                score -= 5
-            elif issue['priority'] == 'P3':
-                score -= 2
+        score -= sum(PRIORITY_PENALTY.get(issue['priority'], 0) for issue in issues)
         
         return max(0, score)
     
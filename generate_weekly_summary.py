@@ -1,171 +1,56 @@
 #!/usr/bin/env python3
 """
 Weekly Summary Generator for Auto RSI (인코딩 자동 감지)
+일별 지표는 .rsi_cache/rsi_log.sqlite (날짜 인덱스)에서 기간 쿼리로 조회
+
+사용법:
+    python generate_weekly_summary.py                        # 지난 주 (월~일)
+    python generate_weekly_summary.py --week 2026-W02
+    python generate_weekly_summary.py --month 2026-01
+    python generate_weekly_summary.py --range 2026-01-08 2026-01-14
+    python generate_weekly_summary.py --from 2026-01-01 --to 2026-03-31 [-j 4]   # 주차별 일괄 생성
 """
 
-import re
+import json
+import hashlib
+import argparse
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import List, Dict, Tuple
+
+from note_reader import read_text
+from quality_cache import CACHE_DIR, file_digest
+from rsi_log import RsiLogIndex, parse_log_text, PARSER_VERSION
+from rsi_trends import TrendCache, TRENDS_CACHE_FILE, sparkline
+
+SUMMARY_VERSION = 2                      # 보고서 형식이 바뀌면 올림 → backfill 전체 재생성
+SUMMARY_MANIFEST = "weekly_summaries.json"  # 출력 파일명 → 원본 해시
+TREND_SPARK_DAYS = 60                    # 추세선에 보여줄 최근 기록 일수
+TREND_RECENT_WEEKS = 8                   # 주간 변화 표에 보여줄 최근 주 수
 
 def read_file_with_fallback_encoding(file_path):
-    """여러 인코딩을 시도하여 파일 읽기"""
-    encodings = ['utf-8', 'cp949', 'euc-kr', 'utf-16']
-    
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-                print(f"✓ 파일 인코딩: {encoding}")
-                return content
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    
-    # 모두 실패하면 바이너리로 읽고 에러 무시
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-        print(f"⚠️ 인코딩 자동 감지 실패, UTF-8 (에러 무시)로 읽음")
-        return content
+    """
+    파일 읽기 (note_reader.read_text - 1회 읽기, 증분 검증으로 인코딩 판별, 큰 파일은 mmap)
+    판별한 인코딩은 .rsi_cache/encodings.json에 기억 → 파일이 그대로면 다음 실행에서 판별 생략
+    분석 상한을 넘는 로그는 앞부분만 읽음
+    """
+    source = read_text(file_path)
+    print(f"✓ 파일 인코딩: {source.encoding}" + (" (캐시)" if source.from_cache else ""))
+    if source.truncated:
+        print(f"⚠️ 파일이 너무 큼 ({source.size / (1 << 20):.1f}MB) - "
+              f"앞 {source.analyzed / (1 << 20):.1f}MB만 분석")
+    return source.text
 
 
 def parse_rsi_log(log_file_path):
     """
-    0_Long_Term_RSI_Log.md 파일 파싱
+    0_Long_Term_RSI_Log.md 파일 파싱 (전체, 체크포인트 없이 - 증분 파싱은 rsi_log.RsiLogIndex)
     """
     content = read_file_with_fallback_encoding(log_file_path)
-    
-    # Day별 섹션 추출 (## Day X 패턴)
-    day_sections = re.split(r'^##\s+Day\s+(\d+)', content, flags=re.MULTILINE)
-    
-    daily_data = []
-    
-    # day_sections는 [헤더, day_num1, content1, day_num2, content2, ...] 형태
-    for i in range(1, len(day_sections), 2):
-        if i+1 < len(day_sections):
-            day_num = day_sections[i]
-            day_content = day_sections[i+1]
-            
-            # 날짜 추출 (여러 패턴 시도)
-            date_patterns = [
-                r'\*\*날짜:\*\*\s*(\d{4}-\d{2}-\d{2})',  # **날짜:** 2026-01-08
-                r'날짜:\s*(\d{4}-\d{2}-\d{2})',           # 날짜: 2026-01-08
-                r'(\d{4}-\d{2}-\d{2})',                   # 2026-01-08
-            ]
-            
-            date = None
-            for pattern in date_patterns:
-                match = re.search(pattern, day_content)
-                if match:
-                    date = match.group(1)
-                    break
-            
-            if not date:
-                print(f"⚠️ Day {day_num}: 날짜를 찾을 수 없음")
-                continue
-            
-            # AI 제안 수 추출 (다양한 형식 지원)
-            ai_count = 0
-            ai_patterns = [
-                # 패턴 1: **AI 제안 수:** 5개 (콜론이 별표 안)
-                r'\*\*AI\s*제안\s*수:\*\*\s*(\d+)개?',
-                # 패턴 2: **AI 제안 수**: 5개 (콜론이 별표 밖)
-                r'\*\*AI\s*제안\s*수\*\*:\s*(\d+)개?',
-                # 패턴 3: AI 제안 수: 5개 (별표 없음)
-                r'AI\s*제안\s*수:\s*(\d+)개?',
-                # 패턴 4: **AI 제안 수:**\n-14개 (줄바꿈 + 하이픈)
-                r'\*\*AI\s*제안\s*수:\*\*\s*\n\s*-?\s*(\d+)개?',
-                # 패턴 5: AI 제안 수:\n-14개
-                r'AI\s*제안\s*수:\s*\n\s*-?\s*(\d+)개?',
-            ]
-            
-            for pattern in ai_patterns:
-                match = re.search(pattern, day_content, re.MULTILINE)
-                if match:
-                    ai_count = int(match.group(1))
-                    break
-            
-            # ===== "실행 여부" 또는 "실행" 섹션만 파싱 =====
-            
-            # 먼저 "**실행 여부:**" 섹션 확인 (Day 1-4, 6)
-            execution_status = re.search(
-                r'\*\*실행\s*여부:\*\*\s*\n?(.*?)(?:\n\*\*|\Z)',
-                day_content,
-                re.DOTALL | re.MULTILINE
-            )
-            
-            # 별표 없는 "실행 여부:" 패턴도 확인 (Day 5)
-            if not execution_status:
-                execution_status = re.search(
-                    r'실행\s*여부:\s*(.+?)(?:\n[^\n]*:|메모:|\Z)',
-                    day_content,
-                    re.DOTALL | re.MULTILINE
-                )
-            
-            if execution_status:
-                status_text = execution_status.group(1).strip()
-                
-                # Day 6 형식: 라인별 ✅ 체크
-                completed_lines = [line for line in status_text.split('\n') if '✅' in line and line.strip().startswith('-')]
-                
-                if completed_lines:
-                    # Day 6: 라인별 ✅ 개수
-                    completed = len(completed_lines)
-                    pending = 0
-                else:
-                    # Day 1-5: 텍스트에서 개수 추출
-                    completed = 0
-                    
-                    if '완료' in status_text or '실행' in status_text:
-                        # 전략 1: "N개" 패턴 먼저 찾기 (가장 확실)
-                        num_match = re.search(r'(\d+)\s*개', status_text)
-                        if num_match:
-                            completed = int(num_match.group(1))
-                        
-                        # 전략 2: 제안 번호 카운트 (#1, #2, ...)
-                        if completed == 0:
-                            suggestion_nums = re.findall(r'#(\d+)', status_text)
-                            if len(suggestion_nums) >= 2:  # 2개 이상만
-                                completed = len(suggestion_nums)
-                        
-                        # 전략 3: ✅만 있으면 1개
-                        if completed == 0 and '✅' in status_text:
-                            completed = 1
-                    
-                    pending = 0
-            
-            else:
-                # Day 7-10: "**실행:**" 섹션
-                execution_section = re.search(
-                    r'\*\*실행:\*\*\s*\n(.*?)(?:\n\*\*|\Z)',
-                    day_content,
-                    re.DOTALL | re.MULTILINE
-                )
-                
-                if execution_section:
-                    execution_text = execution_section.group(1)
-                    completed_lines = [line for line in execution_text.split('\n') if '✅' in line and line.strip().startswith('-')]
-                    pending_lines = [line for line in execution_text.split('\n') if '⏸️' in line and line.strip().startswith('-')]
-                    
-                    completed = len(completed_lines)
-                    pending = len(pending_lines)
-                else:
-                    completed = 0
-                    pending = 0
-            
-            # 실행 여부
-            executed = completed > 0
-            
-            daily_data.append({
-                'day': int(day_num),
-                'date': date,
-                'ai_suggestions': ai_count,
-                'completed': completed,
-                'pending': pending,
-                'executed': executed,
-                'content': day_content[:300]  # 처음 300자만 저장
-            })
-    
-    return daily_data
+    return parse_log_text(content)
 
 
 def calculate_weekly_stats(daily_data):
@@ -202,12 +87,51 @@ def calculate_weekly_stats(daily_data):
     }
 
 
-def generate_weekly_summary(daily_data, stats, output_path):
+def trend_section(trends):
+    """보고서용 장기 추세 섹션 (rsi_trends.TrendMetrics - 기간 끝까지의 전체 기록)"""
+    recent = slice(-TREND_SPARK_DAYS, None)
+    shown = len(trends.dates[recent])
+
+    section = "\n---\n\n## 📉 장기 추세 (전체 기록)\n\n"
+    section += f"**기록 범위:** {trends.dates[0]} ~ {trends.dates[-1]} ({len(trends.dates)}일)  \n"
+    section += f"**추세선 (최근 {shown}일):**\n"
+    section += "```\n"
+    section += f"AI 제안 수        {sparkline(trends.suggestions[recent])}\n"
+    section += f"{trends.window}일 이동 평균     {sparkline(trends.rolling_suggestions[recent])}\n"
+    section += f"완료율 EWMA       {sparkline(trends.completion_ewma[recent])}\n"
+    section += "```\n\n"
+
+    section += "| 지표 | 값 |\n|------|-----|\n"
+    section += f"| 제안 수 회귀 기울기 | {trends.slope:+.2f}개/일 |\n"
+    section += f"| {trends.window}일 이동 평균 (최근) | {trends.rolling_suggestions[-1]:.1f}개 |\n"
+    section += f"| 완료율 EWMA (α={trends.alpha}) | {trends.completion_ewma[-1] * 100:.0f}% |\n\n"
+
+    if trends.slope < 0:
+        section += "→ 전체 기록에서 제안 수가 줄어드는 추세 (품질 향상)\n"
+    elif trends.slope > 0:
+        section += "→ 전체 기록에서 제안 수가 늘어나는 추세 (새 문제 발견 / 기준 강화)\n"
+
+    section += "\n### 주간 변화 (전주 대비)\n\n"
+    section += "| 주차 | 일수 | 제안 | 완료 | 제안 Δ | 완료 Δ |\n"
+    section += "|------|-----:|-----:|-----:|------:|------:|\n"
+
+    def delta(value):
+        return f"{value:+d}" if value is not None else "-"
+
+    for week in trends.weekly[-TREND_RECENT_WEEKS:]:
+        section += (f"| {week['week']} | {week['days']} | {week['suggestions']} | "
+                    f"{week['completed']} | {delta(week['suggestions_delta'])} | "
+                    f"{delta(week['completed_delta'])} |\n")
+    return section
+
+
+def generate_weekly_summary(daily_data, stats, output_path, title="Weekly Summary", trends=None):
     """
-    주간 요약 보고서 생성
+    주간 요약 보고서 생성 (title: 월간/기간 요약이면 'Monthly Summary' 등)
+    trends가 있으면 기간 끝까지의 장기 추세 섹션 추가
     """
     
-    report = f"""# 📊 Weekly Summary - Auto RSI
+    report = f"""# 📊 {title} - Auto RSI
 
 **생성 일시:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
 **기간:** {stats['date_range']}  
@@ -247,6 +171,9 @@ def generate_weekly_summary(daily_data, stats, output_path):
     else:
         report += "➡️ **안정적**: 제안 수가 일정하게 유지되고 있습니다.\n"
     
+    if trends is not None:
+        report += trend_section(trends)
+    
     report += "\n---\n\n## 📅 일별 상세 내역\n\n"
     
     for day_data in daily_data:
@@ -283,10 +210,124 @@ def generate_weekly_summary(daily_data, stats, output_path):
     return output_path
 
 
+def group_by_week(daily_data) -> Dict[Tuple[int, int], List[Dict]]:
+    """일별 레코드 → ISO (연도, 주차)별 목록 (한 번 순회, 로그 순서 유지)"""
+    weeks = defaultdict(list)
+    for day in daily_data:
+        iso_year, week_num, _ = date.fromisoformat(day['date']).isocalendar()
+        weeks[(iso_year, week_num)].append(day)
+    return weeks
+
+
+def source_hash(daily_data, trends=None) -> str:
+    """주간 보고서의 원본 해시 (레코드 + 추세 + 파서/보고서 버전) - 생성 일시는 제외"""
+    payload = json.dumps([PARSER_VERSION, SUMMARY_VERSION, daily_data,
+                          asdict(trends) if trends is not None else None],
+                         ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def backfill(index, vault_path, start, end, jobs=1, trend_cache=None):
+    """
+    start~end가 걸친 모든 ISO 주차의 Weekly_Summary_YYYY-Www.md 생성
+    로그 조회 1회 → 주차별 그룹 → 출력이 있고 원본 해시가 같은 주는 생략
+    trend_cache가 있으면 각 주 보고서에 그 주 일요일까지의 장기 추세 포함
+    jobs > 1이면 보고서 쓰기를 스레드로 분배
+    """
+    # 주 단위로 확장 (시작 주 월요일 ~ 끝 주 일요일) → 경계 주도 온전한 보고서
+    first = start - timedelta(days=start.weekday())
+    last = end + timedelta(days=6 - end.weekday())
+    history = index.records(None, last)
+    weeks = group_by_week(r for r in history if r['date'] >= first.isoformat())
+
+    manifest_path = Path(vault_path) / CACHE_DIR / SUMMARY_MANIFEST
+    manifest = {}
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            pass  # 손상된 manifest → 전부 다시 생성
+
+    jobs_todo = []
+    skipped = 0
+    for (iso_year, week_num), daily_data in sorted(weeks.items()):
+        output_file = Path(vault_path) / f"Weekly_Summary_{iso_year}-W{week_num:02d}.md"
+        trends = None
+        if trend_cache is not None:
+            trends = trend_cache.trends(history, date.fromisocalendar(iso_year, week_num, 7))
+        digest = source_hash(daily_data, trends)
+        if output_file.exists() and manifest.get(output_file.name) == digest:
+            skipped += 1
+            continue
+        jobs_todo.append((daily_data, output_file, digest, trends))
+
+    def write(job):
+        daily_data, output_file, _, trends = job
+        return generate_weekly_summary(daily_data, calculate_weekly_stats(daily_data), output_file,
+                                       trends=trends)
+
+    if jobs > 1 and len(jobs_todo) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            written = list(pool.map(write, jobs_todo))
+    else:
+        written = [write(job) for job in jobs_todo]
+
+    if jobs_todo:
+        for _, output_file, digest, _ in jobs_todo:
+            manifest[output_file.name] = digest
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True),
+                                 encoding='utf-8')
+
+    return {'weeks': len(weeks), 'written': written, 'skipped': skipped}
+
+
+def summary_period(args, today):
+    """
+    요약 기간 → (시작일, 종료일, 제목, 출력 파일명)
+    옵션이 없으면 지난 주 (월~일)
+    """
+    if args.week:
+        year, week = args.week.upper().split('-W')
+        start = date.fromisocalendar(int(year), int(week), 1)
+    elif args.month:
+        year, month = (int(x) for x in args.month.split('-'))
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return start, end, "Monthly Summary", f"Monthly_Summary_{year}-{month:02d}.md"
+    elif args.range:
+        start, end = (date.fromisoformat(x) for x in args.range)
+        return start, end, "Summary", f"Summary_{start}_{end}.md"
+    else:
+        this_monday = today - timedelta(days=today.weekday())  # 0=월요일
+        start = this_monday - timedelta(days=7)
+
+    # 파일명: Weekly_Summary_YYYY-WW.md (ISO 주차 번호 포함)
+    iso_year, week_num, _ = start.isocalendar()
+    return (start, start + timedelta(days=6), "Weekly Summary",
+            f"Weekly_Summary_{iso_year}-W{week_num:02d}.md")
+
+
 def main():
     """
     메인 실행 함수
     """
+    parser = argparse.ArgumentParser(description="Weekly Summary Generator for Auto RSI")
+    period = parser.add_mutually_exclusive_group()
+    period.add_argument('--week', metavar='YYYY-Www', help="ISO 주차 요약 (예: 2026-W02)")
+    period.add_argument('--month', metavar='YYYY-MM', help="월간 요약 (예: 2026-01)")
+    period.add_argument('--range', nargs=2, metavar=('FROM', 'TO'),
+                        help="기간 요약 (YYYY-MM-DD YYYY-MM-DD, 양 끝 포함)")
+    period.add_argument('--from', dest='backfill_from', metavar='YYYY-MM-DD',
+                        help="이 날짜부터 --to까지 주차별 Weekly Summary 일괄 생성")
+    parser.add_argument('--to', dest='backfill_to', metavar='YYYY-MM-DD',
+                        help="--from 끝 날짜 (기본: 오늘)")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="--from: 보고서 쓰기 병렬 스레드 수 (기본 1)")
+    args = parser.parse_args()
+    if args.backfill_to and not args.backfill_from:
+        parser.error("--to는 --from과 함께 사용")
+
     print("="*60)
     print("Weekly Summary Generator for Auto RSI")
     print("="*60)
@@ -302,38 +343,52 @@ def main():
     print(f"\n📂 Vault: {vault_path}")
     print(f"📄 Log file: {log_file.name}")
     
-    # 지난 주 계산 (월~일)
-    today = datetime.now()
-    days_since_monday = today.weekday()  # 0=월요일
-    this_monday = today - timedelta(days=days_since_monday)
-    last_monday = this_monday - timedelta(days=7)
-    last_sunday = last_monday + timedelta(days=6)
-    
-    print(f"\n📅 지난 주 범위: {last_monday.strftime('%Y-%m-%d')} ~ {last_sunday.strftime('%Y-%m-%d')}")
-    
-    # 로그 파싱
-    print("\n📊 Parsing RSI log...")
-    all_daily_data = parse_rsi_log(log_file)
+    # 장기 추세는 로그 해시 + 기준일별 캐시 (로그가 그대로면 다시 계산하지 않음)
+    trend_cache = TrendCache(vault_path / CACHE_DIR / TRENDS_CACHE_FILE, file_digest(log_file))
     
-    if not all_daily_data:
-        print("❌ No data found in log file.")
+    if args.backfill_from:
+        start = date.fromisoformat(args.backfill_from)
+        end = date.fromisoformat(args.backfill_to) if args.backfill_to else date.today()
+        print(f"\n📅 Backfill 범위: {start} ~ {end}")
+
+        print("\n📊 Parsing RSI log...")
+        with RsiLogIndex(log_file) as index:
+            update = index.update()
+            print(f"✓ Day 섹션 {update['sections']}개 중 {update['parsed']}개 파싱 ({update['mode']})")
+            result = backfill(index, vault_path, start, end, args.jobs, trend_cache)
+        trend_cache.save()
+
+        print(f"\n📝 {result['weeks']}주 중 {len(result['written'])}주 생성, "
+              f"{result['skipped']}주는 변경 없음 (생략)")
+        for output_file in result['written']:
+            print(f"  ✅ {Path(output_file).name}")
+        print("\n" + "="*60)
+        print("✨ Weekly Summary backfill completed!")
+        print("="*60)
         return
+
+    start, end, title, output_name = summary_period(args, date.today())
+    print(f"\n📅 요약 범위: {start} ~ {end}")
     
-    # 지난 주 데이터만 필터링
-    daily_data = []
-    for day in all_daily_data:
-        day_date = datetime.strptime(day['date'], '%Y-%m-%d')
-        if last_monday <= day_date <= last_sunday:
-            daily_data.append(day)
+    # 로그 파싱 (새로 추가/수정된 Day 섹션만) → 날짜 인덱스로 기간 조회
+    print("\n📊 Parsing RSI log...")
+    with RsiLogIndex(log_file) as index:
+        update = index.update()
+        daily_data = index.records(start, end)
+        totals = index.totals() if not daily_data else None
+        history = index.records(None, end) if daily_data else []
+    print(f"✓ Day 섹션 {update['sections']}개 중 {update['parsed']}개 파싱 ({update['mode']})")
     
     if not daily_data:
-        print(f"❌ 지난 주 ({last_monday.strftime('%Y-%m-%d')} ~ {last_sunday.strftime('%Y-%m-%d')}) 데이터가 없습니다.")
-        print(f"\n전체 데이터: {len(all_daily_data)}일")
-        if all_daily_data:
-            print(f"범위: {all_daily_data[0]['date']} ~ {all_daily_data[-1]['date']}")
+        if not totals['days']:
+            print("❌ No data found in log file.")
+            return
+        print(f"❌ 요약 범위 ({start} ~ {end}) 데이터가 없습니다.")
+        print(f"\n전체 데이터: {totals['days']}일")
+        print(f"범위: {totals['first_date']} ~ {totals['last_date']}")
         return
     
-    print(f"✓ Found {len(daily_data)} days of data (지난 주)")
+    print(f"✓ Found {len(daily_data)} days of data ({start} ~ {end})")
     for day in daily_data[:5]:
         print(f"  - Day {day['day']}: {day['date']}, 제안 {day['ai_suggestions']}개, 완료 {day['completed']}개")
     
@@ -345,14 +400,16 @@ def main():
     print(f"✓ Total completed: {stats['total_completed']}")
     print(f"✓ Improvement trend: {stats['improvement_trend']:.1f} suggestions/day")
     
-    # 보고서 생성
-    print("\n📝 Generating weekly summary...")
+    trends = trend_cache.trends(history, end)
+    trend_cache.save()
+    print(f"✓ Long-term slope: {trends.slope:+.2f} suggestions/day "
+          f"({len(trends.dates)} days, 완료율 EWMA {trends.completion_ewma[-1] * 100:.0f}%)")
     
-    # 파일명: Weekly_Summary_YYYY-WW.md (주차 번호 포함)
-    week_num = last_monday.isocalendar()[1]
-    output_file = vault_path / f"Weekly_Summary_{last_monday.year}-W{week_num:02d}.md"
+    # 보고서 생성
+    print(f"\n📝 Generating {title.lower()}...")
     
-    generate_weekly_summary(daily_data, stats, output_file)
+    output_file = vault_path / output_name
+    generate_weekly_summary(daily_data, stats, output_file, title, trends)
     
     print(f"✅ Summary generated: {output_file.name}")
     print("\n" + "="*60)
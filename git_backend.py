@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Git Backends
+auto-commit이 쓰는 git 작업 (스테이징, 커밋, 스테이징된 diff, 브랜치, blob 읽기)을 백엔드로 분리
+- cli: 명령마다 git 프로세스 (항상 사용 가능, 다른 백엔드가 실패하면 여기로)
+- session: git cat-file --batch 프로세스 하나를 유지 (blob 읽기), 브랜치는 .git 파일에서
+- pygit2 / dulwich: 프로세스 없이 in-process (설치되어 있을 때만)
+"""
+
+import io
+import os
+import functools
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import pygit2
+except ImportError:  # 선택적 의존성
+    pygit2 = None
+
+try:
+    from dulwich import porcelain as dulwich_porcelain
+    from dulwich.object_store import tree_lookup_path
+    from dulwich.repo import Repo as DulwichRepo
+except ImportError:  # 선택적 의존성
+    dulwich_porcelain = None
+
+from git_changes import ChangeSet, FileChange
+from git_snapshot import read_branch
+from note_diff import read_cached_diff, scan_note_lines
+
+# in-process 커밋은 훅을 실행하지 않음 → 이런 훅이 있으면 CLI로 커밋
+COMMIT_HOOKS = ('pre-commit', 'prepare-commit-msg', 'commit-msg', 'post-commit')
+
+
+def run_cli(command, cwd, input_text=None, strip=True) -> Tuple[bool, str]:
+    """git 프로세스 한 번 실행 → (성공 여부, stdout 또는 stderr)"""
+    try:
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            input=input_text,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            check=True
+        )
+        return True, result.stdout.strip() if strip else result.stdout
+    except subprocess.CalledProcessError as e:
+        return False, e.stderr.strip()
+
+
+def _fallback(method):
+    """in-process 구현이 예외를 내면 같은 이름의 CliBackend 메서드로"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:  # 라이브러리마다 예외 타입이 다름
+            self.fallbacks.append(f"{method.__name__}: {e}")
+            return getattr(CliBackend, method.__name__)(self, *args, **kwargs)
+    return wrapper
+
+
+class CliBackend:
+    """명령마다 git 프로세스"""
+
+    name = 'cli'
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.fallbacks: List[str] = []   # CLI로 대신 처리한 작업 (원인 포함)
+
+    def run(self, command, cwd=None, input_text=None, strip=True) -> Tuple[bool, str]:
+        """그 외 git 명령 (status, check-ignore, push 등)"""
+        return run_cli(command, cwd or self.root, input_text, strip)
+
+    def stage(self, paths: List[str]) -> Tuple[bool, str]:
+        """경로만 한 번에 스테이징 (삭제된 경로는 인덱스에서 제거)"""
+        if not paths:
+            return True, ""
+        return self.run(['git', 'update-index', '--add', '--remove', '-z', '--stdin'],
+                        input_text='\0'.join(paths) + '\0')
+
+    def staged_changes(self) -> Optional[ChangeSet]:
+        """
+        HEAD 대비 인덱스 (이름 변경/복사 + 줄 수 + 노트 내용 변화)
+        diff 1회 출력을 읽는 대로 파싱 (patch 전체를 메모리에 올리지 않음)
+        """
+        with subprocess.Popen(['git', 'diff', '--cached', '-z', '-M', '-C', '--raw', '--numstat',
+                               '-p', '--no-color', '--no-ext-diff'],
+                              cwd=self.root, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            # 줄은 '\n'에서만 나눔 (노트 안의 '\r'은 내용 그대로)
+            change_set = read_cached_diff(io.TextIOWrapper(proc.stdout, encoding='utf-8',
+                                                           errors='replace', newline='\n'))
+        return change_set if proc.returncode == 0 else None
+
+    def commit(self, message: str) -> Tuple[bool, str]:
+        return self.run(['git', 'commit', '-m', message])
+
+    def branch(self) -> Optional[str]:
+        ok, output = self.run(['git', 'branch', '--show-current'])
+        return output if ok and output else None
+
+    def read_blob(self, path: str, rev: str = 'HEAD') -> Optional[bytes]:
+        """rev 시점의 파일 내용 (없으면 None), rev=''이면 인덱스(스테이징된 내용)"""
+        try:
+            result = subprocess.run(['git', 'cat-file', 'blob', f"{rev}:{path}"],
+                                    cwd=self.root, capture_output=True, check=True)
+        except subprocess.CalledProcessError:
+            return None
+        return result.stdout
+
+    def close(self):
+        pass
+
+
+class SessionBackend(CliBackend):
+    """
+    git cat-file --batch 프로세스 하나로 blob을 계속 읽음 (요청마다 왕복만)
+    브랜치는 .git/HEAD에서 바로 → 스테이징/커밋/diff만 프로세스를 띄움
+    """
+
+    name = 'session'
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._batch: Optional[subprocess.Popen] = None
+
+    def _process(self) -> subprocess.Popen:
+        if self._batch is None or self._batch.poll() is not None:
+            self._batch = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=self.root,
+                                           stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                           stderr=subprocess.DEVNULL)
+        return self._batch
+
+    def branch(self) -> Optional[str]:
+        return read_branch(self.root) or super().branch()
+
+    def read_blob(self, path: str, rev: str = 'HEAD') -> Optional[bytes]:
+        if '\n' in path:
+            return super().read_blob(path, rev)  # 줄 단위 프로토콜로 보낼 수 없음
+        proc = self._process()
+        proc.stdin.write(f"{rev}:{path}\n".encode('utf-8'))
+        proc.stdin.flush()
+        header = proc.stdout.readline().rstrip(b'\n')
+        # '<spec> missing' / '<spec> ambiguous' - spec에 공백이 있을 수 있으므로 끝으로 판단
+        if not header or header.endswith((b' missing', b' ambiguous')):
+            return None
+        _, kind, size = header.split()
+        data = proc.stdout.read(int(size))
+        proc.stdout.read(1)  # 내용 뒤의 '\n'
+        return data if kind == b'blob' else None
+
+    def close(self):
+        if self._batch is not None:
+            self._batch.stdin.close()
+            self._batch.wait()
+            self._batch = None
+
+
+def _has_commit_hooks(root: Path) -> bool:
+    hooks = root / '.git' / 'hooks'
+    return any((hooks / name).exists() for name in COMMIT_HOOKS)
+
+
+class Pygit2Backend(CliBackend):
+    """libgit2 (pygit2) in-process - 스테이징, diff, 커밋, 브랜치, blob 읽기에 프로세스 없음"""
+
+    name = 'pygit2'
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.repo = pygit2.Repository(str(self.root))
+
+    @_fallback
+    def stage(self, paths: List[str]) -> Tuple[bool, str]:
+        index = self.repo.index
+        index.read()
+        for path in paths:
+            if os.path.lexists(self.root / path):
+                index.add(path)
+            elif path in index:
+                index.remove(path)
+        index.write()
+        return True, ""
+
+    def _head_tree(self):
+        if self.repo.head_is_unborn:
+            return self.repo[self.repo.TreeBuilder().write()]
+        return self.repo.head.peel(pygit2.Tree)
+
+    @_fallback
+    def staged_changes(self) -> Optional[ChangeSet]:
+        index = self.repo.index
+        index.read()
+        diff = index.diff_to_tree(self._head_tree())
+        diff.find_similar(flags=pygit2.enums.DiffFind.FIND_RENAMES |
+                          pygit2.enums.DiffFind.FIND_COPIES)
+        changes = []
+        notes = {}
+        for patch in diff:
+            delta = patch.delta
+            letter = delta.status_char()
+            kind = {'A': 'added', 'D': 'deleted', 'R': 'renamed', 'C': 'copied',
+                    'U': 'unmerged'}.get(letter, 'modified')
+            path = delta.old_file.path if kind == 'deleted' else delta.new_file.path
+            orig = delta.old_file.path if kind in ('renamed', 'copied') else None
+            change = FileChange(path, kind, letter, orig,
+                                delta.similarity if orig else None)
+            if delta.is_binary:
+                change.binary = True
+            else:
+                _, change.lines_added, change.lines_deleted = patch.line_stats
+                if change.is_note:
+                    note = scan_note_lines(change, (line.origin + line.content
+                                                    for hunk in patch.hunks
+                                                    for line in hunk.lines))
+                    if note is not None:
+                        notes[change.path] = note
+            changes.append(change)
+        change_set = ChangeSet(changes)
+        change_set.notes = notes
+        return change_set
+
+    @_fallback
+    def commit(self, message: str) -> Tuple[bool, str]:
+        if _has_commit_hooks(self.root):
+            return CliBackend.commit(self, message)
+        index = self.repo.index
+        index.read()
+        tree = index.write_tree()
+        parents = [] if self.repo.head_is_unborn else [self.repo.head.target]
+        signature = self.repo.default_signature
+        oid = self.repo.create_commit('HEAD', signature, signature, message, tree, parents)
+        return True, str(oid)
+
+    @_fallback
+    def branch(self) -> Optional[str]:
+        if self.repo.head_is_detached:
+            return None
+        return read_branch(self.root) if self.repo.head_is_unborn else self.repo.head.shorthand
+
+    @_fallback
+    def read_blob(self, path: str, rev: str = 'HEAD') -> Optional[bytes]:
+        try:
+            if not rev:
+                index = self.repo.index
+                index.read()
+                return self.repo[index[path].id].data
+            obj = self.repo.revparse_single(f"{rev}:{path}")
+        except KeyError:
+            return None
+        return obj.data if isinstance(obj, pygit2.Blob) else None
+
+    def close(self):
+        self.repo.free()
+
+
+class DulwichBackend(CliBackend):
+    """dulwich (순수 파이썬) in-process - 스테이징, 커밋, 브랜치, blob 읽기 (diff는 CLI)"""
+
+    name = 'dulwich'
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.repo = DulwichRepo(str(self.root))
+
+    @_fallback
+    def stage(self, paths: List[str]) -> Tuple[bool, str]:
+        if paths:
+            # dulwich 0.23부터 Repo.stage → WorkTree.stage
+            stage = getattr(self.repo, 'stage', None) or self.repo.get_worktree().stage
+            stage(paths)  # 없는 경로는 인덱스에서 제거
+        return True, ""
+
+    @_fallback
+    def commit(self, message: str) -> Tuple[bool, str]:
+        # porcelain.commit은 commit 훅을 직접 실행
+        oid = dulwich_porcelain.commit(self.repo, message=message.encode('utf-8'))
+        return True, oid.decode('ascii')
+
+    @_fallback
+    def branch(self) -> Optional[str]:
+        return dulwich_porcelain.active_branch(self.repo).decode('utf-8')
+
+    @_fallback
+    def read_blob(self, path: str, rev: str = 'HEAD') -> Optional[bytes]:
+        try:
+            if not rev:
+                sha = self.repo.open_index()[path.encode('utf-8')].sha
+            else:
+                commit = self.repo[self.repo.head() if rev == 'HEAD' else rev.encode('ascii')]
+                _, sha = tree_lookup_path(self.repo.__getitem__, commit.tree,
+                                          path.encode('utf-8'))
+        except KeyError:
+            return None
+        return self.repo[sha].data
+
+    def close(self):
+        self.repo.close()
+
+
+BACKENDS = {
+    'cli': CliBackend,
+    'session': SessionBackend,
+    'pygit2': Pygit2Backend,
+    'dulwich': DulwichBackend,
+}
+AUTO_ORDER = ('pygit2', 'dulwich', 'session')
+
+
+def available_backends() -> List[str]:
+    names = ['cli', 'session']
+    if pygit2 is not None:
+        names.append('pygit2')
+    if dulwich_porcelain is not None:
+        names.append('dulwich')
+    return names
+
+
+def open_backend(root, name: str = 'auto') -> CliBackend:
+    """
+    이름으로 백엔드 열기 ('auto' = pygit2 → dulwich → session)
+    라이브러리가 없거나 저장소를 못 열면 다음 후보, 마지막은 cli
+    """
+    if name != 'auto' and name not in BACKENDS:
+        raise ValueError(f"unknown git backend '{name}' (auto, {', '.join(BACKENDS)})")
+    names = AUTO_ORDER if name == 'auto' else (name,)
+    available = available_backends()
+    for candidate in names:
+        if candidate not in available:
+            continue
+        try:
+            return BACKENDS[candidate](root)
+        except Exception:  # 손상된 저장소 / 지원하지 않는 형식 → 다음 후보
+            continue
+    return CliBackend(root)
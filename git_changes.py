@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Git Change Set
+git status --porcelain=v2 -z / git diff --cached -z --raw --numstat 출력 → 타입이 있는 변경 목록
+NUL 구분이라 한글 경로도 따옴표/이스케이프 없이 그대로, AM·RM 같은 두 글자 상태와 이름 변경/복사 포함
+PARA 영역(최상위 폴더)별 합계 + 노트별 줄 수 변화 (파일마다 git을 다시 부르지 않음)
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, List, Dict, Optional, Tuple
+
+KINDS = ('added', 'modified', 'deleted', 'renamed', 'copied', 'unmerged')
+ROOT_AREA = '(root)'
+
+
+@dataclass
+class FileChange:
+    path: str
+    kind: str                          # KINDS 중 하나
+    xy: str = ''                       # porcelain XY / diff 상태 글자 (스냅샷이면 '')
+    orig_path: Optional[str] = None    # 이름 변경/복사의 원래 경로
+    similarity: Optional[int] = None   # 이름 변경/복사 유사도 (%)
+    lines_added: Optional[int] = None
+    lines_deleted: Optional[int] = None
+    binary: bool = False
+
+    @property
+    def area(self) -> str:
+        """PARA 영역 = 최상위 폴더 (vault 루트 파일은 ROOT_AREA)"""
+        head, sep, _ = self.path.partition('/')
+        return head if sep else ROOT_AREA
+
+    @property
+    def is_note(self) -> bool:
+        return self.path.endswith('.md')
+
+    @property
+    def churn(self) -> int:
+        return (self.lines_added or 0) + (self.lines_deleted or 0)
+
+    def label(self) -> str:
+        """커밋 메시지용 한 줄 (경로 + 줄 수 변화)"""
+        name = f"{self.orig_path} → {self.path}" if self.orig_path else self.path
+        details = []
+        if self.similarity is not None and self.similarity < 100:
+            details.append(f"{self.similarity}%")
+        if self.binary:
+            details.append("binary")
+        elif self.lines_added or self.lines_deleted:
+            details.append(f"+{self.lines_added or 0}/-{self.lines_deleted or 0}")
+        return f"{name} ({', '.join(details)})" if details else name
+
+
+@dataclass
+class AreaRollup:
+    area: str
+    files: int = 0
+    notes: int = 0
+    lines_added: int = 0
+    lines_deleted: int = 0
+    kinds: Dict[str, int] = field(default_factory=dict)
+
+
+class ChangeSet:
+    """
+    FileChange 목록 + 브랜치 (status --branch로 알 수 있을 때) + 커밋 메시지 (커밋 후)
+    notes: 노트 경로 → NoteDelta (note_diff / note_scores가 채움)
+    """
+
+    def __init__(self, changes: Optional[List[FileChange]] = None,
+                 branch: Optional[str] = None):
+        self.changes: List[FileChange] = changes or []
+        self.branch = branch
+        self.message: Optional[str] = None
+        self.notes: Dict[str, 'NoteDelta'] = {}
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[FileChange]:
+        return iter(self.changes)
+
+    def of_kind(self, kind: str) -> List[FileChange]:
+        return [c for c in self.changes if c.kind == kind]
+
+    def paths(self) -> List[str]:
+        """스테이징할 경로 (이름 변경은 원래 경로도 포함)"""
+        paths = []
+        for c in self.changes:
+            if c.orig_path and c.kind == 'renamed':
+                paths.append(c.orig_path)
+            paths.append(c.path)
+        return list(dict.fromkeys(paths))
+
+    def totals(self) -> Tuple[int, int]:
+        return (sum(c.lines_added or 0 for c in self.changes),
+                sum(c.lines_deleted or 0 for c in self.changes))
+
+    def rollup(self) -> List[AreaRollup]:
+        """영역별 합계 (파일 수가 많은 순)"""
+        areas: Dict[str, AreaRollup] = {}
+        for c in self.changes:
+            r = areas.get(c.area)
+            if r is None:
+                r = areas[c.area] = AreaRollup(c.area)
+            r.files += 1
+            r.notes += c.is_note
+            r.lines_added += c.lines_added or 0
+            r.lines_deleted += c.lines_deleted or 0
+            r.kinds[c.kind] = r.kinds.get(c.kind, 0) + 1
+        return sorted(areas.values(), key=lambda r: (-r.files, r.area))
+
+    def apply_numstat(self, stats: Dict[str, Tuple[Optional[int], Optional[int]]]):
+        """parse_numstat 결과 (새 경로 기준)를 각 변경에 반영"""
+        for c in self.changes:
+            if c.path in stats:
+                c.lines_added, c.lines_deleted = stats[c.path]
+                c.binary = c.lines_added is None
+
+
+def _kind_from_xy(xy: str) -> Optional[str]:
+    """
+    porcelain XY (인덱스, 작업 트리) → HEAD 대비 결과 종류
+    AD (추가 후 작업 트리에서 삭제)는 HEAD 대비 변화가 없으므로 None
+    """
+    x, y = xy[0], xy[1]
+    if x == 'D' or y == 'D':
+        return None if x == 'A' else 'deleted'
+    if x == 'A' or y == 'A':
+        return 'added'  # y == 'A'는 intent-to-add
+    return 'modified'
+
+
+def parse_status_v2(output: str) -> ChangeSet:
+    """
+    git status --porcelain=v2 -z [--branch] 출력
+    1: 일반 변경, 2: 이름 변경/복사 (다음 NUL 항목이 원래 경로), u: 충돌, ?: untracked
+    """
+    changes = []
+    branch = None
+    tokens = iter(output.split('\0'))
+    for entry in tokens:
+        if not entry:
+            continue
+        tag = entry[0]
+        if tag == '#':
+            if entry.startswith('# branch.head '):
+                head = entry[len('# branch.head '):]
+                branch = None if head == '(detached)' else head
+        elif tag == '1':
+            fields = entry.split(' ', 8)
+            kind = _kind_from_xy(fields[1])
+            if kind:
+                changes.append(FileChange(fields[8], kind, fields[1]))
+        elif tag == '2':
+            fields = entry.split(' ', 9)
+            xy, score, path = fields[1], fields[8], fields[9]
+            orig = next(tokens, '')
+            letter = xy[0] if xy[0] in 'RC' else xy[1]
+            similarity = int(score[1:]) if score[1:].isdigit() else None
+            if xy[1] == 'D':
+                # 이름 변경/복사 후 새 경로를 작업 트리에서 삭제 → 원래 경로만 남음
+                if letter == 'R':
+                    changes.append(FileChange(orig, 'deleted', xy))
+                continue
+            kind = 'renamed' if letter == 'R' else 'copied'
+            changes.append(FileChange(path, kind, xy, orig, similarity))
+        elif tag == 'u':
+            fields = entry.split(' ', 10)
+            changes.append(FileChange(fields[10], 'unmerged', fields[1]))
+        elif tag == '?':
+            changes.append(FileChange(entry[2:], 'added', '??'))
+    return ChangeSet(changes, branch)
+
+
+def parse_numstat(tokens: List[str]) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+    """
+    --numstat -z 항목 → 새 경로 → (추가 줄, 삭제 줄), 바이너리는 (None, None)
+    이름 변경/복사는 'a\\td\\t' 다음에 원래 경로, 새 경로가 따로 옴
+    """
+    stats = {}
+    it = iter(tokens)
+    for entry in it:
+        if not entry:
+            continue
+        added, deleted, path = entry.split('\t', 2)
+        if not path:
+            next(it, None)
+            path = next(it, '')
+        stats[path] = (None, None) if added == '-' else (int(added), int(deleted))
+    return stats
+
+
+_RAW_KINDS = {'A': 'added', 'D': 'deleted', 'M': 'modified', 'T': 'modified',
+              'U': 'unmerged', 'R': 'renamed', 'C': 'copied'}
+
+
+def parse_cached_diff(output: str) -> ChangeSet:
+    """git diff --cached -z -M -C --raw --numstat 출력 (raw 항목 뒤에 numstat 항목)"""
+    changes = []
+    tokens = output.split('\0')
+    i = 0
+    while i < len(tokens) and tokens[i].startswith(':'):
+        status = tokens[i].rsplit(' ', 1)[1]
+        letter = status[0]
+        if letter in 'RC':
+            orig, path = tokens[i + 1], tokens[i + 2]
+            similarity = int(status[1:]) if status[1:].isdigit() else None
+            changes.append(FileChange(path, _RAW_KINDS[letter], status, orig, similarity))
+            i += 3
+        else:
+            changes.append(FileChange(tokens[i + 1], _RAW_KINDS.get(letter, 'modified'), status))
+            i += 2
+    change_set = ChangeSet(changes)
+    change_set.apply_numstat(parse_numstat(tokens[i:]))
+    return change_set
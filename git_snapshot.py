@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Git Index Snapshot
+마지막 커밋 시점의 vault 상태 (경로 → mtime_ns, size, blob 해시)를 .rsi_cache에 보관
+다음 실행에서는 stat만 비교 → 달라진 파일만 blob 해시로 확인 → dirty 경로 목록
+git status / git add . 없이 dirty 경로만 update-index 한 번으로 스테이징
+플러그인 빌드 산출물 (.obsidian/plugins/*/node_modules 등)은 탐색하지 않음
+"""
+
+import os
+import re
+import json
+import fnmatch
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Set, Tuple
+
+from git_changes import ChangeSet, FileChange, parse_status_v2
+from quality_cache import CACHE_DIR
+
+SNAPSHOT_FILE = "git_snapshot.json"
+SNAPSHOT_VERSION = 1
+
+# 디렉터리 이름이 같으면 통째로 건너뜀
+SKIP_DIRS = {'.git', '.rsi_cache', 'node_modules', '__pycache__'}
+# glob ('/'가 있으면 vault 기준 상대 경로, 없으면 파일/디렉터리 이름에 적용)
+IGNORE_PATTERNS = (
+    '.obsidian/plugins/*/node_modules',
+    '*.pyc',
+    '.DS_Store',
+    'Thumbs.db',
+)
+IGNORE_PATH_RE = re.compile('|'.join(
+    fnmatch.translate(p) for p in IGNORE_PATTERNS if '/' in p) or r'(?!)')
+IGNORE_NAME_RE = re.compile('|'.join(
+    fnmatch.translate(p) for p in IGNORE_PATTERNS if '/' not in p) or r'(?!)')
+
+UNKNOWN = [0, -1, None]   # stat이 절대 일치하지 않는 항목 (스냅샷 생성 시 이미 dirty)
+
+# (명령, cwd, input_text, strip) → (성공 여부, 출력)
+GitRunner = Callable[..., Tuple[bool, str]]
+
+
+@dataclass
+class DirtyPaths:
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    @property
+    def paths(self) -> List[str]:
+        return self.added + self.modified + self.deleted
+
+    def changes(self) -> ChangeSet:
+        """check_git_status와 같은 ChangeSet (이름 변경은 스테이징 후 git diff --cached가 판정)"""
+        return ChangeSet([FileChange(p, 'added') for p in self.added] +
+                         [FileChange(p, 'modified') for p in self.modified] +
+                         [FileChange(p, 'deleted') for p in self.deleted])
+
+    def __bool__(self):
+        return bool(self.added or self.modified or self.deleted)
+
+
+def blob_hash(file_path) -> Tuple[str, int, int]:
+    """git blob 해시 (sha1("blob <len>\\0" + 내용)) + 읽은 시점의 (mtime_ns, size)"""
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        h = hashlib.sha1(b'blob %d\0' % st.st_size)
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest(), st.st_mtime_ns, st.st_size
+
+
+def scan_worktree(root: Path, skip_dirs: Set[str] = frozenset()) -> Dict[str, Tuple[int, int]]:
+    """
+    상대 경로 (/ 구분) → (mtime_ns, size)
+    SKIP_DIRS, IGNORE_PATTERNS, skip_dirs (gitignore된 디렉터리) 안으로는 들어가지 않음
+    """
+    snapshot = {}
+    stack = [(str(root), '')]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if IGNORE_NAME_RE.match(name):
+                    continue
+                rel = prefix + name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (name not in SKIP_DIRS and rel not in skip_dirs
+                                and not IGNORE_PATH_RE.match(rel)):
+                            stack.append((entry.path, rel + '/'))
+                    else:
+                        st = entry.stat(follow_symlinks=False)
+                        snapshot[rel] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+    return snapshot
+
+
+def excluded(rel: str) -> bool:
+    """scan_worktree가 보지 않는 경로인지 (SKIP_DIRS / IGNORE_PATTERNS)"""
+    parts = rel.split('/')
+    if any(part in SKIP_DIRS for part in parts[:-1]):
+        return True
+    if any(IGNORE_NAME_RE.match(part) for part in parts):
+        return True
+    return any(IGNORE_PATH_RE.match('/'.join(parts[:i])) for i in range(1, len(parts)))
+
+
+def _git_path(root: Path, *parts: str) -> Path:
+    return root / '.git' / Path(*parts)
+
+
+def read_head(root: Path) -> Optional[str]:
+    """.git/HEAD → 커밋 id (프로세스 없이 파일만 읽음, 커밋이 없으면 None)"""
+    try:
+        head = _git_path(root, 'HEAD').read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    if not head.startswith('ref: '):
+        return head or None
+    ref = head[5:]
+    try:
+        return _git_path(root, *ref.split('/')).read_text(encoding='utf-8').strip()
+    except OSError:
+        pass
+    try:
+        packed = _git_path(root, 'packed-refs').read_text(encoding='utf-8')
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        parts = line.split(' ', 1)
+        if len(parts) == 2 and parts[1] == ref:
+            return parts[0]
+    return None
+
+
+def read_branch(root: Path) -> Optional[str]:
+    """.git/HEAD → 현재 브랜치 이름 (detached HEAD면 None)"""
+    try:
+        head = _git_path(root, 'HEAD').read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    if head.startswith('ref: refs/heads/'):
+        return head[len('ref: refs/heads/'):]
+    return None
+
+
+def _split_z(output: str) -> List[str]:
+    return [p for p in output.split('\0') if p]
+
+
+class GitSnapshot:
+    """
+    마지막 커밋 시점의 vault 상태
+    HEAD가 바뀌었으면 (수동 커밋, pull) 다시 생성
+    """
+
+    def __init__(self, vault_path, cache_path: Optional[Path] = None):
+        self.root = Path(vault_path)
+        self.cache_path = Path(cache_path or self.root / CACHE_DIR / SNAPSHOT_FILE)
+        self.head: Optional[str] = None
+        self.exclude_stamp: Optional[list] = None
+        self.files: Dict[str, list] = {}      # 경로 → [mtime_ns, size, blob]
+        self.ignored: Set[str] = set()        # gitignore에 걸린 파일
+        self.ignored_dirs: Set[str] = set()   # gitignore에 걸린 디렉터리 (탐색 안 함)
+        self._pending: Dict[str, Optional[list]] = {}  # 스테이징할 경로의 새 항목 (삭제는 None)
+        self._dirty = False
+        self.loaded = False
+        if self.cache_path.exists():
+            try:
+                data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+                if data.get('version') == SNAPSHOT_VERSION:
+                    self.head = data['head']
+                    self.exclude_stamp = data['exclude']
+                    self.files = data['files']
+                    self.ignored = set(data['ignored'])
+                    self.ignored_dirs = set(data['ignored_dirs'])
+                    self.loaded = True
+            except (OSError, ValueError, KeyError):
+                pass  # 손상된 스냅샷 → 다시 생성
+
+    def _exclude_stamp(self) -> Optional[list]:
+        """.git/info/exclude는 작업 트리 밖이라 따로 stat"""
+        try:
+            st = _git_path(self.root, 'info', 'exclude').stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def is_current(self) -> bool:
+        """저장된 스냅샷이 지금 HEAD / exclude 설정 기준인지"""
+        return (self.loaded and self.head == read_head(self.root)
+                and self.exclude_stamp == self._exclude_stamp())
+
+    def rebuild(self, git: GitRunner) -> bool:
+        """
+        git ls-files -s (인덱스 blob) + status (tracked dirty) + ignored 목록으로 새로 생성
+        첫 실행이나 HEAD가 바뀐 뒤 한 번만 (git이 작업 트리 전체를 훑는 경로)
+        """
+        ok, staged = git(['git', 'ls-files', '-s', '-z'], self.root, strip=False)
+        if not ok:
+            return False
+        ok, status = git(['git', 'status', '--porcelain=v2', '-z', '--untracked-files=no'],
+                         self.root, strip=False)
+        if not ok:
+            return False
+        ok, ignored = git(['git', 'ls-files', '-z', '-o', '-i', '--exclude-standard',
+                           '--directory'], self.root, strip=False)
+        if not ok:
+            return False
+
+        dirty = set()
+        for change in parse_status_v2(status):
+            dirty.add(change.path)
+            if change.orig_path:
+                dirty.add(change.orig_path)
+
+        files = {}
+        for entry in _split_z(staged):
+            meta, rel = entry.split('\t', 1)
+            if excluded(rel):
+                continue
+            if rel in dirty:
+                files[rel] = list(UNKNOWN)
+                continue
+            try:
+                st = os.stat(self.root / rel, follow_symlinks=False)
+            except OSError:
+                files[rel] = list(UNKNOWN)
+                continue
+            files[rel] = [st.st_mtime_ns, st.st_size, meta.split(' ')[1]]
+
+        self.ignored, self.ignored_dirs = set(), set()
+        for rel in _split_z(ignored):
+            if rel.endswith('/'):
+                self.ignored_dirs.add(rel.rstrip('/'))
+            else:
+                self.ignored.add(rel)
+
+        self.files = files
+        self.head = read_head(self.root)
+        self.exclude_stamp = self._exclude_stamp()
+        self._pending = {}
+        self._dirty = True
+        self.loaded = True
+        return True
+
+    def _check_ignore(self, paths: List[str], git: GitRunner) -> Set[str]:
+        """새 경로 중 gitignore에 걸리는 것 (git check-ignore 한 번)"""
+        ok, output = git(['git', 'check-ignore', '-z', '--stdin'], self.root,
+                         input_text='\0'.join(paths) + '\0', strip=False)
+        if not ok:
+            if output:
+                raise RuntimeError(f"git check-ignore failed: {output}")
+            return set()  # 종료 코드 1 = 걸리는 경로 없음
+        return set(_split_z(output))
+
+    def _ignore_rules_changed(self, current: Dict[str, Tuple[int, int]]) -> bool:
+        if not (self.ignored or self.ignored_dirs):
+            return False
+        for rel in set(current) | set(self.files):
+            if rel == '.gitignore' or rel.endswith('/.gitignore'):
+                entry = self.files.get(rel)
+                if entry is None or tuple(entry[:2]) != current.get(rel):
+                    return True
+        return False
+
+    def scan(self, git: GitRunner) -> DirtyPaths:
+        """스냅샷 대비 dirty 경로 (stat이 다르면 blob 해시로 확인, 내용이 같으면 stat만 갱신)"""
+        current = scan_worktree(self.root, self.ignored_dirs)
+        if self._ignore_rules_changed(current):
+            # .gitignore가 바뀜 → 기억한 ignored 목록을 버리고 새 경로는 check-ignore로 다시 판정
+            self.ignored, self.ignored_dirs = set(), set()
+            self._dirty = True
+            current = scan_worktree(self.root)
+        result = DirtyPaths()
+        self._pending = {}
+
+        unknown = []
+        for rel, (mtime, size) in current.items():
+            entry = self.files.get(rel)
+            if entry is None:
+                if rel not in self.ignored:
+                    unknown.append(rel)
+                continue
+            if entry[0] == mtime and entry[1] == size:
+                continue
+            try:
+                blob, mtime, size = blob_hash(self.root / rel)
+            except OSError:
+                continue
+            if blob == entry[2]:
+                self.files[rel] = [mtime, size, blob]  # 저장만 다시 한 파일
+                self._dirty = True
+                continue
+            result.modified.append(rel)
+            self._pending[rel] = [mtime, size, blob]
+
+        if unknown:
+            ignored = self._check_ignore(unknown, git)
+            if ignored:
+                self.ignored |= ignored
+                self._dirty = True
+            for rel in unknown:
+                if rel in ignored:
+                    continue
+                try:
+                    blob, mtime, size = blob_hash(self.root / rel)
+                except OSError:
+                    continue
+                self._pending[rel] = [mtime, size, blob]
+                result.added.append(rel)
+
+        for rel in self.files:
+            if rel not in current:
+                result.deleted.append(rel)
+                self._pending[rel] = None
+
+        result.added.sort()
+        result.modified.sort()
+        result.deleted.sort()
+        return result
+
+    def commit(self):
+        """커밋 성공 후 스테이징한 경로를 스냅샷에 반영"""
+        for rel, entry in self._pending.items():
+            if entry is None:
+                self.files.pop(rel, None)
+            else:
+                self.files[rel] = entry
+        self._pending = {}
+        self.head = read_head(self.root)
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'head': self.head,
+            'exclude': self.exclude_stamp,
+            'files': self.files,
+            'ignored': sorted(self.ignored),
+            'ignored_dirs': sorted(self.ignored_dirs),
+        }
+        self.cache_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        self._dirty = False
@@ -4,84 +4,93 @@ GitHub Auto-commit for Obsidian RSI
 변경사항 자동 감지 및 커밋/푸시
 """
 
-import subprocess
+import time
 from pathlib import Path
 from datetime import datetime
 import sys
 
-def run_git_command(command, cwd):
+from git_backend import CliBackend, available_backends, open_backend
+from git_changes import KINDS, parse_status_v2
+from git_snapshot import GitSnapshot
+from note_scores import score_notes
+
+# main()에서 --backend로 선택 (없으면 명령마다 git 프로세스)
+_backend = None
+
+
+def set_git_backend(backend):
     """
-    Git 명령 실행
+    이후 Git 작업에 쓸 백엔드 지정 (None이면 CLI)
     """
-    try:
-        result = subprocess.run(
-            command,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return True, result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        return False, e.stderr.strip()
+    global _backend
+    if _backend is not None and _backend is not backend:
+        _backend.close()
+    _backend = backend
+
+
+def get_git_backend(vault_path):
+    """
+    vault에 지정된 백엔드, 없으면 CLI
+    """
+    if _backend is not None and _backend.root == Path(vault_path):
+        return _backend
+    return CliBackend(vault_path)
+
+
+def run_git_command(command, cwd, input_text=None, strip=True):
+    """
+    Git 명령 실행 (백엔드 경유, 전용 메서드가 없는 명령은 git 프로세스)
+    input_text: stdin으로 보낼 내용 (--stdin / -z 경로 목록)
+    strip=False: -z 출력처럼 앞뒤 공백도 의미가 있을 때
+    """
+    return get_git_backend(cwd).run(command, cwd, input_text, strip)
 
 
 def check_git_status(vault_path):
     """
-    Git 상태 확인
+    Git 상태 확인 (porcelain v2, NUL 구분 → 한글 경로 / 두 글자 상태 / 이름 변경·복사)
     """
-    success, output = run_git_command(['git', 'status', '--porcelain'], vault_path)
+    success, output = run_git_command(
+        ['git', '-c', 'status.renames=copies', 'status', '--porcelain=v2', '-z',
+         '--branch', '--find-renames'],
+        vault_path, strip=False)
     
     if not success:
         return None, "Git repository not initialized or error occurred"
     
-    if not output:
-        return [], "No changes detected"
-    
-    # 변경 파일 목록
-    changes = []
-    for line in output.split('\n'):
-        if line.strip():
-            status = line[:2].strip()
-            file_path = line[3:].strip()
-            changes.append({
-                'status': status,
-                'file': file_path
-            })
+    changes = parse_status_v2(output)
+    if not changes:
+        return changes, "No changes detected"
     
     return changes, None
 
 
+def staged_changes(vault_path):
+    """
+    스테이징된 변경 (git diff --cached 1회 또는 in-process: 이름 변경/복사 판정 + 노트별 줄 수)
+    """
+    return get_git_backend(vault_path).staged_changes()
+
+
 def categorize_changes(changes):
     """
-    변경사항 카테고리화
+    변경사항 카테고리화 (FileChange 목록 → 종류별, 줄 변화가 큰 순)
     """
-    categories = {
-        'added': [],
-        'modified': [],
-        'deleted': [],
-        'renamed': []
-    }
+    categories = {kind: [] for kind in KINDS}
     
     for change in changes:
-        status = change['status']
-        file_path = change['file']
-        
-        if status in ['A', '??']:
-            categories['added'].append(file_path)
-        elif status == 'M':
-            categories['modified'].append(file_path)
-        elif status == 'D':
-            categories['deleted'].append(file_path)
-        elif status == 'R':
-            categories['renamed'].append(file_path)
+        categories[change.kind].append(change)
+    
+    for files in categories.values():
+        files.sort(key=lambda c: -c.churn)
     
     return categories
 
 
-def generate_commit_message(categories):
+def generate_commit_message(categories, change_set=None):
     """
     자동 커밋 메시지 생성
+    change_set이 있으면 영역(PARA)별 합계, 줄 수 합계, 노트 내용 변화 (새 Day, 점수, 링크, 할 일)도 포함
     """
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
     
@@ -96,39 +105,96 @@ def generate_commit_message(categories):
         summary_parts.append(f"Delete {len(categories['deleted'])} file(s)")
     if categories['renamed']:
         summary_parts.append(f"Rename {len(categories['renamed'])} file(s)")
+    if categories['copied']:
+        summary_parts.append(f"Copy {len(categories['copied'])} file(s)")
+    
+    days = []
+    if change_set is not None:
+        days = sorted(d for note in change_set.notes.values() for d in note.days_added)
+    if days:
+        summary_parts.insert(0, f"Log Day {', '.join(str(d) for d in days)}")
     
     summary = ", ".join(summary_parts)
+    if change_set is not None:
+        added, deleted = change_set.totals()
+        if added or deleted:
+            summary += f" (+{added}/-{deleted} lines)"
     
     # 상세 메시지 구성
     message = f"[Auto RSI] {summary}\n\nTimestamp: {timestamp}\n"
     
-    # 파일별 상세
-    if categories['added']:
-        message += f"\nAdded:\n"
-        for f in categories['added'][:5]:  # 최대 5개
-            message += f"  - {f}\n"
-        if len(categories['added']) > 5:
-            message += f"  ... and {len(categories['added'])-5} more\n"
-    
-    if categories['modified']:
-        message += f"\nModified:\n"
-        for f in categories['modified'][:5]:
-            message += f"  - {f}\n"
-        if len(categories['modified']) > 5:
-            message += f"  ... and {len(categories['modified'])-5} more\n"
-    
-    if categories['deleted']:
-        message += f"\nDeleted:\n"
-        for f in categories['deleted'][:5]:
-            message += f"  - {f}\n"
-        if len(categories['deleted']) > 5:
-            message += f"  ... and {len(categories['deleted'])-5} more\n"
+    # 영역별 합계
+    if change_set is not None:
+        rollup = change_set.rollup()
+        message += f"\nAreas:\n"
+        for r in rollup[:5]:
+            message += (f"  - {r.area}: {r.files} file(s), {r.notes} note(s), "
+                        f"+{r.lines_added}/-{r.lines_deleted}\n")
+        if len(rollup) > 5:
+            message += f"  ... and {len(rollup)-5} more\n"
+    
+    # 노트 내용 변화 (품질 점수, 링크, 할 일)
+    if change_set is not None:
+        content = describe_notes(change_set)
+        if content:
+            message += "\nNotes:\n" + "".join(f"  - {line}\n" for line in content)
+    
+    # 파일별 상세 (줄 변화가 큰 순으로 최대 5개)
+    for kind, title in [('added', 'Added'), ('modified', 'Modified'), ('deleted', 'Deleted'),
+                        ('renamed', 'Renamed'), ('copied', 'Copied')]:
+        files = categories[kind]
+        if not files:
+            continue
+        message += f"\n{title}:\n"
+        for f in files[:5]:
+            message += f"  - {f.label()}\n"
+        if len(files) > 5:
+            message += f"  ... and {len(files)-5} more\n"
     
     message += "\n---\nGenerated by Auto RSI GitHub Auto-commit"
     
     return message
 
 
+def describe_notes(change_set, limit=5):
+    """
+    ChangeSet.notes → 커밋 메시지 줄 (점수 변화가 큰 노트, 링크 변화, 체크한 할 일)
+    """
+    notes = change_set.notes.values()
+    lines = []
+    
+    for n in notes:
+        if n.days_added:
+            days = ', '.join(f"Day {d}" for d in n.days_added)
+            lines.append(f"New in {n.path}: {days}")
+    
+    scored = sorted((n for n in notes if n.score_changed),
+                    key=lambda n: -abs(n.score_after - n.score_before))
+    for n in scored[:limit]:
+        lines.append(f"Quality {n.path}: {n.score_before} → {n.score_after} "
+                     f"({n.score_after - n.score_before:+d})")
+    if len(scored) > limit:
+        lines.append(f"... and {len(scored)-limit} more score change(s)")
+    
+    linked = [n for n in notes if n.links_added or n.links_removed]
+    for n in linked[:limit]:
+        links = [f"+[[{name}]]" for name in n.links_added[:limit]] + \
+                [f"-[[{name}]]" for name in n.links_removed[:limit]]
+        hidden = len(n.links_added) + len(n.links_removed) - len(links)
+        lines.append(f"Links {n.path}: {' '.join(links)}" +
+                     (f" (+{hidden} more)" if hidden else ""))
+    if len(linked) > limit:
+        lines.append(f"... and {len(linked)-limit} more note(s) with link changes")
+    
+    tasks = [(n.path, task) for n in notes for task in n.tasks_done]
+    for path, task in tasks[:limit]:
+        lines.append(f"Done {path}: {task}")
+    if len(tasks) > limit:
+        lines.append(f"... and {len(tasks)-limit} more task(s) checked off")
+    
+    return lines
+
+
 def git_add_all(vault_path):
     """
     모든 변경사항 스테이징
@@ -137,12 +203,40 @@ def git_add_all(vault_path):
     return success, output
 
 
+def git_stage_paths(vault_path, paths):
+    """
+    지정한 경로만 한 번에 스테이징 (update-index 1회 또는 in-process, 삭제된 경로는 인덱스에서 제거)
+    """
+    return get_git_backend(vault_path).stage(paths)
+
+
+def detect_changes(vault_path, snapshot):
+    """
+    스냅샷 기준 dirty 경로 → (changes, error)
+    스냅샷이 없거나 HEAD가 바뀌었으면 먼저 다시 생성, 실패하면 git status로
+    """
+    if not snapshot.is_current():
+        print("  🗂️ Building index snapshot...")
+        if not snapshot.rebuild(run_git_command):
+            return check_git_status(vault_path)
+    return snapshot.scan(run_git_command).changes(), None
+
+
+def git_unstage_paths(vault_path, paths):
+    """
+    커밋을 취소했을 때 스테이징한 경로만 되돌림
+    """
+    if not paths:
+        return True, ""
+    return run_git_command(['git', 'reset', '-q', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                           vault_path, input_text='\0'.join(paths) + '\0')
+
+
 def git_commit(vault_path, message):
     """
     커밋 실행
     """
-    success, output = run_git_command(['git', 'commit', '-m', message], vault_path)
-    return success, output
+    return get_git_backend(vault_path).commit(message)
 
 
 def git_push(vault_path, remote='origin', branch='main'):
@@ -180,76 +274,176 @@ def main():
         print("  git init")
         return
     
-    # 변경사항 확인
-    print("\n🔍 Checking for changes...")
-    changes, error = check_git_status(vault_path)
+    # Git 백엔드 (--backend auto|cli|session|pygit2|dulwich)
+    try:
+        backend = open_backend(vault_path, _arg_value('--backend', 'auto'))
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return
+    set_git_backend(backend)
+    print(f"⚙️ Git backend: {backend.name} (available: {', '.join(available_backends())})")
+    try:
+        auto_commit(vault_path)
+    finally:
+        for fallback in backend.fallbacks:
+            print(f"⚠️ CLI fallback - {fallback}")
+        set_git_backend(None)
+
+
+def _arg_value(flag, default):
+    """
+    '--flag 값' / '--flag=값' 형식 인자
+    """
+    for i, arg in enumerate(sys.argv):
+        if arg == flag and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+        if arg.startswith(flag + '='):
+            return arg[len(flag) + 1:]
+    return default
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+def commit_changes(vault_path, snapshot=None, full_scan=False, confirm=True, verbose=True):
+    """
+    변경 감지 → 스테이징 → 메시지 → 커밋
+    커밋한 ChangeSet을 돌려줌 (변경이 없거나 취소/실패하면 None)
+    snapshot: 이어서 쓸 GitSnapshot (없으면 .rsi_cache에서 읽음)
+    verbose=False면 요약/메시지 출력 생략 (daemon), 오류는 항상 출력
+    """
+    log = print if verbose else _quiet
+    
+    # 변경사항 확인 (스냅샷 stat 비교, full_scan이면 git status)
+    log("\n🔍 Checking for changes...")
+    started = time.perf_counter()
+    if full_scan:
+        snapshot = None
+        changes, error = check_git_status(vault_path)
+    else:
+        snapshot = snapshot or GitSnapshot(vault_path)
+        changes, error = detect_changes(vault_path, snapshot)
+        snapshot.save()
+    elapsed_ms = (time.perf_counter() - started) * 1000
     
     if error:
-        print(f"ℹ️ {error}")
-        return
+        log(f"ℹ️ {error}")
+        return None
     
     if not changes:
-        print("✓ No changes to commit")
-        return
+        log("✓ No changes to commit")
+        return None
+    
+    log(f"✓ Found {len(changes)} changed file(s) ({elapsed_ms:.0f} ms)")
+    
+    conflicts = changes.of_kind('unmerged')
+    if conflicts:
+        print(f"❌ Error: {len(conflicts)} unmerged file(s), resolve conflicts first")
+        for change in conflicts[:5]:
+            print(f"  - {change.path}")
+        return None
+    
+    # Git add (스냅샷이 있으면 dirty 경로만)
+    log("\n📦 Staging changes...")
+    use_snapshot = snapshot is not None and snapshot.loaded
+    if use_snapshot:
+        success, output = git_stage_paths(vault_path, changes.paths())
+    else:
+        success, output = git_add_all(vault_path)
+    
+    if not success:
+        print(f"❌ Error staging changes: {output}")
+        return None
     
-    print(f"✓ Found {len(changes)} changed file(s)")
+    # 스테이징된 내용 기준 (이름 변경/복사 판정 + 줄 수)
+    change_set = staged_changes(vault_path)
+    if change_set is None:
+        print("❌ Error reading staged changes")
+        return None
+    change_set.branch = changes.branch
+    
+    if not change_set:
+        # 저장만 다시 한 파일 등 → HEAD와 같음
+        log("✓ No changes to commit")
+        if use_snapshot:
+            snapshot.commit()
+            snapshot.save()
+        return None
+    
+    log(f"✓ {len(change_set)} change(s) staged")
+    
+    # 노트 품질 점수 변화 (체커 캐시 재사용, 링크/할 일/Day는 diff에서 이미 집계)
+    score_notes(change_set, vault_path, get_git_backend(vault_path).read_blob)
     
     # 변경사항 카테고리화
-    categories = categorize_changes(changes)
+    categories = categorize_changes(change_set)
     
-    print("\n📊 Changes summary:")
+    log("\n📊 Changes summary:")
     if categories['added']:
-        print(f"  ➕ Added: {len(categories['added'])} file(s)")
+        log(f"  ➕ Added: {len(categories['added'])} file(s)")
     if categories['modified']:
-        print(f"  ✏️ Modified: {len(categories['modified'])} file(s)")
+        log(f"  ✏️ Modified: {len(categories['modified'])} file(s)")
     if categories['deleted']:
-        print(f"  ❌ Deleted: {len(categories['deleted'])} file(s)")
+        log(f"  ❌ Deleted: {len(categories['deleted'])} file(s)")
     if categories['renamed']:
-        print(f"  🔄 Renamed: {len(categories['renamed'])} file(s)")
+        log(f"  🔄 Renamed: {len(categories['renamed'])} file(s)")
+    if categories['copied']:
+        log(f"  📑 Copied: {len(categories['copied'])} file(s)")
+    for r in change_set.rollup():
+        log(f"  📁 {r.area}: {r.files} file(s), +{r.lines_added}/-{r.lines_deleted}")
     
     # 커밋 메시지 생성
-    commit_message = generate_commit_message(categories)
+    commit_message = generate_commit_message(categories, change_set)
+    change_set.message = commit_message
     
-    print("\n📝 Commit message:")
-    print("-" * 60)
-    print(commit_message)
-    print("-" * 60)
+    log("\n📝 Commit message:")
+    log("-" * 60)
+    log(commit_message)
+    log("-" * 60)
     
     # 사용자 확인 (자동 모드면 스킵)
-    if '--auto' not in sys.argv:
+    if confirm:
         response = input("\nProceed with commit? (y/n): ")
         if response.lower() != 'y':
+            git_unstage_paths(vault_path, changes.paths())
             print("❌ Commit cancelled")
-            return
-    
-    # Git add
-    print("\n📦 Staging changes...")
-    success, output = git_add_all(vault_path)
-    
-    if not success:
-        print(f"❌ Error staging changes: {output}")
-        return
-    
-    print("✓ Changes staged")
+            return None
     
     # Git commit
-    print("\n💾 Committing...")
+    log("\n💾 Committing...")
     success, output = git_commit(vault_path, commit_message)
     
     if not success:
         print(f"❌ Error committing: {output}")
-        return
+        return None
     
-    print("✓ Changes committed")
+    log("✓ Changes committed")
+    
+    if use_snapshot:
+        snapshot.commit()
+        snapshot.save()
+    
+    return change_set
+
+
+def auto_commit(vault_path):
+    """
+    변경 감지 → 스테이징 → 메시지 → 커밋 → (푸시)
+    """
+    change_set = commit_changes(vault_path, full_scan='--full-scan' in sys.argv,
+                                confirm='--auto' not in sys.argv)
+    if change_set is None:
+        return
     
     # Git push (선택적)
     if '--push' in sys.argv or '--auto' in sys.argv:
         print("\n📤 Pushing to remote...")
         
-        # 브랜치 확인
-        success, current_branch = run_git_command(['git', 'branch', '--show-current'], vault_path)
+        # 브랜치 확인 (status --branch에서 이미 알면 그대로)
+        current_branch = change_set.branch or get_git_backend(vault_path).branch()
         
-        if not success:
+        if not current_branch:
             print(f"⚠️ Could not determine current branch, using 'main'")
             current_branch = 'main'
         
@@ -284,5 +478,11 @@ if __name__ == "__main__":
     
     4. 완전 자동 (커밋 + 푸시):
        python github_auto_commit.py --auto --push
+    
+    5. 스냅샷 대신 git status / git add . 사용:
+       python github_auto_commit.py --full-scan
+    
+    6. Git 백엔드 선택 (기본 auto = pygit2 → dulwich → session):
+       python github_auto_commit.py --auto --backend cli
     """
     main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Link Graph Metrics
+해석된 위키링크 그래프 분석: 연결 요소, PageRank/차수 중심성, 브리지, 고립 클러스터
+PageRank는 NumPy가 있으면 벡터화 반복 (없으면 순수 파이썬)
+연결 요소별 결과를 캐시 → 링크가 바뀐 요소만 다시 계산
+"""
+
+import pickle
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Pattern
+
+try:
+    import numpy as np
+except ImportError:  # 선택적 의존성
+    np = None
+
+from link_graph import LinkGraph
+
+GRAPH_CACHE_VERSION = 1
+
+DAMPING = 0.85
+PAGERANK_TOL = 1e-10
+PAGERANK_MAX_ITER = 100
+
+# 가장 큰 연결 요소가 아니면서 이 크기 이하인 요소 = 고립 클러스터
+SMALL_CLUSTER_MAX = 3
+
+
+@dataclass
+class GraphMetrics:
+    nodes: List[str]
+    edge_count: int
+    in_degree: Dict[str, int]
+    out_degree: Dict[str, int]
+    pagerank: Dict[str, float]
+    components: List[List[str]]              # 큰 것부터
+    bridges: List[Tuple[str, str]]
+    dangling: List[Tuple[str, int, str, str]] = field(default_factory=list)  # (노트, 줄, 대상, 사유)
+    recomputed: int = 0                      # 이번에 다시 계산한 연결 요소 수
+
+    def isolated_clusters(self) -> List[List[str]]:
+        """가장 큰 요소에서 떨어진 2~SMALL_CLUSTER_MAX개짜리 노트 묶음"""
+        return [c for c in self.components[1:] if 1 < len(c) <= SMALL_CLUSTER_MAX]
+
+    def top_pagerank(self, n: int = 10) -> List[Tuple[str, float]]:
+        """PageRank 상위 노트 (백링크가 하나도 없는 노트 제외)"""
+        ranked = [(path, rank) for path, rank in self.pagerank.items() if self.in_degree[path]]
+        return sorted(ranked, key=lambda kv: (-kv[1], kv[0]))[:n]
+
+    def issues(self, exclude: Optional[Pattern] = None) -> Dict[str, List[Dict]]:
+        """노트별 그래프 이슈 (vault 기준 경로 → 이슈 목록), exclude에 걸리는 메타 파일 제외"""
+        found: Dict[str, List[Dict]] = {}
+
+        def add(path: str, priority: str, category: str, issue: str, suggestion: str):
+            name = path.rsplit('/', 1)[-1]
+            if exclude is not None and exclude.search(name):
+                return
+            found.setdefault(path, []).append({
+                'priority': priority,
+                'category': category,
+                'file': name,
+                'issue': issue,
+                'suggestion': suggestion
+            })
+
+        for path, line_no, target, reason in self.dangling:
+            priority = 'P2' if reason == "노트 없음" else 'P3'
+            add(path, priority, '링크', f"끊어진 링크 [[{target}]] ({reason}, {line_no}행)",
+                "대상 노트를 만들거나 링크 수정")
+
+        for path in self.nodes:
+            if self.in_degree[path] == 0:
+                add(path, 'P3', '연결성', "백링크 없음 (다른 노트에서 오는 링크 0개)",
+                    "관련 노트에서 이 노트로 링크 추가")
+
+        for cluster in self.isolated_clusters():
+            for path in cluster:
+                add(path, 'P3', '연결성', f"고립된 클러스터 ({len(cluster)}개 노트끼리만 연결)",
+                    "메인 지식 네트워크의 노트와 연결")
+
+        return found
+
+
+# ===== 연결 요소 / 브리지 =====
+
+def connected_components(nodes: List[str], undirected: Dict[str, set]) -> List[List[str]]:
+    """무향 연결 요소 (BFS, 큰 요소부터 / 같은 크기는 이름순)"""
+    seen = set()
+    components = []
+    for start in nodes:
+        if start in seen:
+            continue
+        seen.add(start)
+        component = [start]
+        frontier = [start]
+        while frontier:
+            node = frontier.pop()
+            for nxt in undirected[node]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    component.append(nxt)
+                    frontier.append(nxt)
+        components.append(sorted(component))
+    components.sort(key=lambda c: (-len(c), c[0]))
+    return components
+
+
+def find_bridges(component: List[str], undirected: Dict[str, set]) -> List[Tuple[str, str]]:
+    """끊기면 요소가 둘로 나뉘는 링크 (반복형 Tarjan, 재귀 한도 없음)"""
+    order: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    bridges = []
+
+    root = component[0]
+    order[root] = low[root] = 0
+    stack = [(root, None, iter(sorted(undirected[root])))]
+    while stack:
+        node, parent, neighbours = stack[-1]
+        advanced = False
+        for nxt in neighbours:
+            if nxt == parent:
+                continue
+            if nxt in order:
+                low[node] = min(low[node], order[nxt])
+            else:
+                order[nxt] = low[nxt] = len(order)
+                stack.append((nxt, node, iter(sorted(undirected[nxt]))))
+                advanced = True
+                break
+        if advanced:
+            continue
+        stack.pop()
+        if parent is not None:
+            low[parent] = min(low[parent], low[node])
+            if low[node] > order[parent]:
+                bridges.append(tuple(sorted((parent, node))))
+    return sorted(bridges)
+
+
+# ===== PageRank =====
+
+def _pagerank_python(n: int, src: List[int], dst: List[int], out_deg: List[int]) -> List[float]:
+    rank = [1.0 / n] * n
+    for _ in range(PAGERANK_MAX_ITER):
+        dangling = sum(rank[i] for i in range(n) if out_deg[i] == 0)
+        base = (1.0 - DAMPING) / n + DAMPING * dangling / n
+        new = [base] * n
+        for s, d in zip(src, dst):
+            new[d] += DAMPING * rank[s] / out_deg[s]
+        delta = sum(abs(a - b) for a, b in zip(new, rank))
+        rank = new
+        if delta < PAGERANK_TOL * n:
+            break
+    return rank
+
+
+def _pagerank_numpy(n: int, src: List[int], dst: List[int], out_deg: List[int]) -> List[float]:
+    src_a = np.asarray(src, dtype=np.int64)
+    dst_a = np.asarray(dst, dtype=np.int64)
+    out_a = np.asarray(out_deg, dtype=np.float64)
+    is_dangling = out_a == 0
+    inv_out = np.divide(1.0, out_a, out=np.zeros(n), where=~is_dangling)
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(PAGERANK_MAX_ITER):
+        # 희소 행렬-벡터 곱 = 간선별 기여를 대상 노드로 합산
+        flow = np.bincount(dst_a, weights=(rank * inv_out)[src_a], minlength=n)
+        base = (1.0 - DAMPING) / n + DAMPING * rank[is_dangling].sum() / n
+        new = base + DAMPING * flow
+        delta = np.abs(new - rank).sum()
+        rank = new
+        if delta < PAGERANK_TOL * n:
+            break
+    return rank.tolist()
+
+
+def component_pagerank(component: List[str], edges: List[Tuple[str, str]]) -> Dict[str, float]:
+    """
+    연결 요소 하나의 PageRank (요소 내부 합 = 1)
+    dangling 노드의 확률은 요소 내부로 재분배 → 요소끼리 독립적으로 계산 가능
+    """
+    index = {node: i for i, node in enumerate(component)}
+    n = len(component)
+    src = [index[s] for s, _ in edges]
+    dst = [index[d] for _, d in edges]
+    out_deg = [0] * n
+    for s in src:
+        out_deg[s] += 1
+
+    pagerank = _pagerank_numpy if np is not None else _pagerank_python
+    return dict(zip(component, pagerank(n, src, dst, out_deg)))
+
+
+def _component_key(component: List[str], edges: List[Tuple[str, str]]) -> str:
+    h = hashlib.sha1()
+    for node in component:
+        h.update(node.encode('utf-8') + b'\0')
+    h.update(b'\1')
+    for s, d in edges:
+        h.update(f"{s}\0{d}\0".encode('utf-8'))
+    return h.hexdigest()
+
+
+# ===== 전체 분석 =====
+
+class GraphAnalyzer:
+    """
+    연결 요소 단위 결과 캐시 (요소 노드+간선 해시 → (PageRank, 브리지))
+    링크가 바뀌지 않은 요소는 다시 계산하지 않음
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache: Dict[str, Tuple[Dict[str, float], List[Tuple[str, str]]]] = {}
+
+        if self.cache_path and self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get('version') == GRAPH_CACHE_VERSION:
+                    self._cache = cached['components']
+            except Exception:
+                pass  # 손상된 캐시 → 전체 재계산
+
+    def analyze(self, graph: LinkGraph) -> GraphMetrics:
+        nodes = sorted(graph.notes)
+        edges = list(graph.edges())
+
+        in_degree = dict.fromkeys(nodes, 0)
+        out_degree = dict.fromkeys(nodes, 0)
+        undirected = {node: set() for node in nodes}
+        for s, d in edges:
+            out_degree[s] += 1
+            in_degree[d] += 1
+            undirected[s].add(d)
+            undirected[d].add(s)
+
+        components = connected_components(nodes, undirected)
+        component_of = {node: ci for ci, component in enumerate(components) for node in component}
+        component_edges: List[List[Tuple[str, str]]] = [[] for _ in components]
+        for s, d in sorted(edges):
+            component_edges[component_of[s]].append((s, d))
+
+        total = len(nodes)
+        pagerank: Dict[str, float] = {}
+        bridges: List[Tuple[str, str]] = []
+        cache: Dict[str, Tuple[Dict[str, float], List[Tuple[str, str]]]] = {}
+        recomputed = 0
+
+        for component, c_edges in zip(components, component_edges):
+            if len(component) == 1:
+                local = ({component[0]: 1.0}, [])
+            else:
+                key = _component_key(component, c_edges)
+                local = self._cache.get(key)
+                if local is None:
+                    local = (component_pagerank(component, c_edges),
+                             find_bridges(component, undirected))
+                    recomputed += 1
+                cache[key] = local
+
+            # 요소 내부 PageRank × (요소 크기 / 전체 노드 수) → 전체 합 = 1
+            scale = len(component) / total
+            for node, value in local[0].items():
+                pagerank[node] = value * scale
+            bridges.extend(local[1])
+
+        self._cache = cache
+
+        dangling = [(link.source, link.line_no,
+                     link.target + (f"#{link.heading}" if link.heading else ""), reason)
+                    for link, reason in graph.dangling()]
+
+        return GraphMetrics(nodes, len(edges), in_degree, out_degree, pagerank,
+                            components, sorted(bridges), dangling, recomputed)
+
+    def save(self):
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'wb') as f:
+            pickle.dump({'version': GRAPH_CACHE_VERSION, 'components': self._cache}, f)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Compact Issue Store
+이슈를 dict 리스트 대신 array 컬럼으로 저장 (파일/카테고리/메시지는 intern 테이블)
+우선순위/카테고리별 개수와 파일별 점수는 추가 시점에 갱신
+"""
+
+from array import array
+from collections import Counter
+from typing import List, Dict, Iterator, Optional
+
+PRIORITIES = ('P1', 'P2', 'P3')
+PRIORITY_CODES = {p: code for code, p in enumerate(PRIORITIES)}
+
+
+class _InternTable:
+    """값 ↔ 정수 id"""
+
+    __slots__ = ('values', 'ids')
+
+    def __init__(self):
+        self.values = []
+        self.ids = {}
+
+    def intern(self, value) -> int:
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def __len__(self):
+        return len(self.values)
+
+
+class IssueStore:
+    """
+    전체 검증 결과 저장소
+    issue dict는 iter_issues()로 필요할 때만 다시 만들어짐
+    """
+
+    def __init__(self):
+        self._files = _InternTable()
+        self._categories = _InternTable()
+        self._messages = _InternTable()  # (issue, suggestion)
+
+        # 이슈 1건 = 컬럼별 1칸
+        self._file_col = array('I')
+        self._priority_col = array('B')
+        self._category_col = array('H')
+        self._message_col = array('I')
+
+        # 증분 집계
+        self._priority_counts = [0] * len(PRIORITIES)
+        self._category_counts = array('I')
+        self.scores: Dict[str, int] = {}   # 이슈가 있는 파일만 (파일명 → 점수)
+
+    @classmethod
+    def from_issues(cls, all_issues: List[Dict], scores: Dict[str, int]) -> 'IssueStore':
+        """기존 (all_issues, scores) 형태에서 생성"""
+        store = cls()
+        for issue in all_issues:
+            store._append(issue)
+        store.scores.update(scores)
+        return store
+
+    def add(self, file_name: str, score: int, issues: List[Dict]):
+        """노트 1개의 check_note 결과 추가 (이슈 없으면 무시)"""
+        if not issues:
+            return
+        for issue in issues:
+            self._append(issue)
+        self.scores[file_name] = score
+
+    def _append(self, issue: Dict):
+        priority = PRIORITY_CODES[issue['priority']]
+        category = self._categories.intern(issue['category'])
+        if category == len(self._category_counts):
+            self._category_counts.append(0)
+
+        self._file_col.append(self._files.intern(issue['file']))
+        self._priority_col.append(priority)
+        self._category_col.append(category)
+        self._message_col.append(self._messages.intern((issue['issue'], issue['suggestion'])))
+
+        self._priority_counts[priority] += 1
+        self._category_counts[category] += 1
+
+    def __len__(self) -> int:
+        return len(self._file_col)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_issues()
+
+    def iter_issues(self, priority: Optional[str] = None) -> Iterator[Dict]:
+        """issue dict 렌더링 (priority 지정 시 해당 우선순위만)"""
+        code = PRIORITY_CODES[priority] if priority else None
+        files = self._files.values
+        categories = self._categories.values
+        messages = self._messages.values
+
+        for i, p in enumerate(self._priority_col):
+            if code is not None and p != code:
+                continue
+            text, suggestion = messages[self._message_col[i]]
+            yield {
+                'priority': PRIORITIES[p],
+                'category': categories[self._category_col[i]],
+                'file': files[self._file_col[i]],
+                'issue': text,
+                'suggestion': suggestion
+            }
+
+    def priority_counts(self) -> Counter:
+        return Counter(dict(zip(PRIORITIES, self._priority_counts)))
+
+    def category_counts(self) -> Counter:
+        """카테고리별 개수 (처음 등장한 순서 유지 → most_common 동률 순서 동일)"""
+        return Counter(dict(zip(self._categories.values, self._category_counts)))
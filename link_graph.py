@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Vault Link Graph Index
+[[위키링크]] 해석 (파일명/경로/별칭 + #헤딩) → 백링크, 고아 노트, 끊어진 링크 조회
+노트별 파싱 결과는 .rsi_cache/link_graph.sqlite에 저장, 바뀐 파일만 다시 파싱
+
+사용법:
+    python link_graph.py backlinks <노트>
+    python link_graph.py read <노트>
+    python link_graph.py orphans
+    python link_graph.py dangling
+"""
+
+import re
+import sys
+import posixpath
+import json
+import sqlite3
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Iterator
+
+from quality_cache import CACHE_DIR
+from note_parser import find_wikilinks
+from note_reader import read_note
+from vault_watcher import scan_vault
+
+try:
+    import yaml
+except ImportError:  # 선택적 의존성
+    yaml = None
+
+GRAPH_SCHEMA = 3
+
+HEADING_RE = re.compile(r'#{1,6}\s+(.+)')
+ALIAS_ITEM_RE = re.compile(r'\s*-\s*(.+)')
+
+
+@dataclass(frozen=True)
+class Link:
+    source: str     # vault 기준 경로 (예: Resources/노트.md)
+    target: str     # 정규화된 링크 대상 (소문자, .md 제거)
+    heading: str    # '#' 뒤 부분 (없으면 '')
+    line_no: int
+    line: str
+
+
+def normalize_target(raw: str) -> Tuple[str, str]:
+    """'경로/노트#헤딩|별칭' → ('경로/노트', '헤딩')"""
+    target = raw.split('|', 1)[0]
+    target, _, heading = target.partition('#')
+    target = target.strip().replace('\\', '/').lower()
+    if target.endswith('.md'):
+        target = target[:-3]
+    return target, heading.strip()
+
+
+def absolute_target(target: str, source: str) -> str:
+    """'../폴더/노트' 같은 상대 경로 → 링크를 건 노트 폴더 기준 경로"""
+    if target.startswith(('./', '../')):
+        return posixpath.normpath(posixpath.join(posixpath.dirname(source.lower()), target))
+    return target
+
+
+def _suffix_key(stem: str) -> Optional[str]:
+    """경로 끝 두 부분 ('폴더/노트') - 경로 링크의 접미사 후보 조회용 (한 부분뿐이면 None)"""
+    parts = stem.rsplit('/', 2)
+    return '/'.join(parts[-2:]) if len(parts) > 1 else None
+
+
+def _strip_quotes(value: str) -> str:
+    return value.strip().strip('"\'')
+
+
+def parse_aliases(text: str) -> List[str]:
+    """frontmatter의 aliases (yaml 없으면 'aliases: [a, b]' / '- a' 형식만)"""
+    if not text.startswith('---\n'):
+        return []
+    end = text.find('\n---', 4)
+    if end == -1:
+        return []
+    front = text[4:end]
+
+    if yaml is not None:
+        try:
+            data = yaml.safe_load(front)
+        except yaml.YAMLError:
+            return []
+        aliases = data.get('aliases') if isinstance(data, dict) else None
+        if isinstance(aliases, str):
+            return [aliases]
+        return [str(a) for a in aliases or [] if a]
+
+    aliases = []
+    lines = front.split('\n')
+    for i, line in enumerate(lines):
+        if not line.startswith('aliases:'):
+            continue
+        value = line[len('aliases:'):].strip()
+        if value.startswith('['):
+            aliases = [_strip_quotes(a) for a in value.strip('[]').split(',') if a.strip()]
+        elif value:
+            aliases = [_strip_quotes(value)]
+        else:
+            for item in lines[i + 1:]:
+                m = ALIAS_ITEM_RE.match(item)
+                if not m:
+                    break
+                aliases.append(_strip_quotes(m.group(1)))
+        break
+    return aliases
+
+
+def parse_links(text: str) -> Tuple[List[Tuple[int, str, str, str]], List[str]]:
+    """노트 1개 → ([(줄 번호, 대상, 헤딩, 줄 내용)], [헤딩])"""
+    links = []
+    headings = []
+    in_code = False
+    for line_no, line in enumerate(text.split('\n'), 1):
+        # 코드 블록 안의 [[...]] / '#'은 링크·헤딩이 아님
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        if line.startswith('#'):
+            m = HEADING_RE.match(line)
+            if m:
+                headings.append(m.group(1).strip())
+        if '[[' in line:
+            for raw in find_wikilinks(line):
+                target, heading = normalize_target(raw)
+                if target or heading:
+                    links.append((line_no, target, heading, line.rstrip()))
+    return links, headings
+
+
+class LinkGraph:
+    """
+    vault 전체 링크 그래프
+    역방향 인덱스는 링크 대상 문자열 기준 → 새 노트가 생겨도 다른 노트를 다시 해석할 필요 없음
+    """
+
+    def __init__(self, vault_path, db_path: Optional[Path] = None):
+        self.vault_path = Path(vault_path)
+        self.db_path = Path(db_path) if db_path else self.vault_path / CACHE_DIR / "link_graph.sqlite"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != GRAPH_SCHEMA:
+            self.conn.executescript(
+                "DROP TABLE IF EXISTS notes; DROP TABLE IF EXISTS links;"
+                "CREATE TABLE notes (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER,"
+                " aliases TEXT, headings TEXT);"
+                "CREATE TABLE links (source TEXT, line_no INTEGER, target TEXT,"
+                " heading TEXT, line TEXT);"
+                "CREATE INDEX links_source ON links (source);"
+                f"PRAGMA user_version = {GRAPH_SCHEMA};")
+
+        self._stat: Dict[str, Tuple[int, int]] = {}
+        self._aliases: Dict[str, List[str]] = {}
+        self._headings: Dict[str, set] = {}
+        self._outgoing: Dict[str, List[Link]] = {}
+
+        # 해석용 인덱스 (모두 소문자)
+        self._by_name: Dict[str, List[str]] = {}     # 파일명 → [경로]
+        self._by_path: Dict[str, str] = {}           # 확장자 없는 경로 → 경로
+        self._by_suffix: Dict[str, List[str]] = {}   # 경로 끝 두 부분 → [경로]
+        self._by_alias: Dict[str, str] = {}          # 별칭 → 경로
+        self._inbound: Dict[str, List[Link]] = {}    # 링크 대상 → [링크]
+
+        for path, mtime_ns, size, aliases, headings in self.conn.execute(
+                "SELECT path, mtime_ns, size, aliases, headings FROM notes"):
+            self._stat[path] = (mtime_ns, size)
+            self._index_note(path, json.loads(aliases), json.loads(headings))
+        rows = {}
+        for source, line_no, target, heading, line in self.conn.execute(
+                "SELECT source, line_no, target, heading, line FROM links ORDER BY rowid"):
+            rows.setdefault(source, []).append(Link(source, target, heading, line_no, line))
+        for source, links in rows.items():
+            self._index_links(source, links)
+
+    # ===== 인덱스 유지 =====
+
+    def _index_note(self, path: str, aliases: List[str], headings: List[str]):
+        stem = path[:-3].lower()
+        self._by_name.setdefault(stem.rsplit('/', 1)[-1], []).append(path)
+        self._by_path[stem] = path
+        suffix = _suffix_key(stem)
+        if suffix:
+            self._by_suffix.setdefault(suffix, []).append(path)
+        self._aliases[path] = aliases
+        for alias in aliases:
+            self._by_alias.setdefault(alias.lower(), path)
+        self._headings[path] = {h.lower() for h in headings}
+
+    def _unindex_note(self, path: str):
+        stem = path[:-3].lower()
+        name = stem.rsplit('/', 1)[-1]
+        paths = self._by_name.get(name, [])
+        if path in paths:
+            paths.remove(path)
+            if not paths:
+                del self._by_name[name]
+        self._by_path.pop(stem, None)
+        suffix = _suffix_key(stem)
+        paths = self._by_suffix.get(suffix, [])
+        if path in paths:
+            paths.remove(path)
+            if not paths:
+                del self._by_suffix[suffix]
+        for alias in self._aliases.pop(path, []):
+            if self._by_alias.get(alias.lower()) == path:
+                del self._by_alias[alias.lower()]
+        self._headings.pop(path, None)
+
+    def _index_links(self, source: str, links: List[Link]):
+        self._outgoing[source] = links
+        for link in links:
+            if link.target:
+                self._inbound.setdefault(link.target, []).append(link)
+
+    def _unindex_links(self, source: str):
+        for link in self._outgoing.pop(source, []):
+            inbound = self._inbound.get(link.target)
+            if inbound is None:
+                continue
+            inbound[:] = [l for l in inbound if l.source != source]
+            if not inbound:
+                del self._inbound[link.target]
+
+    def _key(self, file_path) -> str:
+        file_path = Path(file_path)
+        try:
+            return file_path.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def update_file(self, file_path, stat: Optional[Tuple[int, int]] = None):
+        """노트 1개 다시 파싱 (생성/수정)"""
+        file_path = Path(file_path)
+        path = self._key(file_path)
+        if stat is None:
+            st = file_path.stat()
+            stat = (st.st_mtime_ns, st.st_size)
+
+        # 품질 체커와 같은 읽기 (BOM/인코딩 판별, 분석 상한)
+        text = read_note(file_path).text
+        raw_links, headings = parse_links(text)
+        aliases = parse_aliases(text)
+
+        self.remove_file(file_path)
+        self._stat[path] = stat
+        self._index_note(path, aliases, headings)
+        links = [Link(path, absolute_target(target, path), heading, line_no, line)
+                 for line_no, target, heading, line in raw_links]
+        self._index_links(path, links)
+
+        self.conn.execute("INSERT INTO notes VALUES (?, ?, ?, ?, ?)",
+                          (path, *stat, json.dumps(aliases, ensure_ascii=False),
+                           json.dumps(headings, ensure_ascii=False)))
+        self.conn.executemany("INSERT INTO links VALUES (?, ?, ?, ?, ?)",
+                              [(path, l.line_no, l.target, l.heading, l.line) for l in links])
+
+    def remove_file(self, file_path):
+        """노트 1개 제거 (삭제)"""
+        path = self._key(file_path)
+        if self._stat.pop(path, None) is None:
+            return
+        self._unindex_note(path)
+        self._unindex_links(path)
+        self.conn.execute("DELETE FROM notes WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM links WHERE source = ?", (path,))
+
+    def refresh(self) -> Tuple[int, int]:
+        """디스크와 동기화 (mtime/size가 바뀐 노트만 다시 파싱) → (갱신 수, 삭제 수)"""
+        snapshot = {self._key(p): (p, stat) for p, stat in scan_vault(self.vault_path).items()}
+
+        removed = [path for path in self._stat if path not in snapshot]
+        for path in removed:
+            self.remove_file(self.vault_path / path)
+
+        updated = 0
+        for path, (abs_path, stat) in snapshot.items():
+            if self._stat.get(path) != stat:
+                try:
+                    self.update_file(abs_path, stat)
+                except OSError:
+                    continue
+                updated += 1
+
+        self.save()
+        return updated, len(removed)
+
+    def save(self):
+        self.conn.commit()
+
+    def close(self):
+        self.save()
+        self.conn.close()
+
+    # ===== 조회 =====
+
+    @property
+    def notes(self) -> List[str]:
+        return list(self._stat)
+
+    def resolve(self, target: str, source: Optional[str] = None) -> Optional[str]:
+        """
+        정규화된 링크 대상 → 노트 경로 (없으면 None)
+        경로 포함 시 경로 끝부분 일치, 파일명이 겹치면 같은 폴더 → 짧은 경로 우선, 마지막으로 별칭
+        """
+        if not target:
+            return source
+        if '/' in target:
+            path = self._by_path.get(target)
+            if path:
+                return path
+            # 끝 두 부분이 같은 노트만 후보 → O(후보 수)
+            suffix = '/' + target
+            matches = [p for p in self._by_suffix.get(_suffix_key(target), [])
+                       if p[:-3].lower().endswith(suffix)]
+            if matches:
+                return min(matches, key=len)
+        else:
+            candidates = self._by_name.get(target)
+            if candidates:
+                if len(candidates) > 1 and source:
+                    folder = source.rsplit('/', 1)[0] if '/' in source else ''
+                    for p in candidates:
+                        if (p.rsplit('/', 1)[0] if '/' in p else '') == folder:
+                            return p
+                return min(candidates, key=len)
+        return self._by_alias.get(target)
+
+    def find_note(self, query: str) -> Optional[str]:
+        """노트 이름/경로/별칭 → 노트 경로"""
+        query = query.replace('\\', '/')
+        if query.startswith('./'):
+            query = query[2:]
+        if query in self._stat:
+            return query
+        return self.resolve(normalize_target(query)[0])
+
+    def outgoing(self, note: str) -> List[Link]:
+        return self._outgoing.get(note, [])
+
+    def backlinks(self, note: str) -> List[Link]:
+        """note를 가리키는 링크 (파일명/경로 접미사/별칭 키만 조회 → O(차수))"""
+        stem = note[:-3].lower()
+        parts = stem.split('/')
+        keys = ['/'.join(parts[i:]) for i in range(len(parts))]
+        keys.extend(alias.lower() for alias in self._aliases.get(note, []))
+
+        result = []
+        seen = set()
+        for key in keys:
+            for link in self._inbound.get(key, []):
+                if link.source == note or id(link) in seen:
+                    continue
+                if self.resolve(link.target, link.source) == note:
+                    seen.add(id(link))
+                    result.append(link)
+        result.sort(key=lambda l: (l.source, l.line_no))
+        return result
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        """해석된 링크 (출발 노트, 대상 노트) - 중복/자기 링크 제외"""
+        for source, links in self._outgoing.items():
+            targets = set()
+            for link in links:
+                target = self.resolve(link.target, source)
+                if target and target != source and target not in targets:
+                    targets.add(target)
+                    yield source, target
+
+    def dangling(self) -> Iterator[Tuple[Link, str]]:
+        """끊어진 링크 → (링크, 사유) - 노트 없음 또는 헤딩 없음"""
+        for source, links in self._outgoing.items():
+            for link in links:
+                target = self.resolve(link.target, source)
+                if target is None:
+                    yield link, "노트 없음"
+                elif (link.heading and not link.heading.startswith('^') and
+                      link.heading.lower() not in self._headings.get(target, ())):
+                    yield link, "헤딩 없음"
+
+    def orphans(self) -> List[str]:
+        """들어오는 링크도, 해석되는 나가는 링크도 없는 노트"""
+        linked = set()
+        for source, target in self.edges():
+            linked.add(source)
+            linked.add(target)
+        return sorted(path for path in self._stat if path not in linked)
+
+
+def _print_links(links: List[Link]):
+    for link in links:
+        print(f"./{link.source}:{link.line_no}:{link.line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vault link graph (backlinks / orphans / dangling)")
+    parser.add_argument('command', choices=['backlinks', 'read', 'orphans', 'dangling'])
+    parser.add_argument('note', nargs='?')
+    parser.add_argument('--vault', default=str(Path(__file__).resolve().parent),
+                        help="vault 경로 (기본: 스크립트 위치)")
+    args = parser.parse_args()
+
+    graph = LinkGraph(args.vault)
+    graph.refresh()
+
+    try:
+        if args.command in ('backlinks', 'read'):
+            if not args.note:
+                parser.error(f"{args.command}: 노트 이름이 필요합니다")
+            note = graph.find_note(args.note)
+            if note is None:
+                print(f"Note not found: {args.note}", file=sys.stderr)
+                sys.exit(1)
+
+            if args.command == 'read':
+                abs_path = graph.vault_path / note
+                print(f"=== {abs_path} ===\n")
+                text = read_note(abs_path).text
+                for line_no, line in enumerate(text.splitlines(), 1):
+                    print(f"{line_no:6d}→{line}")
+                print("\n=== Backlinks ===")
+
+            links = graph.backlinks(note)
+            if links:
+                _print_links(links)
+            else:
+                print("(no backlinks)")
+
+        elif args.command == 'orphans':
+            orphans = graph.orphans()
+            for path in orphans:
+                print(path)
+            print(f"\n🔗 Orphans: {len(orphans)}/{len(graph.notes)}")
+
+        elif args.command == 'dangling':
+            count = 0
+            for link, reason in graph.dangling():
+                target = link.target + (f"#{link.heading}" if link.heading else "")
+                print(f"./{link.source}:{link.line_no}: [[{target}]] ({reason})")
+                count += 1
+            print(f"\n⚠️  Dangling links: {count}")
+    finally:
+        graph.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Note-level Diff
+git diff --cached -z --raw --numstat -p 출력 하나를 줄 단위로 읽으면서 노트별 내용 변화 집계
+추가/삭제된 위키링크, 체크된 할 일 ([ ] → [x]), 0_Long_Term_RSI_Log.md의 새 '## Day N' (품질 점수는 note_scores.py)
+diff는 파일마다 git을 부르지 않고 1회, 본문은 보관하지 않고 줄마다 카운트만 갱신
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, Iterable, List, Optional
+
+from git_changes import ChangeSet, FileChange, parse_cached_diff
+from link_graph import normalize_target
+from note_parser import find_wikilinks
+from rsi_log import DAY_HEADER_RE
+
+RSI_LOG_PATH = "0_Long_Term_RSI_Log.md"
+TASK_RE = re.compile(r'\s*[-*+]\s+\[([ xX])\]\s+(.+)')
+
+# 파일별 patch 시작 줄 (raw 항목과 같은 순서)
+SECTION_STARTS = ('diff --git ', '* Unmerged path ')
+
+
+@dataclass
+class NoteDelta:
+    path: str
+    links_added: List[str] = field(default_factory=list)
+    links_removed: List[str] = field(default_factory=list)
+    tasks_done: List[str] = field(default_factory=list)
+    days_added: List[int] = field(default_factory=list)
+    score_before: Optional[int] = None
+    score_after: Optional[int] = None
+
+    @property
+    def score_changed(self) -> bool:
+        return (self.score_before is not None and self.score_after is not None and
+                self.score_before != self.score_after)
+
+
+class _LineCounter:
+    """한 파일의 +/- 줄 → 링크 / 할 일 / Day 헤더 카운트"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.is_log = path == RSI_LOG_PATH
+        self.links = {'+': Counter(), '-': Counter()}
+        self.names: Dict[str, str] = {}   # 정규화된 대상 → 처음 본 표기
+        self.done = Counter()              # '+' 줄의 [x] 할 일
+        self.open = Counter()              # '-' 줄의 [ ] 할 일
+        self.days = {'+': set(), '-': set()}
+
+    def feed(self, line: str):
+        sign = line[:1]
+        if sign != '+' and sign != '-':
+            return
+        text = line[1:]
+        if '[[' in text:
+            for raw in find_wikilinks(text):
+                target, _ = normalize_target(raw)
+                if target:
+                    self.links[sign][target] += 1
+                    self.names.setdefault(target, raw.split('|', 1)[0].partition('#')[0].strip())
+        if '[' in text:
+            m = TASK_RE.match(text)
+            if m:
+                checked = m.group(1) != ' '
+                if sign == '+' and checked:
+                    self.done[m.group(2).strip()] += 1
+                elif sign == '-' and not checked:
+                    self.open[m.group(2).strip()] += 1
+        if self.is_log and text.startswith('#'):
+            m = DAY_HEADER_RE.match(text)
+            if m:
+                self.days[sign].add(int(m.group(1)))
+
+    def delta(self) -> Optional[NoteDelta]:
+        """줄을 옮기기만 한 링크/헤더는 +/-가 상쇄"""
+        plus, minus = self.links['+'], self.links['-']
+        delta = NoteDelta(
+            self.path,
+            links_added=[self.names[t] for t in plus - minus],
+            links_removed=[self.names[t] for t in minus - plus],
+            tasks_done=list((self.done & self.open).elements()),
+            days_added=sorted(self.days['+'] - self.days['-']))
+        if delta.links_added or delta.links_removed or delta.tasks_done or delta.days_added:
+            return delta
+        return None
+
+
+def scan_note_lines(change: FileChange, lines: Iterable[str]) -> Optional[NoteDelta]:
+    """노트 하나의 hunk 줄 ('+'/'-'/' ' 접두사) → NoteDelta (변화 없으면 None)"""
+    counter = _LineCounter(change.path)
+    for line in lines:
+        counter.feed(line)
+    return counter.delta()
+
+
+def _section_matches(line: str, change: FileChange) -> bool:
+    """'diff --git a/X b/Y'가 raw 항목과 같은 파일인지 (따옴표로 감싼 경로는 확인 생략)"""
+    if not line.startswith('diff --git ') or '"' in line:
+        return True
+    return line.rstrip('\n').endswith(' b/' + change.path)
+
+
+def read_cached_diff(lines: Iterable[str]) -> ChangeSet:
+    """
+    git diff --cached -z -M -C --raw --numstat -p 출력 (줄 단위 iterator)
+    앞부분 raw/numstat (NUL 구분, 빈 항목으로 끝) → ChangeSet
+    뒷부분 patch는 raw 항목 순서대로 파일별 구간 → 노트만 줄마다 집계해서 ChangeSet.notes
+    """
+    it = iter(lines)
+    header = ''
+    rest = None
+    for line in it:
+        header += line
+        head, sep, tail = header.partition('\0\0')
+        if sep:
+            header, rest = head + '\0', tail
+            break
+    change_set = parse_cached_diff(header)
+    if rest is None:
+        return change_set
+
+    index = -1
+    counter = None
+    in_hunk = False
+    for line in chain([rest] if rest else [], it):
+        if line.startswith(SECTION_STARTS):
+            if counter is not None:
+                _store(change_set, counter)
+            index += 1
+            counter = None
+            in_hunk = False
+            if index >= len(change_set.changes) or \
+                    not _section_matches(line, change_set.changes[index]):
+                # raw 항목과 순서가 어긋남 → 내용 집계 없이 나머지는 읽기만
+                change_set.notes.clear()
+                for _ in it:
+                    pass
+                return change_set
+            change = change_set.changes[index]
+            if change.is_note:
+                counter = _LineCounter(change.path)
+        elif counter is not None:
+            if in_hunk:
+                counter.feed(line)
+            elif line.startswith('@@'):
+                in_hunk = True
+    if counter is not None:
+        _store(change_set, counter)
+    return change_set
+
+
+def _store(change_set: ChangeSet, counter: _LineCounter):
+    delta = counter.delta()
+    if delta is not None:
+        change_set.notes[delta.path] = delta
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Single-pass Markdown Note Parser
+노트를 한 번만 훑어서 ParsedNote 생성 → 모든 품질 규칙이 공유
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
+
+# 링크 패턴은 줄 단위 str.find 스캐너로 처리 (아래 find_wikilinks 등)
+# 아래 정규식과 결과가 같지만, '[[' 만 수천 개 붙여넣은 줄 같은 입력에서도 선형 시간
+#   WIKILINK_RE     = r'\[\[(.*?)\]\]'
+#   LINK_CONTEXT_RE = r'(.{20})\[\[.*?\]\](.{20})'
+#   MD_LINK_RE      = r'\[([^\]]+)\]\(([^\)]+)\)'
+LINK_CONTEXT_CHARS = 20
+# 예제 블록은 아래 정규식 (MULTILINE | DOTALL)과 같은 결과 → _example_head
+#   r'^###\s+(?:사례|예제|Example)\s+\d+:?\s*(.+?)$\n(.*?)(?=^###|^##|\Z)'
+# \s가 줄바꿈도 포함 → 번호 뒤 제목이 다음 줄일 수 있고, 파일 끝에서는 역추적으로 제목이 짧아짐
+EXAMPLE_KEYWORDS = ('사례', '예제', 'Example')
+CORE_TITLE_RE = re.compile(r'핵심\s*내용')
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+
+
+def find_wikilinks(line: str) -> List[str]:
+    """[[...]] 안쪽 텍스트 목록"""
+    found = []
+    pos = 0
+    while True:
+        start = line.find('[[', pos)
+        if start == -1:
+            return found
+        end = line.find(']]', start + 2)
+        if end == -1:
+            return found  # 뒤에 ']]'가 없으면 이후 '[['도 매치 불가
+        found.append(line[start + 2:end])
+        pos = end + 2
+
+
+def _link_contexts(line: str) -> List[Tuple[str, str]]:
+    """[[...]] 앞뒤 20자 (양쪽에 20자가 모두 있는 링크만)"""
+    width = LINK_CONTEXT_CHARS
+    limit = len(line) - width
+    found = []
+    pos = 0
+    while True:
+        start = line.find('[[', pos + width)
+        if start == -1:
+            return found
+        end = line.find(']]', start + 2, limit)
+        if end == -1:
+            return found
+        found.append((line[start - width:start], line[end + 2:end + 2 + width]))
+        pos = end + 2 + width
+
+
+def _skip(text: str, pos: int, pred) -> int:
+    n = len(text)
+    while pos < n and pred(text[pos]):
+        pos += 1
+    return pos
+
+
+def _example_head(text: str, p: int) -> Optional[Tuple[str, int]]:
+    """
+    p('###' 줄 시작)의 예제 헤더 → (제목, 본문 시작) 또는 None
+    정규식의 역추적 순서 그대로: 번호 전체 → ':' 포함/제외 → 공백 최대에서 줄여가며 → 번호 줄이기
+    """
+    i = _skip(text, p + 3, str.isspace)
+    if i == p + 3:
+        return None
+    keyword = next((k for k in EXAMPLE_KEYWORDS if text.startswith(k, i)), None)
+    if keyword is None:
+        return None
+    k = i + len(keyword)
+    m = _skip(text, k, str.isspace)
+    if m == k:
+        return None
+    d_end = _skip(text, m, str.isdecimal)
+    if d_end == m:
+        return None
+
+    # (.+?)$\n: 제목 시작 s 뒤 (s+1 이후) 첫 '\n'까지가 제목
+    starts = [d_end + 1, d_end] if text.startswith(':', d_end) else [d_end]
+    for a in starts:
+        w_end = _skip(text, a, str.isspace)
+        j = text.find('\n', w_end + 1)
+        if j != -1:
+            return text[w_end:j], j + 1
+        # 뒤에 줄바꿈이 없음 → 공백을 줄여서 공백 안의 마지막 '\n' 바로 앞 글자가 제목
+        r = text.rfind('\n', a + 1, w_end)
+        if r != -1:
+            return text[r - 1:r], r + 1
+
+    # 번호를 한 자리 줄임 → 마지막 숫자부터 제목
+    if d_end - m >= 2:
+        j = text.find('\n', d_end)
+        if j != -1:
+            return text[d_end - 1:j], j + 1
+    return None
+
+
+def _count_md_links(line: str) -> int:
+    """[text](url) 개수 (text, url 모두 비어있지 않은 것)"""
+    count = 0
+    start = line.find('[')
+    while start != -1:
+        close = line.find(']', start + 1)
+        if close == -1:
+            break
+        if close > start + 1 and line.startswith('(', close + 1):
+            paren = line.find(')', close + 2)
+            if paren == -1:
+                break
+            if paren > close + 2:
+                count += 1
+                start = line.find('[', paren + 1)
+                continue
+        # start~close 사이의 '['도 같은 ']'에서 실패 → close 이후부터
+        start = line.find('[', close + 1)
+    return count
+
+
+@dataclass
+class Heading:
+    level: int
+    title: str
+    line_no: int
+    start: int      # 헤딩 줄 시작 offset
+    end: int        # 헤딩 줄 끝 offset ('\n' 위치)
+    body_end: int   # 다음 '##' 줄 시작 (또는 문서 끝)
+
+
+@dataclass
+class Example:
+    title: str
+    body: str
+
+
+@dataclass
+class ParsedNote:
+    text: str
+    headings: List[Heading] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+    link_contexts: List[Tuple[str, str]] = field(default_factory=list)
+    md_link_count: int = 0
+    examples: List[Example] = field(default_factory=list)
+    sentence_lengths: List[int] = field(default_factory=list)
+    dollar_count: int = 0
+    has_block_math: bool = False
+
+    @property
+    def char_count(self) -> int:
+        return len(self.text)
+
+    @property
+    def section_count(self) -> int:
+        """'## ' 섹션 수"""
+        return sum(1 for h in self.headings if h.level == 2)
+
+    def section_body(self, heading: Heading) -> str:
+        return self.text[heading.end:heading.body_end]
+
+    def core_content(self) -> Optional[str]:
+        """'## 핵심 내용' 섹션 본문 (없으면 None)"""
+        for h in self.headings:
+            if h.level == 2 and CORE_TITLE_RE.fullmatch(h.title):
+                return self.section_body(h).strip()
+        return None
+
+    def has_section_prefix(self, *prefixes: str) -> bool:
+        """제목이 prefixes 중 하나로 시작하는 '##' 섹션 존재 여부"""
+        return any(h.level == 2 and h.title.startswith(prefixes)
+                   for h in self.headings)
+
+
+def parse_note(text: str) -> ParsedNote:
+    """노트 파싱 (줄 단위 1회 스캔 + 문장 분할 1회)"""
+    note = ParsedNote(text=text)
+    n = len(text)
+
+    # '##'로 시작하는 줄 = 섹션/예제 본문의 경계
+    breaks = []
+    example_starts = []
+
+    offset = 0
+    for line_no, line in enumerate(text.split('\n'), 1):
+        end = offset + len(line)
+
+        if line.startswith('#'):
+            if line.startswith('##'):
+                breaks.append(offset)
+
+                if line.startswith('###'):
+                    example_starts.append(offset)
+
+            rest = line.lstrip('#')
+            level = len(line) - len(rest)
+            if rest[:1].isspace() or (not rest and end < n):
+                heading = Heading(level, rest.strip(), line_no, offset, end, n)
+                note.headings.append(heading)
+
+        if '[[' in line:
+            note.links.extend(find_wikilinks(line))
+            note.link_contexts.extend(_link_contexts(line))
+
+        if '](' in line:
+            note.md_link_count += _count_md_links(line)
+
+        offset = end + 1
+
+    # 본문 끝 = 자신 이후 첫 '##' 줄
+    bi = 0
+    for h in note.headings:
+        while bi < len(breaks) and breaks[bi] <= h.end:
+            bi += 1
+        h.body_end = breaks[bi] if bi < len(breaks) else n
+
+    # 예제: 앞 예제(헤더 + 본문) 안에 들어간 '###' 줄은 건너뜀 (finditer처럼 겹치지 않게)
+    matched_end = 0
+    for start in example_starts:
+        if start < matched_end:
+            continue
+        head = _example_head(text, start)
+        if head is None:
+            continue
+        title, body_start = head
+        bi = bisect_left(breaks, body_start)
+        body_end = breaks[bi] if bi < len(breaks) else n
+        note.examples.append(Example(title, text[body_start:body_end]))
+        matched_end = body_end
+
+    note.sentence_lengths = [len(s) for s in SENTENCE_SPLIT_RE.split(text)]
+    note.dollar_count = text.count('$')
+    note.has_block_math = '$$' in text
+
+    return note
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Note / Log Reader
+파일은 한 번만 읽음 (큰 파일은 mmap → 전체를 bytes로 복사하지 않고 버퍼에서 바로 디코딩)
+인코딩: BOM → 캐시된 인코딩 → 후보(utf-16 추정, utf-8, cp949)를 청크 단위 증분 디코딩으로 검증
+잘못된 바이트를 만나는 즉시 다음 후보로 → 성공한 후보의 디코딩 결과를 그대로 사용 (디코딩 1회)
+MAX_ANALYSIS_BYTES를 넘는 파일(붙여넣은 거대 로그 등)은 앞부분만 읽음 → truncated
+read_note는 줄바꿈을 '\n'으로 통일 (open()의 universal newlines와 같음, decode_buffer는 byte offset용이라 그대로)
+"""
+
+import os
+import mmap
+import json
+import codecs
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional
+
+from quality_cache import CACHE_DIR, Stamp
+
+MMAP_THRESHOLD = 1 << 20        # 1MB 이상이면 mmap
+MAX_ANALYSIS_BYTES = 8 << 20    # 분석 상한 8MB
+SAMPLE_BYTES = 64 << 10         # utf-16 추정용 샘플
+CHUNK_BYTES = 1 << 20           # 증분 디코딩 단위
+
+ENCODING_CACHE_FILE = "encodings.json"
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+]
+
+# euc-kr은 cp949의 부분집합 → cp949만 시도
+FALLBACK_ENCODINGS = ('utf-8', 'cp949')
+
+
+@dataclass
+class NoteText:
+    text: str
+    encoding: str
+    size: int                 # 파일 전체 바이트
+    analyzed: int             # 실제로 디코딩한 바이트 (BOM 포함)
+    from_cache: bool = False  # EncodingCache의 인코딩으로 바로 디코딩
+    mtime_ns: int = 0         # read_note: 읽을 때의 fstat
+    digest: str = ''          # read_note: 파일 전체 SHA-1 (분석 상한과 무관)
+
+    @property
+    def truncated(self) -> bool:
+        return self.analyzed < self.size
+
+    @property
+    def stamp(self) -> Stamp:
+        """(mtime_ns, size, sha1) - 읽은 내용 그대로 QualityCache.store에 전달"""
+        return self.mtime_ns, self.size, self.digest
+
+
+class EncodingCache:
+    """
+    파일별 판별 인코딩 (경로 → [mtime_ns, size, 인코딩])
+    파일이 바뀌지 않았으면 다음 실행에서 후보 검증 없이 바로 디코딩
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self._entries: Dict[str, list] = {}
+        self._dirty = False
+        if self.cache_path.exists():
+            try:
+                self._entries = json.loads(self.cache_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                pass  # 손상된 캐시 → 다시 판별
+
+    @staticmethod
+    def _key(file_path) -> str:
+        return str(Path(file_path).resolve())
+
+    def get(self, file_path, st: os.stat_result) -> Optional[str]:
+        entry = self._entries.get(self._key(file_path))
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        return None
+
+    def put(self, file_path, st: os.stat_result, encoding: str):
+        entry = [st.st_mtime_ns, st.st_size, encoding]
+        key = self._key(file_path)
+        if self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self._entries, ensure_ascii=False, indent=1),
+                                   encoding='utf-8')
+        self._dirty = False
+
+
+def detect_bom(buf) -> Tuple[Optional[str], int]:
+    """BOM → (인코딩, BOM 길이), 없으면 (None, 0)"""
+    head = bytes(buf[:3])
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    return None, 0
+
+
+def _utf16_guess(sample: bytes) -> Optional[str]:
+    """BOM 없는 UTF-16: ASCII 위주 텍스트면 홀수/짝수 자리에 0x00이 몰림"""
+    half = len(sample) // 2
+    if not half or b'\0' not in sample:
+        return None
+    zeros_odd = sample[1::2].count(0)
+    zeros_even = sample[0::2].count(0)
+    if zeros_odd > half * 0.3 and zeros_even < half * 0.05:
+        return 'utf-16-le'
+    if zeros_even > half * 0.3 and zeros_odd < half * 0.05:
+        return 'utf-16-be'
+    return None
+
+
+def candidate_encodings(buf, hint: Optional[str] = None) -> List[str]:
+    """시도할 인코딩 순서 (캐시 힌트 → utf-16 추정 → utf-8 → cp949)"""
+    candidates = [hint] if hint else []
+    # 0x00도 유효한 UTF-8이므로 utf-16 추정을 utf-8보다 먼저
+    guess = _utf16_guess(bytes(buf[:SAMPLE_BYTES]))
+    if guess:
+        candidates.append(guess)
+    candidates.extend(FALLBACK_ENCODINGS)
+    return list(dict.fromkeys(candidates))
+
+
+def decode_strict(view, encoding: str, final: bool = True) -> Optional[str]:
+    """청크 단위 증분 디코딩 - 잘못된 바이트를 만나는 즉시 None"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = []
+    try:
+        for pos in range(0, len(view), CHUNK_BYTES):
+            parts.append(decoder.decode(view[pos:pos + CHUNK_BYTES]))
+        parts.append(decoder.decode(b'', final=final))
+    except UnicodeDecodeError:
+        return None
+    return ''.join(parts)
+
+
+def _cut(buf, encoding: str, start: int, end: int) -> int:
+    """분석 상한에서 자를 위치 (마지막 줄바꿈 다음, UTF-16은 2바이트 정렬)"""
+    if encoding.startswith('utf-16'):
+        return end - (end - start) % 2
+    newline = buf.rfind(b'\n', start, end)
+    return newline + 1 if newline >= start else end
+
+
+def decode_buffer(buf, size: int, max_bytes: int = MAX_ANALYSIS_BYTES,
+                  hint: Optional[str] = None) -> NoteText:
+    """bytes/mmap 버퍼 → NoteText (후보별 증분 검증, 성공한 후보의 디코딩 결과 사용)"""
+    bom_encoding, start = detect_bom(buf)
+    candidates = [bom_encoding] if bom_encoding else candidate_encodings(buf, hint)
+
+    def limit(encoding: str) -> int:
+        if max_bytes and size > max_bytes:
+            return _cut(buf, encoding, start, max_bytes)
+        return size
+
+    view = memoryview(buf)
+    try:
+        for encoding in candidates:
+            end = limit(encoding)
+            text = decode_strict(view[start:end], encoding, final=end == size)
+            if text is not None:
+                return NoteText(text, encoding, size, end,
+                                from_cache=hint is not None and encoding == hint)
+
+        # 모든 후보 실패 → utf-8 (BOM이 있으면 그 인코딩)로 잘못된 바이트만 replace
+        encoding = bom_encoding or 'utf-8'
+        end = limit(encoding)
+        decoder = codecs.getincrementaldecoder(encoding)('replace')
+        return NoteText(decoder.decode(view[start:end], final=end == size), encoding, size, end)
+    finally:
+        view.release()
+
+
+def universal_newlines(text: str) -> str:
+    """CRLF / CR → LF (Windows에서 저장한 노트도 LF 노트와 같은 결과)"""
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def read_note(file_path, max_bytes: int = MAX_ANALYSIS_BYTES,
+              mmap_threshold: int = MMAP_THRESHOLD,
+              encodings: Optional[EncodingCache] = None) -> NoteText:
+    """파일 읽기 (작은 파일은 read(), 큰 파일은 mmap) - encodings가 있으면 판별 결과 기억"""
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        hint = encodings.get(file_path, st) if encodings is not None else None
+        if st.st_size < mmap_threshold or st.st_size == 0:
+            data = f.read()
+            source = decode_buffer(data, len(data), max_bytes, hint)
+            digest = hashlib.sha1(data).hexdigest()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                source = decode_buffer(mm, st.st_size, max_bytes, hint)
+                digest = hashlib.sha1(mm).hexdigest()
+    # 읽는 도중 저장돼도 stat이 내용보다 먼저 → 다음 실행에서 mtime 불일치로 재검증
+    source.mtime_ns, source.digest = st.st_mtime_ns, digest
+
+    if encodings is not None:
+        encodings.put(file_path, st, source.encoding)
+    source.text = universal_newlines(source.text)
+    return source
+
+
+def decode_note(data: bytes, max_bytes: int = MAX_ANALYSIS_BYTES) -> NoteText:
+    """메모리에 있는 노트 내용 (git blob 등) → read_note와 같은 NoteText"""
+    source = decode_buffer(data, len(data), max_bytes)
+    source.text = universal_newlines(source.text)
+    return source
+
+
+def read_text(file_path, cache_dir: Optional[Path] = None) -> NoteText:
+    """
+    로그 파일 읽기 (판별한 인코딩을 cache_dir/encodings.json에 기억)
+    cache_dir이 없으면 파일과 같은 폴더의 .rsi_cache
+    """
+    file_path = Path(file_path)
+    cache = EncodingCache(Path(cache_dir or file_path.parent / CACHE_DIR) / ENCODING_CACHE_FILE)
+    source = read_note(file_path, encodings=cache)
+    cache.save()
+    return source
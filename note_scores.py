@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Note Quality Delta
+커밋할 노트의 HEAD 버전 / 스테이징된(인덱스) 버전 품질 점수 (enhanced_quality_checker와 같은 규칙, 그래프 이슈 제외)
+체커 캐시 (.rsi_cache/quality_cache.sqlite)에 같은 내용의 결과가 있으면 재사용
+체커는 vault별로 프로세스 안에서 1개 (daemon이 커밋할 때마다 규칙을 다시 읽지 않음)
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from enhanced_quality_checker import QualityChecker, timed_out
+from git_changes import ChangeSet
+from note_diff import NoteDelta
+from note_reader import decode_note
+from quality_cache import QualityCache, CACHE_DIR, QUALITY_CACHE_FILE, file_stamp
+
+# 노트 하나당 최대 체커 2회 → 큰 커밋은 줄 변화가 큰 노트만
+MAX_SCORED_NOTES = 20
+
+# vault → (fingerprint, 체커)
+_CHECKERS: Dict[Path, Tuple[str, QualityChecker]] = {}
+
+
+def shared_checker(vault_path) -> QualityChecker:
+    """vault별 체커 재사용 (안내 출력 없음), 0_Invariants.md가 바뀌면 새로 로드"""
+    vault_path = Path(vault_path)
+    entry = _CHECKERS.get(vault_path)
+    if entry is not None and entry[1].fingerprint() == entry[0]:
+        return entry[1]
+    checker = QualityChecker(vault_path, verbose=False)
+    _CHECKERS[vault_path] = (checker.fingerprint(), checker)
+    return checker
+
+
+class NoteScorer:
+    """
+    노트의 이전(HEAD)/커밋될(인덱스) 품질 점수 - 둘 다 git blob을 읽어서 같은 방식으로 검증
+    QualityCache 행의 내용 해시가 맞으면 캐시 점수, 아니면 그 버전만 검증
+    (인덱스 내용이 작업 트리 파일과 같을 때만 결과를 캐시에 저장)
+    """
+
+    def __init__(self, vault_path, read_blob: Callable[[str, str], Optional[bytes]]):
+        self.vault_path = Path(vault_path)
+        self.read_blob = read_blob
+        self.checker = shared_checker(self.vault_path)
+        cache_path = self.vault_path / CACHE_DIR / QUALITY_CACHE_FILE
+        # 체커를 한 번도 안 돌린 vault면 캐시를 새로 만들지 않음
+        self.cache = QualityCache(cache_path, self.checker.fingerprint(), root=self.vault_path) \
+            if cache_path.exists() else None
+
+    def _score(self, path: str, data: bytes, store: bool = False) -> int:
+        file_path = self.vault_path / path
+        digest = hashlib.sha1(data).hexdigest()
+        if self.cache:
+            cached = self.cache.lookup_digest(file_path, digest)
+            if cached:
+                return cached[0]
+        score, issues = self.checker.check_source(decode_note(data), file_path)
+        if store and self.cache and not timed_out(issues):
+            try:
+                stamp = file_stamp(file_path)
+            except OSError:
+                stamp = None
+            if stamp is not None and stamp[2] == digest:
+                self.cache.store(file_path, score, issues, stamp)
+        return score
+
+    def score_before(self, path: str) -> Optional[int]:
+        data = self.read_blob(path, 'HEAD')
+        return None if data is None else self._score(path, data)
+
+    def score_after(self, path: str) -> Optional[int]:
+        """스테이징된 내용 (커밋 직전에 저장해도 커밋되는 내용과 점수가 어긋나지 않음)"""
+        data = self.read_blob(path, '')
+        return None if data is None else self._score(path, data, store=True)
+
+    def close(self):
+        if self.cache:
+            self.cache.close(prune=False)  # 이번에 보지 않은 노트는 그대로
+
+
+def score_notes(change_set: ChangeSet, vault_path,
+                read_blob: Callable[[str, str], Optional[bytes]],
+                limit: int = MAX_SCORED_NOTES):
+    """수정/이름 변경된 노트의 점수 변화 → ChangeSet.notes (줄 변화가 큰 노트부터 limit개)"""
+    targets = [c for c in change_set
+               if c.is_note and c.kind in ('modified', 'renamed') and not c.binary]
+    if not targets:
+        return
+    targets.sort(key=lambda c: c.churn, reverse=True)
+
+    scorer = NoteScorer(vault_path, read_blob)
+    try:
+        for change in targets[:limit]:
+            before = scorer.score_before(change.orig_path or change.path)
+            after = scorer.score_after(change.path)
+            if before is None or after is None or before == after:
+                continue
+            delta = change_set.notes.get(change.path)
+            if delta is None:
+                delta = change_set.notes[change.path] = NoteDelta(change.path)
+            delta.score_before, delta.score_after = before, after
+    finally:
+        scorer.close()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Quality Check Result Cache
+노트별 check_note 결과를 영속 저장 (path + mtime + size, 불일치 시 content hash)
+"""
+
+import os
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional
+
+CACHE_DIR = ".rsi_cache"
+QUALITY_CACHE_FILE = "quality_cache.sqlite"
+CACHE_SCHEMA = 1
+
+# 검증한 내용의 (mtime_ns, size, sha1)
+Stamp = Tuple[int, int, str]
+
+
+def file_digest(file_path: Path) -> str:
+    """파일 내용 해시 (SHA-1, 1MB 단위 스트리밍)"""
+    h = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_stamp(file_path: Path) -> Stamp:
+    """(mtime_ns, size, sha1) - 같은 파일 핸들의 fstat과 내용 해시 (store용)"""
+    h = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return st.st_mtime_ns, st.st_size, h.hexdigest()
+
+
+class QualityCache:
+    """
+    check_note 결과 캐시
+    fingerprint (체커 버전 + 0_Invariants.md 해시)가 바뀌면 전체 무효화
+    """
+
+    def __init__(self, cache_path: Path, fingerprint: str, root: Optional[Path] = None):
+        self.cache_path = Path(cache_path)
+        self.fingerprint = fingerprint
+        self.root = Path(root) if root else None
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.cache_path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS notes ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "digest TEXT, score INTEGER, issues TEXT)")
+
+        # 버전/불변량이 바뀌었으면 전체 무효화
+        stored = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if (stored.get('fingerprint') != fingerprint or
+                stored.get('schema') != str(CACHE_SCHEMA)):
+            self.conn.execute("DELETE FROM notes")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [('fingerprint', fingerprint), ('schema', str(CACHE_SCHEMA))])
+            self.conn.commit()
+
+        # 한 번에 메모리로 로드 (조회는 dict lookup)
+        self._rows = {
+            row[0]: list(row[1:])
+            for row in self.conn.execute(
+                "SELECT path, mtime_ns, size, digest, score, issues FROM notes")
+        }
+        self._dirty = set()
+        self._seen = set()
+
+    def _key(self, file_path: Path) -> str:
+        if self.root:
+            try:
+                return file_path.relative_to(self.root).as_posix()
+            except ValueError:
+                pass
+        return file_path.as_posix()
+
+    def is_fresh(self, file_path: Path) -> bool:
+        """캐시된 결과가 현재 파일과 일치하는지 (결과는 디코딩하지 않음)"""
+        key = self._key(file_path)
+        self._seen.add(key)
+        row = self._rows.get(key)
+
+        if row is None:
+            self.misses += 1
+            return False
+
+        try:
+            st = file_path.stat()
+        except OSError:
+            self.misses += 1
+            return False
+
+        mtime_ns, size, digest = row[:3]
+
+        # 1차: mtime + size 일치
+        if mtime_ns == st.st_mtime_ns and size == st.st_size:
+            self.hits += 1
+            return True
+
+        # 2차: 크기가 같으면 내용 해시 비교 (touch/checkout으로 mtime만 바뀐 경우)
+        if size == st.st_size and file_digest(file_path) == digest:
+            row[0] = st.st_mtime_ns
+            self._dirty.add(key)
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def get(self, file_path: Path) -> Tuple[int, List[Dict]]:
+        """캐시된 (점수, 이슈) - is_fresh() 확인 후 호출"""
+        row = self._rows[self._key(file_path)]
+        return row[3], json.loads(row[4])
+
+    def lookup(self, file_path: Path) -> Optional[Tuple[int, List[Dict]]]:
+        """캐시 조회 (변경된 파일이면 None)"""
+        if self.is_fresh(file_path):
+            return self.get(file_path)
+        return None
+
+    def lookup_digest(self, file_path: Path, digest: str) -> Optional[Tuple[int, List[Dict]]]:
+        """내용 해시가 같을 때만 캐시 결과 (파일이 아닌 내용 - 예: git의 이전 버전)"""
+        row = self._rows.get(self._key(file_path))
+        if row is None or row[2] != digest:
+            return None
+        return row[3], json.loads(row[4])
+
+    def store(self, file_path: Path, score: int, issues: List[Dict],
+              stamp: Stamp):
+        """
+        검증 결과 저장 - stamp: 검증한 내용을 읽을 때의 (mtime_ns, size, sha1) (NoteText.stamp)
+        저장 시점에 다시 stat/해시하지 않음 → 검증 후 바뀐 파일에 이전 결과가 붙지 않음
+        """
+        mtime_ns, size, digest = stamp
+        key = self._key(file_path)
+        self._seen.add(key)
+        self._rows[key] = [mtime_ns, size, digest, score,
+                           json.dumps(issues, ensure_ascii=False)]
+        self._dirty.add(key)
+
+    def save(self, prune: bool = True):
+        """변경분 기록 (prune=True면 이번 실행에서 보지 못한 파일 삭제)"""
+        if self._dirty:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, *self._rows[key]) for key in self._dirty])
+            self._dirty.clear()
+
+        if prune:
+            stale = [key for key in self._rows if key not in self._seen]
+            if stale:
+                self.conn.executemany(
+                    "DELETE FROM notes WHERE path = ?", [(key,) for key in stale])
+                for key in stale:
+                    del self._rows[key]
+
+        self.conn.commit()
+
+    def close(self, prune: bool = True):
+        self.save(prune)
+        self.conn.close()
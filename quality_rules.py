@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Quality Rule Engine
+규칙 레지스트리 + 프로필 (v2 / v1 / korean)
+임계값, 우선순위, 메타 파일 제외 패턴은 import 시 한 번만 정의/컴파일
+"""
+
+import re
+import json
+import pickle
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import List, Dict, Callable, Optional, Pattern
+
+try:
+    import yaml
+except ImportError:  # PyYAML 없으면 JSON으로 파싱 (블록은 JSON 호환 형식)
+    yaml = None
+
+from note_parser import ParsedNote
+
+# 우선순위별 감점
+PRIORITY_PENALTY = {'P1': 15, 'P2': 5, 'P3': 2}
+
+HANGUL_RE = re.compile('[가-힣]')
+
+
+def meta_prefixes(*prefixes: str) -> Pattern:
+    """파일명이 prefix로 시작하면 메타 파일"""
+    return re.compile('^(?:' + '|'.join(map(re.escape, prefixes)) + ')')
+
+
+def meta_keywords(*keywords: str) -> Pattern:
+    """파일명(소문자)에 키워드가 포함되면 메타 파일"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def score_issues(issues: List[Dict]) -> int:
+    """품질 점수 계산 (0-100)"""
+    score = 100 - sum(PRIORITY_PENALTY.get(issue['priority'], 0) for issue in issues)
+    return max(0, score)
+
+
+# 시간 예산을 넘긴 노트의 이슈 카테고리 (캐시에 저장하지 않음)
+TIMEOUT_CATEGORY = '분석 시간 초과'
+
+
+class AnalysisTimeout(Exception):
+    """노트 하나의 분석이 시간 예산(deadline)을 넘김 - issues: 그때까지 끝난 규칙의 이슈"""
+
+    def __init__(self, stage: str, issues: Optional[List[Dict]] = None):
+        super().__init__(stage)
+        self.stage = stage
+        self.issues = issues or []
+
+
+def timeout_issue(file_path: Path, stage: str, budget: float) -> Dict:
+    return _issue('P3', TIMEOUT_CATEGORY, file_path,
+                  f"분석 시간 초과 ({stage} 단계에서 {budget:g}초 예산 초과, 나머지 규칙 생략)",
+                  "노트를 나누거나 붙여넣은 대용량 텍스트 정리")
+
+
+def size_cap_issue(file_path: Path, size: int, analyzed: int) -> Dict:
+    return _issue('P2', '파일 크기', file_path,
+                  f"파일이 너무 큼 ({size / (1 << 20):.1f}MB 중 앞 {analyzed / (1 << 20):.1f}MB만 분석)",
+                  "붙여넣은 로그/데이터를 별도 파일로 분리하거나 링크로 대체")
+
+
+def _issue(priority: str, category: str, file_path: Path, issue: str, suggestion: str) -> Dict:
+    return {
+        'priority': priority,
+        'category': category,
+        'file': file_path.name,
+        'issue': issue,
+        'suggestion': suggestion
+    }
+
+
+# ===== 규칙 레지스트리 =====
+
+# name -> (check 함수, 기본 파라미터)
+RULES: Dict[str, tuple] = {}
+
+
+def rule(name: str, **defaults):
+    """규칙 등록 데코레이터 (기본 파라미터 = v2 기준)"""
+    def register(fn):
+        RULES[name] = (fn, defaults)
+        return fn
+    return register
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    check: Callable[[ParsedNote, Path, Dict], List[Dict]]
+    params: Dict = field(default_factory=dict)
+    exclude: Optional[Pattern] = None
+
+    def applies(self, file_name: str) -> bool:
+        return self.exclude is None or not self.exclude.search(file_name)
+
+
+# ===== Part 1: 구조적 품질 =====
+
+@rule('file_naming',
+      pattern=re.compile('Untitled'), use_stem=True, priority='P2',
+      issue="Untitled 파일: {name}", suggestion="의미있는 이름으로 변경 필요")
+def check_file_naming(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """파일 명칭 규칙 검증"""
+    name = file_path.stem if p['use_stem'] else file_path.name
+    if p['pattern'].search(name):
+        return [_issue(p['priority'], '파일명', file_path,
+                       p['issue'].format(name=name), p['suggestion'])]
+    return []
+
+
+@rule('links',
+      orphan_priority='P1', min_links=2, count_md_links=False)
+def check_links(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """링크 구조 검증"""
+    if p['count_md_links']:
+        # [[...]] (비어있지 않은 것) + [text](url)
+        link_count = sum(1 for link in note.links if link and ']' not in link)
+        link_count += note.md_link_count
+    else:
+        link_count = len(note.links)
+
+    if link_count == 0:
+        return [_issue(p['orphan_priority'], '링크', file_path,
+                       "고아 노트 (링크 없음)", "최소 1개 이상의 관련 개념 링크 추가")]
+    if p['min_links'] and link_count < p['min_links']:
+        return [_issue('P3', '연결성', file_path,
+                       f"링크가 {link_count}개뿐 (격리 위험)",
+                       f"{p['min_links']}개 이상의 관련 개념 연결 권장")]
+    return []
+
+
+@rule('core_section', min_chars=10)
+def check_sections(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """섹션 구조 검증 ('## 핵심 내용'이 비어있는지)"""
+    core = note.core_content()
+    if core is not None and len(core) < p['min_chars']:
+        return [_issue('P1', '빈 섹션', file_path,
+                       "'핵심 내용' 섹션이 비어있음", "핵심 내용 작성 필요")]
+    return []
+
+
+# ===== Part 2: 내용적 품질 =====
+
+@rule('content_quality',
+      min_chars=150, vague_terms=('여러', '여러 가지', '다양한', '등등'))
+def check_content_quality(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """내용 충실도 검증"""
+    issues = []
+    core = note.core_content()
+    if not core:
+        return issues
+
+    if len(core) < p['min_chars']:
+        issues.append(_issue('P2', '내용 품질', file_path,
+                             f"핵심 내용이 짧음 ({len(core)}자)",
+                             f"최소 {p['min_chars']}자 이상 작성 권장"))
+
+    found_vague = [term for term in p['vague_terms'] if term in core]
+    if found_vague:
+        issues.append(_issue('P3', '명확성', file_path,
+                             f"모호한 표현 발견: {', '.join(found_vague)}",
+                             "구체적인 표현으로 변경 권장"))
+    return issues
+
+
+@rule('clarity', max_sentence_chars=100, max_long_sentences=5)
+def check_clarity(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """명령 명확성 검증 (긴 문장 수)"""
+    limit = p['max_sentence_chars']
+    long_sentences = sum(1 for length in note.sentence_lengths if length > limit)
+    if long_sentences > p['max_long_sentences']:
+        return [_issue('P3', '명확성', file_path,
+                       f"{long_sentences}개 문장이 너무 김 ({limit}자 이상)",
+                       "긴 문장을 짧게 분리 권장")]
+    return []
+
+
+@rule('vague_fulltext', priority='P2', vague_terms=('등등', '등과 같은', '여러', '다양한'))
+def check_vague_fulltext(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """노트 전체의 모호한 표현 검증"""
+    found_vague = [term for term in p['vague_terms'] if term in note.text]
+    if found_vague:
+        return [_issue(p['priority'], '명확성', file_path,
+                       f'모호한 표현 발견: {", ".join(found_vague)}', '구체적으로 명시 필요')]
+    return []
+
+
+@rule('connectivity', min_context_ratio=0.3)
+def check_connectivity(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """개념 연결성 검증 (링크 앞뒤 20자에 한글 설명이 있는지)"""
+    links = note.links
+    if not links:
+        return []
+
+    contextual_links = sum(
+        1 for before, after in note.link_contexts
+        if HANGUL_RE.search(before) or HANGUL_RE.search(after))
+
+    if contextual_links / len(links) < p['min_context_ratio']:
+        return [_issue('P3', '연결성', file_path,
+                       f"링크 중 맥락 없는 것이 많음 ({contextual_links}/{len(links)})",
+                       "링크에 설명 추가 권장")]
+    return []
+
+
+@rule('rag_optimization',
+      min_chars=1000, max_chars=3500, length_priority='P2',
+      short_suggestion="1,500-2,000자 권장 (Phase 5 기준)",
+      long_issue="노트가 너무 김 ({chars}자)",
+      long_suggestion="2,000자 이하 권장 - 분할 고려",
+      min_sections=4, max_sections=10,
+      min_density=150, max_density=450)
+def check_rag_optimization(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """RAG 최적화 검증 (Phase 5 기준)"""
+    issues = []
+    char_count = note.char_count
+    section_count = note.section_count
+
+    # 길이 체크 (1,500-2,000자 권장)
+    if char_count < p['min_chars']:
+        issues.append(_issue(p['length_priority'], 'RAG 최적화', file_path,
+                             f"노트가 짧음 ({char_count}자)", p['short_suggestion']))
+    elif char_count > p['max_chars']:
+        issues.append(_issue(p['length_priority'], 'RAG 최적화', file_path,
+                             p['long_issue'].format(chars=char_count), p['long_suggestion']))
+
+    if section_count == 0:
+        return issues
+
+    # 섹션 수 체크 (5-8개 권장)
+    if section_count < p['min_sections']:
+        issues.append(_issue('P3', 'RAG 최적화', file_path,
+                             f"섹션 부족 ({section_count}개)", "5-8개 섹션 권장"))
+    elif section_count > p['max_sections']:
+        issues.append(_issue('P3', 'RAG 최적화', file_path,
+                             f"섹션 과다 ({section_count}개)", "5-8개 섹션 권장"))
+
+    # 정보 밀도 체크 (200-250자/섹션)
+    if p['min_density'] is not None:
+        density = char_count / section_count
+        if density < p['min_density']:
+            issues.append(_issue('P3', 'RAG 최적화', file_path,
+                                 f"정보 밀도 낮음 ({density:.0f}자/섹션)", "200-250자/섹션 권장"))
+        elif density > p['max_density']:
+            issues.append(_issue('P3', 'RAG 최적화', file_path,
+                                 f"정보 밀도 높음 ({density:.0f}자/섹션)", "200-250자/섹션 권장"))
+
+    return issues
+
+
+@rule('example_quality',
+      max_examples=4, min_chars=100, vague_terms=('어떤', '일정', '일반'),
+      too_many_suggestion="2-3개 권장 (Phase 5: 중복 문제)")
+def check_example_quality(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """예제 품질 검증 (### 사례|예제|Example N)"""
+    issues = []
+    examples = note.examples
+
+    if len(examples) > p['max_examples']:
+        issues.append(_issue('P3', '예제 품질', file_path,
+                             f"예제가 너무 많음 ({len(examples)}개)", p['too_many_suggestion']))
+
+    vague_terms = p['vague_terms']
+    for i, example in enumerate(examples, 1):
+        # 추상적 표현 체크
+        if any(term in example.title or term in example.body for term in vague_terms):
+            issues.append(_issue('P3', '예제 품질', file_path,
+                                 f"예제 {i}가 추상적", "구체적인 이름/숫자 포함 권장"))
+
+        # 길이 체크
+        if len(example.body.strip()) < p['min_chars']:
+            issues.append(_issue('P3', '예제 품질', file_path,
+                                 f"예제 {i} 설명이 짧음 ({len(example.body)}자)",
+                                 f"최소 {p['min_chars']}자 이상 권장"))
+
+    return issues
+
+
+@rule('math_requirement',
+      concept_keywords=('rank', 'nullity', '군론', '대칭성',
+                        '그래프', '중심성', '정리', 'theorem',
+                        '이론', 'theory', '개념'))
+def check_math_requirement(note: ParsedNote, file_path: Path, p: Dict) -> List[Dict]:
+    """수학식 요구사항 검증 (BrainTwin 특화)"""
+    name_lower = file_path.name.lower()
+
+    # 개념 노트 판별: 파일명 키워드 또는 "## 개념"/"## 정의" 섹션
+    is_concept_note = (any(kw in name_lower for kw in p['concept_keywords']) or
+                       note.has_section_prefix('개념', '정의'))
+    if not is_concept_note:
+        return []
+
+    # $...$ inline (최소 2개 $) 또는 $$...$$ block
+    if note.dollar_count >= 2 or note.has_block_math:
+        return []
+
+    return [_issue('P1', '수학식', file_path, '개념 노트에 수학식 없음',
+                   'LaTeX 수학식 추가: $E=mc^2$ 또는 $$\\int f(x)dx$$')]
+
+
+# ===== 프로필 =====
+
+META_PREFIXES_V2 = meta_prefixes('0_', '1_', '2_', '3_', '_')
+META_PREFIXES_V1 = meta_prefixes('0_', '1_', '2_', '_')
+META_MATH = meta_keywords('0_', '1_', '2_', '3_', '_',
+                          'index', 'log', 'readme', 'guide', 'agenda')
+META_LINKS_KOREAN = meta_keywords('0_', '1_', '2_', '3_', 'readme', 'changelog',
+                                  'license', 'gitignore', 'index', 'log', 'guide', 'agenda')
+META_RAG_KOREAN = meta_keywords('0_', '1_', '2_', '3_', 'readme', 'changelog')
+
+# (규칙 이름, 파라미터 오버라이드, 메타 제외 패턴) - 실행 순서 = 이슈 순서
+PROFILE_SPECS = {
+    'v2': [
+        ('file_naming', {}, None),
+        ('links', {}, META_PREFIXES_V2),
+        ('core_section', {}, None),
+        ('content_quality', {}, None),
+        ('clarity', {}, None),
+        ('connectivity', {}, META_PREFIXES_V2),
+        ('rag_optimization', {}, META_PREFIXES_V2),
+        ('example_quality', {}, None),
+        ('math_requirement', {}, META_MATH),
+    ],
+    'v1': [
+        ('file_naming', {}, None),
+        ('links', {'orphan_priority': 'P2'}, META_PREFIXES_V1),
+        ('core_section', {}, None),
+        ('content_quality', {'vague_terms': ('등등', '등과 같은', '여러', '다양한')}, None),
+        ('clarity', {}, None),
+        ('connectivity', {}, META_PREFIXES_V1),
+        ('rag_optimization', {'long_suggestion': "2,000자 이하 권장 - V3의 역설 참고"},
+         META_PREFIXES_V1),
+        ('example_quality', {'vague_terms': ('어떤', '특정', '일부'),
+                             'too_many_suggestion': "2-3개 권장 (Phase 5: V3의 3개 강제 문제)"},
+         None),
+    ],
+    'korean': [
+        ('file_naming', {'pattern': re.compile('untitled', re.IGNORECASE), 'use_stem': False,
+                         'issue': 'Untitled 파일',
+                         'suggestion': '48시간 내 의미있는 이름으로 변경 필요'}, None),
+        ('links', {'min_links': 0, 'count_md_links': True}, META_LINKS_KOREAN),
+        ('core_section', {}, None),
+        ('math_requirement', {'concept_keywords': (
+            'rank', 'nullity', '군론', '대칭성',
+            '그래프', '중심성', '정리', 'theorem',
+            '개념', '이론', 'theory', '베이즈', 'bayes',
+            'phase', 'transition', '내쉬', 'nash',
+            '포트폴리오', 'portfolio', '행동경제',
+            '극값', '엔트로피', 'entropy', '최적화')}, META_MATH),
+        ('rag_optimization', {'length_priority': 'P3', 'max_chars': 3000,
+                              'short_suggestion': '1,500-2,000자 권장',
+                              'long_issue': '노트가 김 ({chars}자)',
+                              'long_suggestion': '2,000자 이하 권장 (V3의 역설 참고)',
+                              'min_sections': 5, 'min_density': None},
+         META_RAG_KOREAN),
+        ('vague_fulltext', {}, None),
+    ],
+}
+
+
+def build_profile(name: str, tuning: Optional[Dict[str, Dict]] = None) -> List[Rule]:
+    """
+    프로필 규칙 생성
+    tuning: 0_Invariants.md에서 읽은 {규칙: {파라미터: 값}} ('enabled': false면 제외)
+    """
+    tuning = tuning or {}
+    rules = []
+    for rule_name, overrides, exclude in PROFILE_SPECS[name]:
+        check, defaults = RULES[rule_name]
+        params = {**defaults, **overrides}
+        tuned = dict(tuning.get(rule_name, {}))
+        if tuned.pop('enabled', True) is False:
+            continue
+        for key, value in tuned.items():
+            if key not in params:
+                print(f"⚠️  Invariants: unknown parameter '{rule_name}.{key}' ignored")
+                continue
+            params[key] = _coerce_param(params[key], value)
+        rules.append(Rule(rule_name, check, params, exclude))
+    return rules
+
+
+def _coerce_param(default, value):
+    """블록 값을 기본값 타입에 맞춤 (리스트 → 튜플, 문자열 → 정규식)"""
+    if isinstance(default, tuple) and isinstance(value, list):
+        return tuple(value)
+    if isinstance(default, re.Pattern) and isinstance(value, str):
+        return re.compile(value, default.flags)
+    return value
+
+
+PROFILES = {name: build_profile(name) for name in PROFILE_SPECS}
+
+
+# ===== 0_Invariants.md 로드 =====
+
+INVARIANTS_FENCE = "```quality-rules"
+
+
+def parse_invariants(text: str) -> Dict[str, Dict[str, Dict]]:
+    """
+    0_Invariants.md의 ```quality-rules 블록 파싱
+    형식: {프로필: {규칙: {파라미터: 값}}} (YAML, PyYAML 없으면 JSON)
+    """
+    lines = text.split('\n')
+    try:
+        start = next(i for i, line in enumerate(lines) if line.strip() == INVARIANTS_FENCE)
+    except StopIteration:
+        return {}
+
+    block = []
+    for line in lines[start + 1:]:
+        if line.strip().startswith('```'):
+            break
+        block.append(line)
+    source = '\n'.join(block)
+
+    try:
+        data = yaml.safe_load(source) if yaml else json.loads(source)
+    except Exception as e:
+        print(f"⚠️  Invariants: quality-rules block could not be parsed ({e})")
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    tuning = {}
+    for profile, rules in data.items():
+        if profile not in PROFILE_SPECS or not isinstance(rules, dict):
+            print(f"⚠️  Invariants: unknown profile '{profile}' ignored")
+            continue
+        tuning[profile] = {name: params for name, params in rules.items()
+                           if name in RULES and isinstance(params, dict)}
+    return tuning
+
+
+def load_invariant_rules(invariants_path: Path, profile: str,
+                         cache_dir: Optional[Path] = None, version: str = "") -> List[Rule]:
+    """
+    0_Invariants.md → 컴파일된 규칙 목록
+    파일 해시(+ 체커 버전)를 키로 cache_dir에 pickle 저장 → 변경 없으면 재파싱 생략
+    """
+    invariants_path = Path(invariants_path)
+    if not invariants_path.exists():
+        return PROFILES[profile]
+
+    raw = invariants_path.read_bytes()
+    key = hashlib.sha1(version.encode('utf-8') + b'\0' + raw).hexdigest()
+
+    artifact = Path(cache_dir) / f"invariants_{profile}.pickle" if cache_dir else None
+    if artifact and artifact.exists():
+        try:
+            with open(artifact, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == key:
+                return cached['rules']
+        except Exception:
+            pass  # 손상된 캐시 → 재파싱
+
+    tuning = parse_invariants(raw.decode('utf-8', errors='replace')).get(profile)
+    rules = build_profile(profile, tuning) if tuning else PROFILES[profile]
+
+    if artifact:
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        with open(artifact, 'wb') as f:
+            pickle.dump({'key': key, 'rules': rules}, f)
+
+    return rules
+
+
+class RuleEngine:
+    """ParsedNote 하나에 프로필의 규칙을 순서대로 적용"""
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        self.profiler = None  # RuleProfiler (--profile일 때만)
+
+    @classmethod
+    def for_profile(cls, name: str) -> 'RuleEngine':
+        return cls(PROFILES[name])
+
+    def run(self, note: ParsedNote, file_path: Path,
+            deadline: Optional[float] = None) -> List[Dict]:
+        """
+        규칙 적용 → 이슈 목록
+        규칙을 시작하기 전에 deadline(perf_counter 기준)을 넘겼으면 AnalysisTimeout
+        (이미 끝난 규칙의 이슈는 예외에 담김 → 마지막 규칙이 늦게 끝난 것만으로는 초과 아님)
+        """
+        if self.profiler is not None:
+            return self._run_profiled(note, file_path, deadline)
+
+        file_name = file_path.name
+        issues = []
+        for r in self.rules:
+            if r.applies(file_name):
+                if deadline is not None and perf_counter() > deadline:
+                    raise AnalysisTimeout(r.name, issues)
+                issues.extend(r.check(note, file_path, r.params))
+        return issues
+
+    def _run_profiled(self, note: ParsedNote, file_path: Path,
+                      deadline: Optional[float] = None) -> List[Dict]:
+        """run()과 동일 + 규칙별 시간 기록"""
+        file_name = file_path.name
+        nbytes = len(note.text.encode('utf-8'))
+        record = self.profiler.record
+        issues = []
+        for r in self.rules:
+            if r.applies(file_name):
+                started = perf_counter()
+                if deadline is not None and started > deadline:
+                    raise AnalysisTimeout(r.name, issues)
+                issues.extend(r.check(note, file_path, r.params))
+                record(r.name, perf_counter() - started, nbytes, file_name)
+        return issues
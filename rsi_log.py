@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+RSI Log Parser / Index
+0_Long_Term_RSI_Log.md의 '## Day N' 섹션 → 일별 레코드
+
+RsiLogIndex: 섹션별 해시/레코드 + 체크포인트를 .rsi_cache/rsi_log.sqlite에 저장
+- 체크포인트 = 마지막 섹션의 byte offset, 그 앞부분 해시, 마지막 Day 번호, 마지막 섹션 해시
+- 앞부분이 그대로면 (로그 끝에 Day 추가 / 마지막 Day 수정) 마지막 섹션부터만 디코딩·파싱
+- 앞쪽 섹션이 바뀌면 전체를 다시 나눈 뒤 해시가 바뀐 섹션만 파싱
+- 일별 지표(날짜, 제안/완료/보류 수)는 컬럼 + 날짜 인덱스 → 주/월/임의 기간은 범위 쿼리
+"""
+
+import re
+import json
+import hashlib
+import sqlite3
+from pathlib import Path
+from datetime import date, timedelta
+from typing import List, Dict, Tuple, Optional
+
+from quality_cache import CACHE_DIR
+from note_reader import decode_buffer, decode_strict, detect_bom
+
+# 파싱 규칙이 바뀌면 올릴 것 (저장된 레코드 전체 재파싱)
+PARSER_VERSION = 2
+INDEX_SCHEMA = 2
+
+DAY_HEADER_RE = re.compile(r'^##\s+Day\s+(\d+)', re.MULTILINE)
+
+# "실행 여부" / "실행" 블록 헤더 - 본문 끝은 find()로 찾음 (DOTALL .*? 역추적 없음)
+EXEC_STATUS_RE = re.compile(r'\*\*실행\s*여부:\*\*\s*\n?')
+EXEC_STATUS_PLAIN_RE = re.compile(r'실행\s*여부:\s*')
+EXEC_SECTION_RE = re.compile(r'\*\*실행:\*\*\s*\n')
+
+# 제안 목록 헤더 ("**새로운 제안 (이전에 없던 것):**", "새로운 제안:", "**반복 제안:** 없음")
+NEW_SUGGESTIONS_RE = re.compile(r'^\**새로운\s*제안[^\n:]*:\**[ \t]*(.*)$', re.MULTILINE)
+REPEATED_SUGGESTIONS_RE = re.compile(r'^\**반복\s*제안[^\n:]*:\**[ \t]*(.*)$', re.MULTILINE)
+LIST_ITEM_RE = re.compile(r'\s*(?:[-*]|\d+\.)\s*(.+)')
+SUGGESTION_LISTS = (('new', NEW_SUGGESTIONS_RE), ('repeated', REPEATED_SUGGESTIONS_RE))
+
+# Day 섹션 필드 레이블 - 한 번의 finditer로 모든 형식의 레이블 위치를 찾음
+# 대안마다 리터럴로 시작 → 정규식 엔진이 첫 글자 집합으로 건너뜀
+# 별표 / 콜론 변형은 레이블 앞뒤 글자로 판단, 값은 레이블 바로 뒤에서 고정 매치 (다음 줄 값 포함)
+# (그룹 없이 - 그룹으로 감싸면 첫 글자 최적화가 꺼짐 → 레이블 종류는 첫 글자로 구분)
+FIELD_LABEL_RE = re.compile(
+    r'날짜:'
+    r'|AI\s*제안\s*수'
+    r'|실행\s*여부:'
+    r'|실행:\*\*'
+    r'|새로운\s*제안|반복\s*제안')
+LABEL_KINDS = {'날': 'date', 'A': 'ai', '실': 'status', '새': 'list', '반': 'list'}
+# 날짜 형식 우선순위: "**날짜:** 2026-01-08" → "날짜: 2026-01-08" → 섹션 안 첫 날짜
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+DATE_VALUE_RE = re.compile(r'\s*(\d{4}-\d{2}-\d{2})')
+
+# AI 제안 수 레이블 (콜론이 별표 안 / 별표 밖 / 별표 없음)
+AI_LABEL_RE = re.compile(r'AI\s*제안\s*수(:\*\*|\*\*:|:)')
+# 형식 우선순위 (이전 정규식 5개의 순서)
+AI_VALUE_FORMS = (
+    re.compile(r'\s*(\d+)'),               # **AI 제안 수:** 5개
+    re.compile(r'\s*(\d+)'),               # **AI 제안 수**: 5개
+    re.compile(r'\s*(\d+)'),               # AI 제안 수: 5개
+    re.compile(r'\s*\n\s*-?\s*(\d+)'),     # **AI 제안 수:**\n-14개
+    re.compile(r'\s*\n\s*-?\s*(\d+)'),     # AI 제안 수:\n-14개
+)
+
+STATUS_COUNT_RE = re.compile(r'(\d+)\s*개')
+SUGGESTION_NUM_RE = re.compile(r'#(\d+)')
+
+
+def extract_block(content, head_re):
+    """
+    헤더 다음부터 다음 '**'로 시작하는 줄 전까지 (없으면 끝까지)
+    r'<헤더>(.*?)(?:\n\*\*|\Z)' (DOTALL)와 같은 결과를 선형 시간에
+    """
+    match = head_re.search(content)
+    if not match:
+        return None
+    start = match.end()
+    end = content.find('\n**', start)
+    return content[start:end if end != -1 else len(content)]
+
+
+def extract_plain_status(content):
+    """
+    별표 없는 "실행 여부:" 다음부터 ':'가 있는 줄 / '메모:' 전까지
+    r'실행\s*여부:\s*(.+?)(?:\n[^\n]*:|메모:|\Z)' (DOTALL)와 같은 결과
+    """
+    match = EXEC_STATUS_PLAIN_RE.search(content)
+    if not match:
+        return None
+    return _plain_status_at(content, match)
+
+
+def _plain_status_at(content, match):
+    """extract_plain_status 본문 - 헤더 Match를 이미 찾은 경우"""
+    start = match.end()
+    if start == len(content):
+        # (.+?)는 최소 1자 → 뒤쪽 공백 한 글자를 양보
+        if start == match.start() + len(match.group(0).rstrip()):
+            return None
+        start -= 1
+
+    end = content.find('메모:', start + 1)
+    if end == -1:
+        end = len(content)
+    newline = content.find('\n', start + 1, end)
+    while newline != -1:
+        line_end = content.find('\n', newline + 1)
+        if ':' in content[newline + 1:line_end if line_end != -1 else len(content)]:
+            end = newline
+            break
+        newline = content.find('\n', newline + 1, end)
+    return content[start:end]
+
+
+def extract_list(content, head_re):
+    """
+    헤더 다음 목록 항목 ('- ', '1. ') → 문자열 목록
+    빈 줄 / '**' 줄 / 목록이 아닌 줄에서 끝, '없음'으로 시작하는 항목은 제외
+    """
+    match = head_re.search(content)
+    if not match:
+        return []
+    return _list_items(content, match)
+
+
+def _list_items(content, match):
+    """extract_list 본문 - 헤더 Match를 이미 찾은 경우"""
+    items = []
+    inline = match.group(1).strip()
+    if inline and not inline.startswith('없음'):
+        items.append(inline)
+
+    # 목록이 끝나는 줄까지만 한 줄씩 (섹션 나머지를 통째로 split하지 않음)
+    pos = match.end() + 1
+    length = len(content)
+    while pos <= length:
+        end = content.find('\n', pos)
+        if end == -1:
+            end = length
+        line = content[pos:end]
+        pos = end + 1
+        if not line.strip():
+            if items:
+                break
+            continue
+        item = LIST_ITEM_RE.match(line)
+        if line.startswith('**') or not item:
+            break
+        text = item.group(1).strip()
+        if not text.startswith('없음'):
+            items.append(text)
+    return items
+
+
+# ===== Day 섹션 =====
+
+def split_day_sections(content: str) -> List[Tuple[str, int, int, int]]:
+    """
+    '## Day N' 섹션 목록 → (N, 섹션 시작, 본문 시작, 섹션 끝)
+    re.split(r'^##\s+Day\s+(\d+)')과 같은 경계 (본문 = 헤더 뒤 ~ 다음 Day 헤더 전)
+    """
+    matches = list(DAY_HEADER_RE.finditer(content))
+    sections = []
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections.append((m.group(1), m.start(), m.end(), end))
+    return sections
+
+
+def _checklist_counts(text: str) -> Tuple[int, int]:
+    """'-'로 시작하는 줄 중 ✅ / ⏸️ 가 있는 줄 수"""
+    done = paused = 0
+    for line in text.split('\n'):
+        if line.strip().startswith('-'):
+            done += '✅' in line
+            paused += '⏸️' in line
+    return done, paused
+
+
+def _count_from_status(status_text: str) -> int:
+    """Day 1-5 형식: "실행 여부" 텍스트에서 완료 개수 추정"""
+    completed = 0
+    if '완료' in status_text or '실행' in status_text:
+        # 전략 1: "N개" 패턴 먼저 찾기 (가장 확실)
+        num_match = STATUS_COUNT_RE.search(status_text)
+        if num_match:
+            completed = int(num_match.group(1))
+
+        # 전략 2: 제안 번호 카운트 (#1, #2, ...)
+        if completed == 0:
+            suggestion_nums = SUGGESTION_NUM_RE.findall(status_text)
+            if len(suggestion_nums) >= 2:  # 2개 이상만
+                completed = len(suggestion_nums)
+
+        # 전략 3: ✅만 있으면 1개
+        if completed == 0 and '✅' in status_text:
+            completed = 1
+    return completed
+
+
+def _execution_counts(content: str, status, plain, section) -> Tuple[int, int]:
+    """(완료, 보류) - "실행 여부" (Day 1-6) → "실행" (Day 7-10) 순"""
+    if status is not None:
+        # "**실행 여부:**" 다음부터 '**'로 시작하는 줄 전까지 (extract_block과 같은 범위)
+        end = content.find('\n**', status.end())
+        status_text = content[status.end():end if end != -1 else len(content)]
+    elif plain is not None:
+        status_text = _plain_status_at(content, plain)
+    else:
+        status_text = None
+
+    if status_text is not None:
+        status_text = status_text.strip()
+        # Day 6 형식: 라인별 ✅ 체크
+        completed = _checklist_counts(status_text)[0]
+        if completed:
+            return completed, 0
+        # Day 1-5: 텍스트에서 개수 추출
+        return _count_from_status(status_text), 0
+
+    if section is not None:
+        # Day 7-10: "**실행:**" 블록의 ✅ / ⏸️ 줄
+        end = content.find('\n**', section.end())
+        return _checklist_counts(content[section.end():end if end != -1 else len(content)])
+    return 0, 0
+
+
+def scan_day_section(content: str) -> Dict:
+    """
+    Day 섹션 필드를 FIELD_LABEL_RE 한 번의 스캔으로 동시에 수집
+    - 날짜 / AI 제안 수: 형식(우선순위)별 첫 값 → 가장 높은 우선순위
+    - 실행 여부 / 실행 블록 헤더, 새로운 / 반복 제안 헤더: 첫 위치
+    - ✅ / ⏸️ 체크리스트: 선택된 실행 블록 안에서만 셈
+    모든 필드가 가장 높은 우선순위 형식으로 채워지면 나머지는 훑지 않음
+    값은 레이블 바로 뒤에서 고정(anchored) 매치 → 같은 줄 / 다음 줄 값 모두 처리
+    """
+    dates: List[Optional[str]] = [None, None]   # **날짜:** / 날짜:
+    ai: List[Optional[int]] = [None] * len(AI_VALUE_FORMS)
+    status = plain = section = None
+    heads = {}
+
+    for m in FIELD_LABEL_RE.finditer(content):
+        pos = m.start()
+        kind = LABEL_KINDS.get(content[pos])
+        if kind == 'status' and content.startswith('**', m.end() - 2):
+            kind = 'section'  # "실행:**"
+        bold = pos >= 2 and content.startswith('**', pos - 2)
+
+        if kind == 'date':
+            if dates[0] is None:
+                if content.startswith('**', m.end()):
+                    level = 0 if bold else None   # "날짜:**" (앞 별표 없음) - 해당 형식 없음
+                    value_at = m.end() + 2
+                else:
+                    level, value_at = 1, m.end()
+                if level is not None and dates[level] is None:
+                    value = DATE_VALUE_RE.match(content, value_at)
+                    if value:
+                        dates[level] = value.group(1)
+
+        elif kind == 'ai':
+            if ai[0] is None:
+                label = AI_LABEL_RE.match(content, pos)
+                if label:
+                    suffix = label.group(1)
+                    if suffix == ':**':
+                        forms = (0, 3) if bold else ()
+                    elif suffix == '**:':
+                        forms = (1,) if bold else ()
+                    else:
+                        forms = (2, 4)
+                    for form in forms:
+                        if ai[form] is None:
+                            value = AI_VALUE_FORMS[form].match(content, label.end())
+                            if value:
+                                ai[form] = int(value.group(1))
+
+        elif kind == 'status':
+            if plain is None:
+                plain = EXEC_STATUS_PLAIN_RE.match(content, pos)
+            if status is None and bold:
+                status = EXEC_STATUS_RE.match(content, pos - 2)
+
+        elif kind == 'section':
+            if section is None and bold:
+                section = EXEC_SECTION_RE.match(content, pos - 2)
+
+        elif len(heads) < len(SUGGESTION_LISTS):  # 새로운 / 반복 제안
+            line_start = content.rfind('\n', 0, pos) + 1
+            for name, head_re in SUGGESTION_LISTS:
+                if name not in heads:
+                    head = head_re.match(content, line_start)
+                    if head:
+                        heads[name] = head
+
+        if (dates[0] is not None and ai[0] is not None and status is not None
+                and len(heads) == len(SUGGESTION_LISTS)):
+            break
+
+    date = next((d for d in dates if d is not None), None)
+    if date is None:
+        # 레이블 없는 날짜 → 섹션 안 첫 날짜
+        match = DATE_RE.search(content)
+        date = match.group() if match else None
+
+    return {
+        'date': date,
+        'ai_suggestions': next((n for n in ai if n is not None), 0),
+        'execution': _execution_counts(content, status, plain, section),
+        'new_suggestions': _list_items(content, heads['new']) if 'new' in heads else [],
+        'repeated_suggestions': (_list_items(content, heads['repeated'])
+                                 if 'repeated' in heads else []),
+    }
+
+
+def parse_day_section(day_num: str, day_content: str) -> Optional[Dict]:
+    """
+    Day 섹션 본문 하나 → 일별 레코드 (날짜가 없으면 None)
+    형식별 정규식을 섹션 전체에 차례로 돌리던 이전 방식과 같은 결과 (scan_day_section 1회)
+    """
+    fields = scan_day_section(day_content)
+
+    date = fields['date']
+    if not date:
+        print(f"⚠️ Day {day_num}: 날짜를 찾을 수 없음")
+        return None
+
+    completed, pending = fields['execution']
+
+    return {
+        'day': int(day_num),
+        'date': date,
+        'ai_suggestions': fields['ai_suggestions'],
+        'completed': completed,
+        'pending': pending,
+        'executed': completed > 0,
+        'new_suggestions': fields['new_suggestions'],
+        'repeated_suggestions': fields['repeated_suggestions'],
+    }
+
+
+def parse_log_text(content: str) -> List[Dict]:
+    """로그 전체 파싱 (체크포인트 없이)"""
+    daily_data = []
+    for day_num, _, body_start, end in split_day_sections(content):
+        record = parse_day_section(day_num, content[body_start:end])
+        if record is not None:
+            daily_data.append(record)
+    return daily_data
+
+
+# ===== 증분 인덱스 =====
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+class RsiLogIndex:
+    """
+    로그 파싱 결과 저장소 (섹션 순번 → Day 번호, byte offset, 섹션 해시, 레코드)
+    update()는 바뀐 섹션만 파싱, records()는 저장된 레코드를 순서대로 반환
+    """
+
+    def __init__(self, log_path, db_path: Optional[Path] = None):
+        self.log_path = Path(log_path)
+        self.db_path = Path(db_path) if db_path else self.log_path.parent / CACHE_DIR / "rsi_log.sqlite"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+
+        # 스키마/파서/로그 파일이 바뀌었으면 전체 재파싱
+        if (self.meta.get('schema') != str(INDEX_SCHEMA) or
+                self.meta.get('parser') != str(PARSER_VERSION) or
+                self.meta.get('log') != str(self.log_path.resolve())):
+            self.conn.execute("DROP TABLE IF EXISTS sections")
+            self.conn.execute("DELETE FROM meta")
+            self.meta = {'schema': str(INDEX_SCHEMA), 'parser': str(PARSER_VERSION),
+                         'log': str(self.log_path.resolve())}
+
+        # 섹션 1개 = 1행, 날짜가 없는 섹션은 date/record가 NULL
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sections ("
+            "seq INTEGER PRIMARY KEY, day INTEGER, offset INTEGER, hash TEXT, "
+            "date TEXT, ai_suggestions INTEGER, completed INTEGER, pending INTEGER, "
+            "executed INTEGER, record TEXT)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS sections_date ON sections (date)")
+
+        # 마지막 update() 결과: mode (unchanged/incremental/full), parsed, sections
+        self.last_update: Dict = {}
+
+    # ----- 갱신 -----
+
+    def update(self) -> Dict:
+        """로그 변경분 반영 → {'mode', 'parsed', 'sections'}"""
+        st = self.log_path.stat()
+        stamp = f"{st.st_mtime_ns}:{st.st_size}"
+        if self.meta.get('stamp') == stamp:
+            count = self.conn.execute("SELECT COUNT(*) FROM sections").fetchone()[0]
+            self.last_update = {'mode': 'unchanged', 'parsed': 0, 'sections': count}
+            return self.last_update
+
+        raw = self.log_path.read_bytes()
+        result = self._update_tail(raw)
+        if result is None:
+            result = self._update_full(raw)
+
+        # 체크포인트: 마지막 섹션 앞부분의 해시 → 다음 실행에서 이 부분은 디코딩/파싱 생략
+        self.meta['prefix_hash'] = _sha1(raw[:int(self.meta['offset'])])
+        self.meta['stamp'] = stamp
+        self.conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", self.meta.items())
+        self.conn.commit()
+        self.last_update = result
+        return result
+
+    def _update_tail(self, raw: bytes) -> Optional[Dict]:
+        """
+        체크포인트 앞부분이 그대로면 마지막 섹션부터만 디코딩·파싱
+        앞부분이 바뀌었거나 체크포인트가 없으면 None
+        """
+        if 'offset' not in self.meta or int(self.meta['tail_seq']) < 0:
+            return None
+        offset = int(self.meta['offset'])
+        tail_seq = int(self.meta['tail_seq'])
+        if len(raw) < offset or _sha1(raw[:offset]) != self.meta['prefix_hash']:
+            return None
+
+        tail = decode_strict(memoryview(raw)[offset:], self.meta['encoding'])
+        if tail is None:
+            return None
+        sections = split_day_sections(tail)
+        # 마지막 섹션 헤더가 지워졌으면 앞 섹션 경계가 바뀜 → 전체 경로
+        if not sections or sections[0][1] != 0:
+            return None
+
+        parsed = self._store_sections(tail, sections, tail_seq, offset, self.meta['encoding'])
+        return {'mode': 'incremental', 'parsed': parsed, 'sections': tail_seq + len(sections)}
+
+    def _update_full(self, raw: bytes) -> Dict:
+        """전체를 다시 나눈 뒤 해시가 바뀐 섹션만 파싱"""
+        source = decode_buffer(raw, len(raw), max_bytes=0)
+        content = source.text
+        sections = split_day_sections(content)
+
+        _, bom_len = detect_bom(raw)
+        offset = bom_len + len(content[:sections[0][1]].encode(source.encoding)) if sections else 0
+        parsed = self._store_sections(content, sections, 0, offset, source.encoding)
+        return {'mode': 'full', 'parsed': parsed, 'sections': len(sections)}
+
+    def _store_sections(self, content: str, sections: List[Tuple[str, int, int, int]],
+                        first_seq: int, offset: int, encoding: str) -> int:
+        """
+        content의 섹션들을 first_seq부터 저장 (해시가 같으면 파싱 생략)
+        offset = 첫 섹션의 byte offset → 체크포인트 갱신
+        """
+        stored = {seq: h for seq, h in self.conn.execute(
+            "SELECT seq, hash FROM sections WHERE seq >= ?", (first_seq,))}
+
+        parsed = 0
+        seq = first_seq
+        tail_offset = offset
+        tail_hash = ''
+        for seq, (day_num, start, body_start, end) in enumerate(sections, first_seq):
+            data = content[start:end].encode(encoding)
+            digest = _sha1(data)
+            if stored.get(seq) != digest:
+                record = parse_day_section(day_num, content[body_start:end])
+                if record is None:
+                    row = (seq, int(day_num), offset, digest) + (None,) * 6
+                else:
+                    row = (seq, int(day_num), offset, digest, record['date'],
+                           record['ai_suggestions'], record['completed'], record['pending'],
+                           int(record['executed']), json.dumps(record, ensure_ascii=False))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO sections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                parsed += 1
+            elif seq in stored:
+                self.conn.execute("UPDATE sections SET offset = ? WHERE seq = ?", (offset, seq))
+            tail_offset, tail_hash = offset, digest
+            offset += len(data)
+
+        # 사라진 섹션 삭제
+        self.conn.execute("DELETE FROM sections WHERE seq >= ?", (first_seq + len(sections),))
+
+        if sections:
+            tail_seq = first_seq + len(sections) - 1
+            last_day = sections[-1][0]
+        else:
+            tail_seq, last_day = first_seq - 1, ''
+            tail_offset = offset
+        self.meta.update({
+            'encoding': encoding,
+            'offset': str(tail_offset),
+            'tail_seq': str(tail_seq),
+            'last_day': last_day,
+            'tail_hash': tail_hash,
+        })
+        return parsed
+
+    # ----- 조회 -----
+
+    @staticmethod
+    def _range(start: Optional[date], end: Optional[date]) -> Tuple[str, str]:
+        # ISO 날짜 문자열은 사전순 = 날짜순 → date 인덱스로 범위 검색
+        return (start.isoformat() if start else '0000-00-00',
+                end.isoformat() if end else '9999-99-99')
+
+    def records(self, start: Optional[date] = None, end: Optional[date] = None) -> List[Dict]:
+        """start~end (포함) 일별 레코드 (로그 순서, 날짜 없는 섹션 제외)"""
+        return [json.loads(record) for (record,) in self.conn.execute(
+            "SELECT record FROM sections WHERE date BETWEEN ? AND ? ORDER BY seq",
+            self._range(start, end))]
+
+    def week(self, year: int, week: int) -> List[Dict]:
+        """ISO 주차 (월~일) 레코드"""
+        monday = date.fromisocalendar(year, week, 1)
+        return self.records(monday, monday + timedelta(days=6))
+
+    def month(self, year: int, month: int) -> List[Dict]:
+        first = date(year, month, 1)
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return self.records(first, last)
+
+    def totals(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict:
+        """start~end 합계 (레코드를 읽지 않고 집계 쿼리로)"""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(ai_suggestions), 0), COALESCE(SUM(completed), 0), "
+            "COALESCE(SUM(pending), 0), COALESCE(SUM(executed), 0), MIN(date), MAX(date) "
+            "FROM sections WHERE date BETWEEN ? AND ?", self._range(start, end)).fetchone()
+        keys = ('days', 'ai_suggestions', 'completed', 'pending', 'executed_days',
+                'first_date', 'last_date')
+        return dict(zip(keys, row))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
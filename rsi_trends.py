@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+RSI Trend Analytics
+전체 일별 기록 → 이동 평균, 제안 수 회귀 기울기, 완료율 EWMA, 주간(전주 대비) 변화
+NumPy가 있으면 배열 연산 (없으면 순수 파이썬, 같은 결과)
+결과는 로그 해시 + 기준일별로 .rsi_cache/rsi_trends.json에 캐시
+"""
+
+import json
+import math
+from dataclasses import dataclass, asdict
+from datetime import date
+from pathlib import Path
+from typing import List, Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:  # 선택적 의존성
+    np = None
+
+from rsi_log import PARSER_VERSION
+
+TRENDS_VERSION = 1
+TRENDS_CACHE_FILE = "rsi_trends.json"
+
+ROLLING_WINDOW = 7     # 이동 평균 (기록된 날 기준)
+EWMA_ALPHA = 0.3       # 완료율 EWMA 가중치 (최근 값)
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+@dataclass
+class TrendMetrics:
+    dates: List[str]                   # 날짜순 일별
+    suggestions: List[int]
+    completion_rate: List[float]       # 완료 / 제안 (제안 0개면 0, 최대 1)
+    rolling_suggestions: List[float]   # ROLLING_WINDOW일 이동 평균 (앞쪽은 가진 만큼)
+    completion_ewma: List[float]
+    slope: float                       # 제안 수 회귀 기울기 (개/일, 날짜 간격 반영)
+    intercept: float                   # 첫 날 기준 추세선 절편
+    weekly: List[Dict]                 # ISO 주차별 합계 + 전주 대비 (전주 기록이 없으면 None)
+    window: int = ROLLING_WINDOW
+    alpha: float = EWMA_ALPHA
+
+
+# ===== 순수 파이썬 =====
+
+def _rolling_mean_python(values: List[float], window: int) -> List[float]:
+    out = []
+    total = 0.0
+    for i, v in enumerate(values):
+        total += v
+        if i >= window:
+            total -= values[i - window]
+        out.append(total / min(i + 1, window))
+    return out
+
+
+def _linear_fit_python(x: List[float], y: List[float]):
+    n = len(x)
+    if n < 2:
+        return 0.0, float(y[0]) if y else 0.0
+    mx = sum(x) / n
+    my = sum(y) / n
+    var = sum((a - mx) ** 2 for a in x)
+    if not var:
+        return 0.0, my
+    slope = sum((a - mx) * (b - my) for a, b in zip(x, y)) / var
+    return slope, my - slope * mx
+
+
+def _ewma_python(values: List[float], alpha: float) -> List[float]:
+    out = []
+    current = None
+    for v in values:
+        current = v if current is None else alpha * v + (1 - alpha) * current
+        out.append(current)
+    return out
+
+
+# ===== NumPy =====
+
+def _rolling_mean_numpy(values: List[float], window: int) -> List[float]:
+    a = np.asarray(values, dtype=np.float64)
+    csum = np.cumsum(a)
+    csum[window:] = csum[window:] - csum[:-window]
+    counts = np.minimum(np.arange(1, len(a) + 1), window)
+    return (csum / counts).tolist()
+
+
+def _linear_fit_numpy(x: List[float], y: List[float]):
+    if len(x) < 2:
+        return 0.0, float(y[0]) if y else 0.0
+    xa = np.asarray(x, dtype=np.float64)
+    ya = np.asarray(y, dtype=np.float64)
+    dx = xa - xa.mean()
+    var = float(dx @ dx)
+    if not var:
+        return 0.0, float(ya.mean())
+    slope = float(dx @ (ya - ya.mean())) / var
+    return slope, float(ya.mean()) - slope * float(xa.mean())
+
+
+def _ewma_numpy(values: List[float], alpha: float) -> List[float]:
+    """
+    e_j = (1-α)^(j+1) e_prev + Σ α (1-α)^(j-k) r_k 를 블록 단위로 벡터화
+    블록 크기는 (1-α)^-B가 float 범위를 넘지 않게 제한
+    """
+    a = np.asarray(values, dtype=np.float64)
+    if not len(a) or alpha >= 1.0:
+        return a.tolist()
+    decay = 1.0 - alpha
+    block = int(min(1024, max(1, 250 / -math.log10(decay))))
+
+    out = np.empty_like(a)
+    prev = a[0]           # e_prev = r_0 → e_0 = (1-α) r_0 + α r_0 = r_0
+    start = 0
+    while start < len(a):
+        chunk = a[start:start + block]
+        k = np.arange(1, len(chunk) + 1)
+        grow = decay ** -k                     # (1-α)^-k
+        acc = np.cumsum(alpha * chunk * grow)  # Σ α r_k (1-α)^-k
+        out[start:start + len(chunk)] = (prev + acc) / grow
+        prev = out[start + len(chunk) - 1]
+        start += len(chunk)
+    return out.tolist()
+
+
+def _weekly(dates: List[str], suggestions: List[int], completed: List[int]) -> List[Dict]:
+    """ISO 주차별 합계 + 전주 대비 (바로 앞 달력 주의 기록이 없으면 None)"""
+    weeks: Dict[tuple, Dict] = {}
+    for d, s, c in zip(dates, suggestions, completed):
+        iso_year, week_num, _ = date.fromisoformat(d).isocalendar()
+        week = weeks.setdefault((iso_year, week_num), {
+            'week': f"{iso_year}-W{week_num:02d}", 'days': 0, 'suggestions': 0, 'completed': 0})
+        week['days'] += 1
+        week['suggestions'] += s
+        week['completed'] += c
+
+    out = []
+    for key in sorted(weeks):
+        week = weeks[key]
+        monday = date.fromisocalendar(key[0], key[1], 1)
+        prev_key = tuple(date.fromordinal(monday.toordinal() - 7).isocalendar()[:2])
+        prev = weeks.get(prev_key)
+        week['suggestions_delta'] = week['suggestions'] - prev['suggestions'] if prev else None
+        week['completed_delta'] = week['completed'] - prev['completed'] if prev else None
+        out.append(week)
+    return out
+
+
+def compute_trends(records: List[Dict], window: int = ROLLING_WINDOW,
+                   alpha: float = EWMA_ALPHA) -> Optional[TrendMetrics]:
+    """일별 레코드 (순서 무관) → TrendMetrics, 기록이 없으면 None"""
+    if not records:
+        return None
+    ordered = sorted(records, key=lambda r: (r['date'], r['day']))
+    dates = [r['date'] for r in ordered]
+    suggestions = [r['ai_suggestions'] for r in ordered]
+    completed = [r['completed'] for r in ordered]
+    rates = [min(c / s, 1.0) if s else 0.0 for s, c in zip(suggestions, completed)]
+
+    first = date.fromisoformat(dates[0]).toordinal()
+    offsets = [date.fromisoformat(d).toordinal() - first for d in dates]
+
+    if np is not None:
+        rolling = _rolling_mean_numpy(suggestions, window)
+        slope, intercept = _linear_fit_numpy(offsets, suggestions)
+        ewma = _ewma_numpy(rates, alpha)
+    else:
+        rolling = _rolling_mean_python(suggestions, window)
+        slope, intercept = _linear_fit_python(offsets, suggestions)
+        ewma = _ewma_python(rates, alpha)
+
+    return TrendMetrics(dates, suggestions, rates, rolling, ewma, slope, intercept,
+                        _weekly(dates, suggestions, completed), window, alpha)
+
+
+def sparkline(values: List[float]) -> str:
+    """값 목록 → ▁▂▃▄▅▆▇█ 추세선"""
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_CHARS[0] * len(values)
+    scale = (len(SPARK_CHARS) - 1) / (high - low)
+    return ''.join(SPARK_CHARS[int(round((v - low) * scale))] for v in values)
+
+
+class TrendCache:
+    """
+    로그 해시 + 기준일 → TrendMetrics
+    로그가 바뀌면 (해시가 다르면) 이전 항목은 저장할 때 버림
+    """
+
+    def __init__(self, cache_path: Path, log_hash: str):
+        self.cache_path = Path(cache_path)
+        self.prefix = f"{TRENDS_VERSION}:{PARSER_VERSION}:{log_hash}:"
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if self.cache_path.exists():
+            try:
+                cached = json.loads(self.cache_path.read_text(encoding='utf-8'))
+                self._entries = {k: v for k, v in cached.items() if k.startswith(self.prefix)}
+                self._dirty = len(self._entries) != len(cached)
+            except (OSError, ValueError):
+                pass  # 손상된 캐시 → 다시 계산
+
+    def trends(self, records: List[Dict], until: Optional[date] = None) -> Optional[TrendMetrics]:
+        """until까지의 기록 추세 (until이 없으면 전체)"""
+        key = self.prefix + (until.isoformat() if until else 'all')
+        cached = self._entries.get(key)
+        if cached is not None:
+            return TrendMetrics(**cached)
+
+        if until is not None:
+            records = [r for r in records if r['date'] <= until.isoformat()]
+        result = compute_trends(records)
+        if result is not None:
+            self._entries[key] = asdict(result)
+            self._dirty = True
+        return result
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self._entries, ensure_ascii=False),
+                                   encoding='utf-8')
+        self._dirty = False
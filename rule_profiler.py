@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Rule Profiler
+규칙별 누적 시간, 호출 수, 처리 바이트, 가장 느린 파일 N개 기록
+--profile일 때만 생성 → 꺼져 있으면 RuleEngine은 측정 코드를 거치지 않음
+"""
+
+import json
+import heapq
+from pathlib import Path
+from typing import List, Dict, Iterator, Tuple
+
+
+class RuleStats:
+    __slots__ = ('calls', 'seconds', 'bytes', 'slowest')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.slowest: List[Tuple[float, str]] = []  # (초, 파일명) min-heap
+
+
+class RuleProfiler:
+    """규칙 (+ read/parse 단계) 단위 실행 통계"""
+
+    def __init__(self, top_n: int = 5):
+        self.top_n = top_n
+        self.stats: Dict[str, RuleStats] = {}
+
+    def record(self, name: str, seconds: float, nbytes: int, file_name: str):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = RuleStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.bytes += nbytes
+
+        entry = (seconds, file_name)
+        if len(stats.slowest) < self.top_n:
+            heapq.heappush(stats.slowest, entry)
+        elif entry > stats.slowest[0]:
+            heapq.heapreplace(stats.slowest, entry)
+
+    def ranked(self) -> List[Tuple[str, RuleStats]]:
+        """누적 시간이 긴 순서"""
+        return sorted(self.stats.items(), key=lambda kv: -kv[1].seconds)
+
+    def as_dict(self) -> Dict:
+        rules = {}
+        for name, s in self.ranked():
+            rules[name] = {
+                'calls': s.calls,
+                'total_ms': round(s.seconds * 1000, 3),
+                'mean_us': round(s.seconds / s.calls * 1e6, 1) if s.calls else 0.0,
+                'bytes': s.bytes,
+                'mb_per_sec': round(s.bytes / s.seconds / 1e6, 1) if s.seconds else None,
+                'slowest': [{'file': f, 'ms': round(sec * 1000, 3)}
+                            for sec, f in sorted(s.slowest, reverse=True)],
+            }
+        return {'top_n': self.top_n, 'rules': rules}
+
+    def dump(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False, indent=2)
+
+    def iter_report(self) -> Iterator[str]:
+        """보고서용 Performance 섹션"""
+        total = sum(s.seconds for s in self.stats.values()) or 1.0
+
+        yield "\n---\n\n## ⏱️ Performance\n\n"
+        yield "| Stage | Calls | Total (ms) | Share | Mean (µs) | MB/s |\n"
+        yield "|---|---:|---:|---:|---:|---:|\n"
+        for name, s in self.ranked():
+            mean = s.seconds / s.calls * 1e6 if s.calls else 0.0
+            mbps = f"{s.bytes / s.seconds / 1e6:.1f}" if s.seconds else "-"
+            yield (f"| {name} | {s.calls} | {s.seconds * 1000:.1f} | "
+                   f"{s.seconds / total * 100:.1f}% | {mean:.0f} | {mbps} |\n")
+
+        # top_n은 단계별 파일 수 - 단계는 전부
+        yield f"\n### 🐢 Slowest Files per Stage (Top {self.top_n})\n\n"
+        for name, s in self.ranked():
+            files = ', '.join(f"{f} ({sec * 1000:.1f} ms)"
+                              for sec, f in sorted(s.slowest, reverse=True))
+            yield f"- **{name}:** {files}\n"
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Vault File Watcher
+.md 파일 변경 감지 (watchdog 사용, 없으면 mtime 폴링) + 저장 폭주 debounce
+"""
+
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # 선택적 의존성
+    FileSystemEventHandler = object
+    Observer = None
+
+IGNORE_DIRS = {'.git', '.obsidian', '.rsi_cache', '.trash', 'node_modules'}
+
+
+def _ignored(root: Path, path: Path) -> bool:
+    try:
+        parts = path.relative_to(root).parts[:-1]
+    except ValueError:
+        return True
+    return any(part in IGNORE_DIRS for part in parts)
+
+
+def scan_vault(root: Path, suffix: str = '.md') -> Dict[str, Tuple[int, int]]:
+    """경로 → (mtime_ns, size) 스냅샷 (IGNORE_DIRS 제외)"""
+    snapshot = {}
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        st = entry.stat()
+                        snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+    return snapshot
+
+
+class _EventHandler(FileSystemEventHandler):
+    """watchdog 이벤트 → 경로 큐"""
+
+    def __init__(self, watcher: 'VaultWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        self.watcher._push(event.src_path)
+        dest = getattr(event, 'dest_path', None)
+        if dest:
+            self.watcher._push(dest)
+
+
+class VaultWatcher:
+    """
+    vault 내 .md 파일 변경 감시
+    batches()는 debounce 시간 동안 조용해지면 (변경/생성, 삭제) 묶음을 돌려줌
+    """
+
+    def __init__(self, root, suffix: str = '.md', debounce: float = 0.3,
+                 poll_interval: float = 0.25, use_polling: bool = False):
+        self.root = Path(root)
+        self.suffix = suffix
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_polling = use_polling or Observer is None
+
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._observer = None
+        self._poller = None
+
+    @property
+    def backend(self) -> str:
+        return "polling" if self.use_polling else "watchdog"
+
+    def _push(self, path: str):
+        if path.endswith(self.suffix):
+            self._queue.put(Path(path))
+
+    def start(self):
+        if self.use_polling:
+            self._poller = threading.Thread(target=self._poll, daemon=True)
+            self._poller.start()
+        else:
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), str(self.root), recursive=True)
+            self._observer.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+        if self._poller:
+            self._poller.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _poll(self):
+        """폴링 백엔드: 스냅샷 비교로 바뀐 경로만 큐에 넣음"""
+        previous = scan_vault(self.root, self.suffix)
+        while not self._stop.wait(self.poll_interval):
+            current = scan_vault(self.root, self.suffix)
+            for path, stat in current.items():
+                if previous.get(path) != stat:
+                    self._queue.put(Path(path))
+            for path in previous.keys() - current.keys():
+                self._queue.put(Path(path))
+            previous = current
+
+    def _next_event(self, timeout: Optional[float]) -> Optional[Path]:
+        """다음 이벤트 대기 (짧게 끊어서 기다림 → Windows에서도 Ctrl+C 가능)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._stop.is_set():
+            wait = 0.5 if deadline is None else min(0.5, deadline - time.monotonic())
+            if wait <= 0:
+                return None
+            try:
+                return self._queue.get(timeout=wait)
+            except queue.Empty:
+                continue
+        return None
+
+    def batches(self, timeout: Optional[float] = None,
+                max_wait: Optional[float] = None) -> Iterator[Tuple[Set[Path], Set[Path]]]:
+        """
+        (변경/생성된 파일, 삭제된 파일) 묶음 생성
+        첫 이벤트 후 debounce 동안 추가 이벤트가 없을 때까지 모아서 한 번에 전달
+        max_wait: 계속 저장 중이어도 첫 이벤트 후 이 시간이 지나면 전달
+        timeout 동안 이벤트가 없으면 종료
+        """
+        while True:
+            first = self._next_event(timeout)
+            if first is None:
+                return
+            pending = {first}
+            started = time.monotonic()
+
+            # 저장 폭주 흡수
+            while True:
+                wait = self.debounce
+                if max_wait is not None:
+                    wait = min(wait, max_wait - (time.monotonic() - started))
+                    if wait <= 0:
+                        break
+                try:
+                    pending.add(self._queue.get(timeout=wait))
+                except queue.Empty:
+                    break
+
+            changed, deleted = set(), set()
+            for path in pending:
+                if _ignored(self.root, path):
+                    continue
+                (changed if path.exists() else deleted).add(path)
+
+            if changed or deleted:
+                yield changed, deleted